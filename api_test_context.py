@@ -1,24 +1,40 @@
+import threading
 import uuid
 
 
 class APITestContext:
+    """
+    The request and response an APIBase last handled.
+
+    current_request and current_response are kept per thread, so when one
+    APIBase is shared by a thread pool (PaginatedFetcher, LatencyBenchmark)
+    each thread sees its own request paired with its own response.
+    """
     def __init__(self):
         self.session_id = str(uuid.uuid4())  # Generate a unique ID for each test run
-        self.current_request = None
-        self.current_response = None
+        self._local = threading.local()
+
+    @property
+    def current_request(self):
+        return getattr(self._local, "request", None)
+
+    @property
+    def current_response(self):
+        return getattr(self._local, "response", None)
 
     def set_current_request(self, method, url, headers, params=None, body=None):
-        self.current_request = {
+        self._local.request = {
             'method': method,
             'url': url,
             'headers': headers,
             "params": params if params is not None else {},
             'body': body if body is not None else {} 
         }
+        self._local.response = None
 
     def set_current_response(self, status_code, headers, body):
-        self.current_response = {
+        self._local.response = {
             'status_code': status_code,
             'headers': headers,
             'body': body
-        }
\ No newline at end of file
+        }
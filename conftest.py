@@ -1,4 +1,5 @@
 # conftest.py (Playwright version)
+import html
 import os
 import pytest
 import requests
@@ -6,13 +7,29 @@ import time
 import uuid
 import platform
 import pytest
+from dataclasses import asdict
 from datetime import datetime
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 # from fixtures.admin_menu.installations_fixtures import installations_pagination_test_data
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
-from typing import Dict, List, Tuple, Generator, Any
-from utilities.utils import logger, start_test_capture, end_test_capture, get_browser_name
-from utilities.config import PAGE_SIZE
+from typing import Dict, List, Optional, Tuple, Generator, Any
+from utilities.utils import (
+    logger, start_test_capture, end_test_capture, release_test_logs, get_log_capture_stats, get_browser_name,
+    flush_logging, enable_jsonl_sink, set_log_context
+)
+from utilities.config import (
+    PAGE_SIZE, RESOURCE_BLOCK_PROFILE, API_MODE, LATENCY_BENCHMARK_REQUESTS, LATENCY_BENCHMARK_CONCURRENCY,
+    PERF_REPORT_PATH, PHASE_TIMING_REPORT, LOG_JSONL, LOG_JSONL_DIR
+)
+from utilities.http_session import get_session, close_all_sessions
+from utilities.browser_server import BrowserServer, start_browser_server, stop_browser_server, process_tree_rss_mb
+from utilities.network_profile import BLOCK_PROFILES, ResourceBlocker
+from utilities.asset_cache import StaticAssetCache
+from utilities.api_cassette import API_MODES, CassetteStore
+from utilities.mock_api_server import MockAPIControl, MockAPIServer, mock_credentials_env
+from utilities.perf_baseline import EndpointTimings, RunComparison, record_and_compare
+from utilities.phase_timing import PHASES, PhaseTimer, activity_seconds, build_report, write_report
 
 # Load and define environmental variables
 load_dotenv()
@@ -32,6 +49,35 @@ api_token = os.getenv("API_TOKEN")
 organization_id = os.getenv("TEST_ORGANIZATION_ID", "4ffbb8fe-d8b4-49d9-982d-5617856c9cce")
 video_catalogue_id = os.getenv("TEST_VIDEO_CATALOGUE_ID", "b05980db-5833-43bd-23ca-08dc63b567ef")
 
+SUPPORTED_BROWSERS = ("chromium", "firefox", "webkit")
+
+# --browser-parametrize: browser -> outcome -> count, filled by pytest_runtest_logreport
+BROWSER_RESULTS: Dict[str, Dict[str, int]] = {}
+
+# --browser-server: servers started by the controller in pytest_configure_node
+BROWSER_SERVERS: Dict[str, BrowserServer] = {}
+# Browser startup cost per process ('master', 'gw0', ... or '<type> server'), for pytest_terminal_summary
+BROWSER_STARTUP: Dict[str, Dict[str, Any]] = {}
+# --block-resources: nodeid -> (requests blocked, known bytes saved), filled by pytest_runtest_logreport
+BLOCKED_RESOURCES: Dict[str, Tuple[int, int]] = {}
+# Static asset cache totals for the whole run, filled by pytest_runtest_logreport
+ASSET_CACHE_TOTALS: Dict[str, int] = {"hits": 0, "misses": 0, "bytes": 0}
+# --api-mode record/replay counters per process ('master', 'gw0', ...), for pytest_terminal_summary
+API_CASSETTE_STATS: Dict[str, Dict[str, int]] = {}
+# --mock-api: the local API stand-in started by the controller (or the only process) in pytest_configure
+MOCK_API_SERVERS: List[MockAPIServer] = []
+# Performance baseline: (kind, name) -> seconds, filled by pytest_runtest_logreport and pytest_testnodedown
+PERF_SAMPLES: Dict[Tuple[str, str], List[float]] = {}
+# The run's comparison with its rolling baseline, set in pytest_sessionfinish for the summaries
+PERF_COMPARISON: List[RunComparison] = []
+RUN_STARTED_AT = time.time()
+# --phase-timing: nodeid -> phase durations and PhaseTimer breakdown, filled by pytest_runtest_logreport
+PHASE_TIMINGS: Dict[str, Dict[str, Any]] = {}
+# Per-test log capture memory per process ('master', 'gw0', ...), for pytest_terminal_summary
+LOG_CAPTURE_STATS: Dict[str, Dict[str, int]] = {}
+# --log-jsonl: this run's directory of per-worker .jsonl files, set in pytest_configure
+log_jsonl_dir: Optional[str] = None
+
 # Define pytest addoption for Command Line running of Pytest with options
 def pytest_addoption(parser):
     """
@@ -70,6 +116,141 @@ def pytest_addoption(parser):
         default=SYS_ADMIN_PASS,
         help="Password for login. Default is the ADMIN_PASS value from .env file."
     )
+    parser.addoption(
+        "--browser-parametrize",
+        action="store_true",
+        default=False,
+        help="Run each UI test once per selected browser as a separate test item "
+             "(e.g. test_x[chromium], test_x[firefox]) instead of looping over every "
+             "browser inside one test. Lets xdist run the browsers concurrently."
+    )
+    parser.addoption(
+        "--block-resources",
+        action="store",
+        default=RESOURCE_BLOCK_PROFILE,
+        choices=list(BLOCK_PROFILES),
+        help="Resource blocking profile for logged-in UI contexts (utilities/network_profile.py): "
+             "'media' stubs images and aborts media and fonts, 'strict' aborts all three, 'none' "
+             "blocks nothing. Tests marked needs_media always use 'none'. Default is "
+             f"{RESOURCE_BLOCK_PROFILE}."
+    )
+    parser.addoption(
+        "--api-mode",
+        action="store",
+        default=API_MODE,
+        choices=list(API_MODES),
+        help="How APIBase sends requests (utilities/api_cassette.py): 'live' calls the API, "
+             "'record' calls it and saves every response to the cassette store, 'replay' "
+             f"serves responses from the store without any network access. Default is {API_MODE}."
+    )
+    parser.addoption(
+        "--latency-benchmark",
+        action="store_true",
+        default=False,
+        help="Run test_api_connection_latency_benchmark: warm, concurrent requests per "
+             "endpoint with percentile thresholds and a JSON artefact "
+             "(tests/api/latency_benchmark.py). Skipped otherwise."
+    )
+    parser.addoption(
+        "--benchmark-requests",
+        action="store",
+        type=int,
+        default=LATENCY_BENCHMARK_REQUESTS,
+        help=f"Measured requests per endpoint in --latency-benchmark mode. Default is {LATENCY_BENCHMARK_REQUESTS}."
+    )
+    parser.addoption(
+        "--benchmark-concurrency",
+        action="store",
+        type=int,
+        default=LATENCY_BENCHMARK_CONCURRENCY,
+        help=f"Requests in flight at once in --latency-benchmark mode. Default is {LATENCY_BENCHMARK_CONCURRENCY}."
+    )
+    parser.addoption(
+        "--mock-api",
+        action="store_true",
+        default=False,
+        help="Run the API tests against a local in-memory stand-in for the WildXR API "
+             "(utilities/mock_api_server.py) instead of API_BASE_URL. Latency and error "
+             "injection are set with the MOCK_API_* environment variables."
+    )
+    parser.addoption(
+        "--log-jsonl",
+        action="store_true",
+        default=LOG_JSONL,
+        help="Also write the logs as JSON lines, one file per xdist worker in "
+             "LOG_JSONL_DIR/<run>/, with the test nodeid, worker ID, browser type and "
+             "elapsed milliseconds on every record. Merge them with merge_logs.py."
+    )
+    parser.addoption(
+        "--phase-timing",
+        action="store_true",
+        default=False,
+        help="Time every test's setup/call/teardown, each fixture setup and teardown, "
+             "and the HTTP requests and Playwright navigations in each phase "
+             "(utilities/phase_timing.py). Prints the slowest fixtures and writes the "
+             "per-test breakdown to PHASE_TIMING_REPORT."
+    )
+    parser.addoption(
+        "--no-perf-baseline",
+        action="store_true",
+        default=False,
+        help="Do not record this run's endpoint and test timings in the performance "
+             "baseline store or compare them with earlier runs (utilities/perf_baseline.py)."
+    )
+    parser.addoption(
+        "--no-asset-cache",
+        action="store_true",
+        default=False,
+        help="Do not serve the web portal's hashed JS/CSS bundles from the on-disk "
+             "cache (utilities/asset_cache.py); fetch them from the server in every context."
+    )
+    parser.addoption(
+        "--no-auth-cache",
+        action="store_true",
+        default=False,
+        help="Log in through the UI even if a valid cached storage state exists "
+             "(utilities/storage_state_cache.py). The new state replaces the cached one."
+    )
+    parser.addoption(
+        "--browser-server",
+        action="store_true",
+        default=False,
+        help="Under xdist, start one shared browser server per browser type in the "
+             "controller and have every worker connect to it instead of launching "
+             "its own browser."
+    )
+
+
+def pytest_configure(config):
+    """
+    Set the --api-mode for this process (controller and every xdist worker).
+
+    In replay mode the token caches are filled with a placeholder token, so
+    neither pytest_configure_node nor APIBase authenticates over the network.
+
+    With --mock-api, API_BASE_URL is pointed at the local API stand-in first.
+    With --phase-timing, PhaseTimer starts collecting in this process.
+    With --log-jsonl, this process starts its JSON-lines log file; the
+    controller picks the run's directory and workers get it through workerinput.
+    """
+    global log_jsonl_dir
+    if config.getoption("--mock-api"):
+        _use_mock_api(config)
+    if config.getoption("--log-jsonl"):
+        if hasattr(config, "workerinput"):
+            log_jsonl_dir = config.workerinput["log_jsonl_dir"]
+            enable_jsonl_sink(log_jsonl_dir, config.workerinput["workerid"])
+        else:
+            log_jsonl_dir = os.path.join(LOG_JSONL_DIR, f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{os.getpid()}")
+            enable_jsonl_sink(log_jsonl_dir, "master")
+    if config.getoption("--phase-timing"):
+        PhaseTimer().enable()
+
+    mode = config.getoption("--api-mode")
+    CassetteStore().configure(mode)
+    if mode == "replay":
+        from utilities.api_cassette import seed_replay_tokens
+        seed_replay_tokens()
 
 
 def pytest_configure_node(node):
@@ -82,16 +263,141 @@ def pytest_configure_node(node):
     workers are being configured. The same token string is injected into each
     worker's workerinput dictionary and later read by _seed_token_cache.
 
+    The org-admin personas (utilities/auth.py PERSONAS) are authenticated
+    concurrently on the first call and cached in the controller's TokenPool;
+    every worker receives the same username -> token map and seeds its own
+    pool from it in _seed_token_cache.
+
+    With --browser-server, the first call also starts one browser server per
+    selected browser type, and every worker receives the websocket endpoints
+    to connect() to in browser_instances.
+
+    With --mock-api, every worker receives the URL of the controller's mock
+    API, so all workers share one in-memory store. With --log-jsonl, every
+    worker receives the run's JSON-lines directory.
+
     In a serial run (no xdist) this hook never fires — no impact.
     """
-    from utilities.auth import get_auth_token
+    if MOCK_API_SERVERS:
+        node.workerinput["mock_api_url"] = MOCK_API_SERVERS[0].api_url
+    if log_jsonl_dir:
+        node.workerinput["log_jsonl_dir"] = log_jsonl_dir
+
+    from utilities.auth import get_auth_token, prefetch_persona_tokens
+    node.workerinput["shared_persona_tokens"] = prefetch_persona_tokens()
     node.workerinput["shared_sysadmin_token"] = get_auth_token()
 
+    if node.config.getoption("--browser-server"):
+        if not BROWSER_SERVERS:
+            _start_browser_servers(node.config)
+        node.workerinput["browser_ws_endpoints"] = {
+            browser_type: server.ws_endpoint for browser_type, server in BROWSER_SERVERS.items()
+        }
+
+
+def _use_mock_api(config):
+    """
+    Point API_BASE_URL at the --mock-api server for this process.
+
+    The controller (or a serial run) starts the server; xdist workers use the
+    controller's, passed through workerinput. This runs in pytest_configure,
+    before utilities/auth.py and the tests/api modules are imported, because
+    they read API_BASE_URL at import time. conftest's own api_url and the
+    TEST_ENTITY_CONFIGURATIONS endpoints were built at import, so they are
+    rewritten here. Unset credentials get mock defaults, so the system admin
+    and every persona can log in to the mock.
+    """
+    global api_url
+    for name, value in mock_credentials_env().items():
+        os.environ.setdefault(name, value)
+
+    if hasattr(config, "workerinput"):
+        mock_url = config.workerinput["mock_api_url"]
+    else:
+        server = MockAPIServer().start()
+        MOCK_API_SERVERS.append(server)
+        mock_url = server.api_url
+
+    os.environ["API_BASE_URL"] = mock_url
+    for settings in TEST_ENTITY_CONFIGURATIONS.values():
+        for key, value in settings.items():
+            if "_endpoint" in key:
+                settings[key] = value.replace(api_url, mock_url, 1)
+    api_url = mock_url
+
+
+@pytest.fixture(scope="session")
+def mock_api(request) -> MockAPIControl:
+    """
+    Control client for the --mock-api server (latency, error injection, stats,
+    reset). Tests using it are skipped without --mock-api.
+    """
+    if not request.config.getoption("--mock-api"):
+        pytest.skip("Needs --mock-api")
+    return MockAPIControl(api_url)
+
+
+@pytest.fixture(scope="function")
+def mock_api_faults(mock_api) -> Generator[MockAPIControl, None, None]:
+    """
+    mock_api for a test that injects latency or errors; the configured
+    MOCK_API_* fault settings are restored when the test ends.
+    """
+    yield mock_api
+    mock_api.clear_faults()
+
+
+def _headless(config) -> bool:
+    """The --headless option as a boolean."""
+    headless = config.getoption("--headless")
+    if isinstance(headless, str):
+        headless = headless.lower() == "true"
+    return headless
+
+
+def _start_browser_servers(config):
+    """Start one shared browser server per selected browser type (controller only)."""
+    headless = _headless(config)
+    for browser_type in get_selected_browser_types(config):
+        server = start_browser_server(browser_type, headless=headless)
+        BROWSER_SERVERS[browser_type] = server
+        BROWSER_STARTUP[f"{browser_type} server"] = {"browsers": 1, "seconds": server.launch_seconds}
+
+
+def _stop_browser_servers():
+    """Record each server's memory while its browser is still open, then stop it."""
+    for browser_type, server in BROWSER_SERVERS.items():
+        BROWSER_STARTUP[f"{browser_type} server"]["rss_mb"] = server.rss_mb
+        stop_browser_server(server)
+    BROWSER_SERVERS.clear()
+
+
+def pytest_testnodedown(node, error):
+    """
+    pytest-xdist hook: fires in the controller when a worker finishes.
+
+    Collects the browser startup time and memory the worker measured in
+    browser_instances, its --api-mode cassette counters, its endpoint
+    timings for the performance baseline and its log capture memory stats
+    (all passed back through workeroutput).
+    """
+    workeroutput = getattr(node, "workeroutput", {})
+    startup = workeroutput.get("browser_startup")
+    if startup:
+        BROWSER_STARTUP[node.gateway.id] = startup
+    if workeroutput.get("api_cassette"):
+        API_CASSETTE_STATS[node.gateway.id] = workeroutput["api_cassette"]
+    for name, samples in (workeroutput.get("perf_endpoints") or {}).items():
+        PERF_SAMPLES.setdefault(("endpoint", name), []).extend(samples)
+    if workeroutput.get("log_capture"):
+        LOG_CAPTURE_STATS[node.gateway.id] = workeroutput["log_capture"]
+
 
 @pytest.fixture(scope="session", autouse=True)
 def _seed_token_cache(request):
     """
-    Pre-seed the worker's TokenCache from the token injected by pytest_configure_node.
+    Pre-seed the worker's TokenCache and TokenPool from the tokens injected by
+    pytest_configure_node.
 
     Runs once per worker session (scope="session", autouse=True) before any
     test in that worker executes. When each APIBase() is instantiated and calls
@@ -104,13 +410,138 @@ def _seed_token_cache(request):
 
     In a parallel run (-n N): each worker pre-seeds its TokenCache here.
     Combined with pytest_configure_node, the net result is exactly 1
-    authentication network call for the entire test run regardless of -n count.
+    authentication network call for the entire test run regardless of -n count
+    — until the token nears expiry, when each worker refreshes its own copy.
     """
     if hasattr(request.config, "workerinput"):
         token = request.config.workerinput.get("shared_sysadmin_token")
         if token:
             from utilities.auth import TokenCache
-            TokenCache()._token = token
+            # set_token decodes the JWT exp claim and schedules this worker's
+            # own background refresh ahead of expiry.
+            TokenCache().set_token(token)
+
+        persona_tokens = request.config.workerinput.get("shared_persona_tokens") or {}
+        if persona_tokens:
+            from utilities.auth import TokenPool
+            for username, persona_token in persona_tokens.items():
+                TokenPool().set_token(username, persona_token)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configure_run_state(request, tmp_path_factory):
+    """
+    Point RunState (utilities/run_state.py) at a directory shared by every
+    worker in this run, so run-wide setup such as the delete endpoint check,
+    orphaned record cleanup and seeded pool top-up happens in one worker only.
+
+    Under xdist each worker's basetemp is <run temp dir>/popen-gwN, so the
+    parent directory is shared by all workers of the run and unique to it. In a
+    serial run the session's own basetemp is used.
+    """
+    from utilities.run_state import RunState
+    if hasattr(request.config, "workerinput"):
+        run_dir = tmp_path_factory.getbasetemp().parent / "run_state"
+        worker_id = request.config.workerinput["workerid"]
+    else:
+        run_dir = tmp_path_factory.getbasetemp() / "run_state"
+        worker_id = "master"
+    RunState().configure(str(run_dir), worker_id)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Close the pooled HTTP sessions (utilities/http_session.py) and stop the
+    background token refresh (utilities/auth.py) at the end of the run.
+
+    Fires once per process — in the controller and in each xdist worker — so
+    every worker releases its own keep-alive connections and timer. In the
+    controller it also stops the --browser-server browser servers and the
+    --mock-api server. The
+    --api-mode cassette counters are handed to the controller (workers) or
+    kept for the terminal summary (serial run).
+
+    Workers hand their endpoint timings to the controller; the controller (or
+    a serial run) then records the run in the performance baseline store and
+    compares it with the earlier runs (see _record_perf_baseline). This runs
+    before pytest-html writes report.html, which shows the comparison.
+
+    Finally the per-test log capture stats are handed over or kept like the
+    cassette counters, and the queued log records are written
+    (utilities/utils.py), so the log file is complete when the process exits.
+    """
+    from utilities.auth import stop_token_refresh
+    stop_token_refresh()
+    close_all_sessions()
+    _stop_browser_servers()
+    for server in MOCK_API_SERVERS:
+        server.stop()
+
+    store = CassetteStore()
+    if store.mode != "live":
+        if hasattr(session.config, "workeroutput"):
+            session.config.workeroutput["api_cassette"] = store.stats
+        elif not hasattr(session.config, "workerinput") and any(store.stats.values()):
+            API_CASSETTE_STATS["master"] = store.stats
+
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["perf_endpoints"] = EndpointTimings().samples
+    elif not session.config.getoption("--no-perf-baseline") and not session.config.option.collectonly:
+        _record_perf_baseline(session.config, exitstatus)
+    if PHASE_TIMINGS and not hasattr(session.config, "workerinput"):
+        write_report(build_report(PHASE_TIMINGS), PHASE_TIMING_REPORT)
+
+    log_capture = get_log_capture_stats()
+    if log_capture.released or log_capture.held_captures:
+        if hasattr(session.config, "workeroutput"):
+            session.config.workeroutput["log_capture"] = asdict(log_capture)
+        elif not hasattr(session.config, "workerinput"):
+            LOG_CAPTURE_STATS["master"] = asdict(log_capture)
+    flush_logging()
+
+
+def _perf_environment(config) -> str:
+    """
+    Environment string the performance baseline is kept per: the API target
+    (or 'mock'), the --api-mode, the xdist worker count and --latency-benchmark,
+    since each of them changes the timings on its own.
+    """
+    if config.getoption("--mock-api"):
+        parts = ["mock"]
+    else:
+        parts = [f"{config.getoption('--api-mode')}@{urlparse(api_url).netloc}"]
+    workers = getattr(config.option, "numprocesses", None)
+    if workers:
+        parts.append(f"-n {workers}")
+    if config.getoption("--latency-benchmark"):
+        parts.append("benchmark")
+    return " ".join(parts)
+
+
+def _record_perf_baseline(config, exitstatus):
+    """
+    Store this run's endpoint and test timings, compare them with the rolling
+    baseline and write the machine-readable report to PERF_REPORT_PATH.
+
+    A broken or locked store is logged and never fails the run.
+    """
+    for name, samples in EndpointTimings().samples.items():
+        PERF_SAMPLES.setdefault(("endpoint", name), []).extend(samples)
+    if not PERF_SAMPLES:
+        return
+    metadata = {
+        "args": list(config.invocation_params.args),
+        "exitstatus": int(exitstatus),
+        "tests": sum(1 for kind, _ in PERF_SAMPLES if kind == "test"),
+        "endpoint_samples": sum(len(samples) for (kind, _), samples in PERF_SAMPLES.items() if kind == "endpoint"),
+    }
+    try:
+        comparison = record_and_compare(_perf_environment(config), PERF_SAMPLES, RUN_STARTED_AT, metadata)
+        comparison.write_report(PERF_REPORT_PATH)
+    except Exception as e:
+        logger.warning(f"Could not update the performance baseline: {str(e)}")
+        return
+    PERF_COMPARISON.append(comparison)
 
 
 @pytest.fixture(scope="session")
@@ -121,94 +552,462 @@ def playwright():
     with sync_playwright() as playwright:
         yield playwright
 
+def get_selected_browser_types(config) -> List[str]:
+    """
+    Browser types selected with --browser ('all' expands to every supported type).
+
+    Args:
+        config: The pytest config object.
+
+    Returns:
+        List[str]: e.g. ['chromium'] or ['chromium', 'firefox', 'webkit']
+    """
+    browser_name = config.getoption("--browser").lower()
+    if browser_name == "all":
+        return list(SUPPORTED_BROWSERS)
+    return [browser_name]
+
+
+def _launch_browser(playwright, browser_type: str, headless: bool, ws_endpoint: Optional[str] = None) -> Browser:
+    """Connect to the shared browser server at ws_endpoint, or launch a browser of the given type."""
+    if browser_type not in SUPPORTED_BROWSERS:
+        raise ValueError(f"Unsupported browser {browser_type}. Supported browsers are: chromium, firefox, webkit.")
+    if ws_endpoint:
+        return getattr(playwright, browser_type).connect(ws_endpoint)
+    return getattr(playwright, browser_type).launch(headless=headless)
+
+
+def pytest_generate_tests(metafunc):
+    """
+    With --browser-parametrize, turn the browser into a test parameter.
+
+    Every test that (indirectly) uses browser_instances gets one item per
+    selected browser, so `--browser all` yields test_x[chromium],
+    test_x[firefox] and test_x[webkit]. The parameter is session-scoped:
+    browser_instances and auth_states are then built once per browser, and an
+    xdist worker only launches the browsers of the items it actually runs.
+    """
+    if "browser_type" not in metafunc.fixturenames:
+        return
+    if not metafunc.config.getoption("--browser-parametrize"):
+        return
+    browser_types = get_selected_browser_types(metafunc.config)
+    metafunc.parametrize("browser_type", browser_types, ids=browser_types, scope="session")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    With --browser-parametrize, group items by test file and browser.
+
+    Runs before xdist's own hook so the xdist_group marker is picked up by
+    --dist=loadgroup: each file keeps running in order on one worker per
+    browser, while the chromium, firefox and webkit groups of the same file
+    can run on different workers at the same time.
+    """
+    if not config.getoption("--browser-parametrize"):
+        return
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or "browser_type" not in callspec.params:
+            continue
+        browser_type = callspec.params["browser_type"]
+        item.add_marker(pytest.mark.xdist_group(name=f"{item.location[0]}::{browser_type}"))
+        # Travels with every report (also from xdist workers) for pytest_runtest_logreport
+        item.user_properties.append(("browser_type", browser_type))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Tag the test's log records with its nodeid and browser type (see set_log_context)."""
+    browser_type = dict(item.user_properties).get("browser_type")
+    if browser_type is None and "browser_instances" in item.fixturenames:
+        browser_type = ",".join(get_selected_browser_types(item.config))
+    set_log_context(item.nodeid, browser_type)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    set_log_context()
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """--phase-timing: start a new breakdown for the test about to run."""
+    if PhaseTimer().enabled:
+        PhaseTimer().start_test()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item):
+    PhaseTimer().set_phase("call")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item, nextitem):
+    PhaseTimer().set_phase("teardown")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """
+    --phase-timing: time the fixture's setup, and its teardown through two
+    finalizers around the fixture's own.
+
+    Finalizers run last-in first-out. The one added before the fixture runs
+    fires after its teardown, the one added after it fires just before, so
+    together they time only this fixture's teardown code.
+    """
+    timer = PhaseTimer()
+    if not timer.enabled:
+        yield
+        return
+
+    teardown = {}
+
+    def teardown_finished():
+        if "start" in teardown:
+            timer.add_fixture(fixturedef.argname, fixturedef.scope, "teardown", time.perf_counter() - teardown["start"])
+
+    def teardown_started():
+        teardown["start"] = time.perf_counter()
+
+    fixturedef.addfinalizer(teardown_finished)
+    start_time = time.perf_counter()
+    yield
+    timer.add_fixture(fixturedef.argname, fixturedef.scope, "setup", time.perf_counter() - start_time)
+    fixturedef.addfinalizer(teardown_started)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    --phase-timing: attach the test's breakdown to its teardown report, which
+    carries it to the controller under xdist (read in pytest_runtest_logreport).
+    """
+    if call.when == "teardown" and PhaseTimer().enabled:
+        item.user_properties.append(("phase_timing", PhaseTimer().finish_test()))
+    yield
+
+
+def pytest_runtest_logreport(report):
+    """
+    Count one outcome per test and browser, and collect each test's blocked
+    resources and asset cache activity, for the terminal summary, the
+    call duration of every passed test for the performance baseline, and
+    with --phase-timing every phase's duration and the test's breakdown.
+
+    Under xdist this runs in the controller for the reports sent back by the
+    workers, so the counts cover the whole run.
+    """
+    properties = dict(report.user_properties)
+    if report.when == "teardown" and "blocked_requests" in properties:
+        BLOCKED_RESOURCES[report.nodeid] = (properties["blocked_requests"], properties["blocked_bytes"])
+    if report.when == "teardown" and "asset_cache_hits" in properties:
+        ASSET_CACHE_TOTALS["hits"] += properties["asset_cache_hits"]
+        ASSET_CACHE_TOTALS["misses"] += properties["asset_cache_misses"]
+        ASSET_CACHE_TOTALS["bytes"] += properties["asset_cache_bytes"]
+    if report.when == "call" and report.passed:
+        PERF_SAMPLES[("test", report.nodeid)] = [report.duration]
+    if PhaseTimer().enabled:
+        timing = PHASE_TIMINGS.setdefault(report.nodeid, {"phases": {}})
+        timing["phases"][report.when] = report.duration
+        if "phase_timing" in properties:
+            timing.update(properties["phase_timing"])
+
+    browser_type = properties.get("browser_type")
+    if browser_type is None:
+        return
+    if report.when == "call":
+        outcome = "xfailed" if hasattr(report, "wasxfail") else report.outcome
+    elif report.failed:
+        outcome = "error"
+    elif report.when == "setup" and report.skipped:
+        outcome = "skipped"
+    else:
+        return
+    BROWSER_RESULTS.setdefault(browser_type, {}).setdefault(outcome, 0)
+    BROWSER_RESULTS[browser_type][outcome] += 1
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Print the per-browser result counts collected in --browser-parametrize
+    mode, and how long browser startup took and how much memory the browsers
+    used in each process, the tests with the most blocked resources, the
+    --api-mode cassette counters, the static asset cache hit rate, what the
+    --mock-api server handled, the performance regressions against the
+    rolling baseline, the --phase-timing slowest fixtures and tests, the
+    memory used by the per-test log captures and where --log-jsonl wrote to.
+    """
+    if BROWSER_RESULTS:
+        terminalreporter.section("results per browser")
+        for browser_type in SUPPORTED_BROWSERS:
+            counts = BROWSER_RESULTS.get(browser_type)
+            if not counts:
+                continue
+            summary = ", ".join(f"{counts[outcome]} {outcome}" for outcome in sorted(counts))
+            terminalreporter.write_line(f"{browser_type:<10} {summary}")
+
+    if BROWSER_STARTUP:
+        shared = any(name.endswith(" server") for name in BROWSER_STARTUP)
+        terminalreporter.section(f"browser startup ({'shared server' if shared else 'launched per process'})")
+        total_seconds = 0.0
+        total_rss_mb = 0.0
+        for name, startup in sorted(BROWSER_STARTUP.items()):
+            rss_mb = startup.get("rss_mb")
+            total_seconds += startup["seconds"]
+            total_rss_mb += rss_mb or 0.0
+            memory = f"{rss_mb:.1f} MB" if rss_mb is not None else "n/a"
+            terminalreporter.write_line(
+                f"{name:<16} {startup['browsers']} browser(s) ready in {startup['seconds']:.2f}s, {memory}"
+            )
+        terminalreporter.write_line(f"{'total':<16} {total_seconds:.2f}s startup, {total_rss_mb:.1f} MB")
+
+    if BLOCKED_RESOURCES:
+        terminalreporter.section(f"blocked resources ({config.getoption('--block-resources')} profile)")
+        total_requests = sum(requests_blocked for requests_blocked, _ in BLOCKED_RESOURCES.values())
+        total_bytes = sum(bytes_saved for _, bytes_saved in BLOCKED_RESOURCES.values())
+        terminalreporter.write_line(
+            f"{total_requests} request(s) blocked across {len(BLOCKED_RESOURCES)} test(s), "
+            f"{total_bytes / (1024 * 1024):.1f} MB saved where the size was known"
+        )
+        top_tests = sorted(BLOCKED_RESOURCES.items(), key=lambda item: item[1][0], reverse=True)[:10]
+        for nodeid, (requests_blocked, bytes_saved) in top_tests:
+            if requests_blocked:
+                terminalreporter.write_line(f"{requests_blocked:>6}  {bytes_saved / 1024:>9.0f} KB  {nodeid}")
+
+    if API_CASSETTE_STATS:
+        terminalreporter.section(f"API cassettes ({config.getoption('--api-mode')} mode)")
+        totals = {name: sum(stats.get(name, 0) for stats in API_CASSETTE_STATS.values())
+                  for name in ("recorded", "replayed", "missed")}
+        terminalreporter.write_line(
+            f"{totals['recorded']} recorded, {totals['replayed']} replayed, "
+            f"{totals['missed']} missing from the store"
+        )
+
+    lookups = ASSET_CACHE_TOTALS["hits"] + ASSET_CACHE_TOTALS["misses"]
+    if lookups:
+        terminalreporter.section("static asset cache")
+        terminalreporter.write_line(
+            f"{ASSET_CACHE_TOTALS['hits']} hit(s), {ASSET_CACHE_TOTALS['misses']} miss(es) "
+            f"({ASSET_CACHE_TOTALS['hits'] / lookups:.0%} hit rate), "
+            f"{ASSET_CACHE_TOTALS['bytes'] / (1024 * 1024):.1f} MB served from disk"
+        )
+
+    for server in MOCK_API_SERVERS:
+        stats = server.stats
+        terminalreporter.section("mock API")
+        by_status = ", ".join(f"{status}: {count}" for status, count in sorted(stats.by_status.items()))
+        terminalreporter.write_line(
+            f"{stats.requests} request(s) ({by_status or 'none'}), {stats.injected_errors} injected error(s), "
+            f"{stats.latency_ms / 1000:.1f}s of injected latency"
+        )
+
+    for comparison in PERF_COMPARISON:
+        terminalreporter.section("performance baseline")
+        terminalreporter.write_line(
+            f"run {comparison.run_id} ({comparison.environment}) vs {len(comparison.baseline_run_ids)} earlier run(s): "
+            f"{comparison.count('regression')} regression(s), {comparison.count('ok')} ok, "
+            f"{comparison.count('insufficient-history')} without enough history"
+        )
+        for metric in comparison.regressions[:20]:
+            terminalreporter.write_line(
+                f"{metric.ratio:>5.2f}x  {metric.baseline_median:.3f}s -> {metric.current_median:.3f}s  "
+                f"p={metric.p_value:.4f}  {metric.kind:<8} {metric.name}"
+            )
+        terminalreporter.write_line(f"report: {PERF_REPORT_PATH}")
+
+    if PHASE_TIMINGS:
+        report = build_report(PHASE_TIMINGS)
+        terminalreporter.section("top 20 slowest fixtures")
+        terminalreporter.write_line(
+            f"{'total':>8} {'setup':>8} {'teardown':>8} {'setups':>6} {'mean':>7} {'max':>7}  {'scope':<8} fixture"
+        )
+        for fixture in report["fixtures"][:20]:
+            terminalreporter.write_line(
+                f"{fixture['total']:>7.2f}s {fixture['setup']:>7.2f}s {fixture['teardown']:>7.2f}s "
+                f"{fixture['setups']:>6} {fixture['mean_setup']:>6.2f}s {fixture['max']:>6.2f}s  "
+                f"{fixture['scope']:<8} {fixture['name']}"
+            )
+        terminalreporter.section("slowest tests by phase")
+        for entry in report["tests"][:10]:
+            phases = "  ".join(f"{phase} {entry['phases'].get(phase, 0.0):.2f}s" for phase in PHASES)
+            terminalreporter.write_line(
+                f"{entry['total']:>7.2f}s  {phases}  http {activity_seconds(entry, 'http'):.2f}s  "
+                f"navigation {activity_seconds(entry, 'navigation'):.2f}s  {entry['nodeid']}"
+            )
+        terminalreporter.write_line(f"per-test breakdown: {PHASE_TIMING_REPORT}")
+
+    if log_jsonl_dir:
+        terminalreporter.section("JSON-lines logs")
+        terminalreporter.write_line(f"{log_jsonl_dir} (merge: python merge_logs.py {log_jsonl_dir} --text)")
+
+    if LOG_CAPTURE_STATS:
+        terminalreporter.section("log capture")
+        for name, stats in sorted(LOG_CAPTURE_STATS.items()):
+            terminalreporter.write_line(
+                f"{name:<8} {stats['released']} released ({stats['spilled']} spilled), "
+                f"{stats['held_captures']} still held ({stats['held_bytes'] / 1024:.0f} KB), "
+                f"peak {stats['peak_bytes'] / 1024:.0f} KB, {stats['dropped_lines']} line(s) dropped by the "
+                f"{stats['max_lines']} line / {stats['max_bytes'] // 1024} KB cap"
+            )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """
+    pytest-html hook: add the performance baseline comparison (see
+    _record_perf_baseline) to the summary section of report.html.
+    """
+    for comparison in PERF_COMPARISON:
+        rows = "".join(
+            f"<tr><td>{metric.kind}</td><td>{html.escape(metric.name)}</td><td>{metric.baseline_median:.3f}s</td>"
+            f"<td>{metric.current_median:.3f}s</td><td>{metric.ratio:.2f}x</td><td>{metric.p_value:.4f}</td></tr>"
+            for metric in comparison.regressions
+        )
+        table = (
+            "<table><tr><th>Kind</th><th>Name</th><th>Baseline median</th><th>Median</th>"
+            f"<th>Slowdown</th><th>p-value</th></tr>{rows}</table>" if rows else ""
+        )
+        postfix.append(
+            f"<h2>Performance baseline</h2>"
+            f"<p>Run {comparison.run_id} ({html.escape(comparison.environment)}) compared with "
+            f"{len(comparison.baseline_run_ids)} earlier run(s): {comparison.count('regression')} regression(s), "
+            f"{comparison.count('ok')} ok, {comparison.count('insufficient-history')} without enough history. "
+            f"Full comparison: {html.escape(PERF_REPORT_PATH)}</p>{table}"
+        )
+
+
+def _record_browser_startup(config, browser_count: int, seconds: float, rss_mb: Optional[float]):
+    """
+    Add one browser_instances setup to this process's startup totals.
+
+    Workers hand the totals to the controller through workeroutput (read in
+    pytest_testnodedown). A serial run keeps them under 'master'.
+    """
+    worker_id = config.workerinput["workerid"] if hasattr(config, "workerinput") else "master"
+    startup = BROWSER_STARTUP.setdefault(worker_id, {"browsers": 0, "seconds": 0.0, "rss_mb": None})
+    startup["browsers"] += browser_count
+    startup["seconds"] += seconds
+    if rss_mb is not None:
+        startup["rss_mb"] = max(startup["rss_mb"] or 0.0, rss_mb)
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["browser_startup"] = startup
+
+
+@pytest.fixture(scope="session")
+def browser_type(request) -> Optional[str]:
+    """
+    The single browser this test runs on, or None for every selected browser.
+
+    Only returns a value in --browser-parametrize mode, where
+    pytest_generate_tests overrides this fixture with one parameter per
+    browser. Otherwise browser_instances launches everything --browser selects
+    and tests loop over the pages as before.
+    """
+    return None
+
+
 @pytest.fixture(scope="session")
-def browser_instances(playwright, request) -> Dict[str, Browser]: # type: ignore
+def browser_instances(playwright, browser_type, request) -> Dict[str, Browser]: # type: ignore
     """
     Fixture that provides browser instances based on command line options.
     
     Args:
         playwright: The Playwright instance.
+        browser_type: The parametrized browser, or None for all selected browsers.
         request: The pytest request object.
         
     Returns:
         Dict[str, Browser]: A dictionary of browser instances.
     """
-    browser_name = request.config.getoption("--browser")
-    headless = request.config.getoption("--headless")
-    
-    #Convert headless to boolean if needed
-    if isinstance(headless, str):
-        headless = headless.lower() == "true"
+    headless = _headless(request.config)
+    # Set by pytest_configure_node when the controller runs --browser-server
+    ws_endpoints = getattr(request.config, "workerinput", {}).get("browser_ws_endpoints", {})
     
     browsers = {}
+    browser_types = [browser_type] if browser_type else get_selected_browser_types(request.config)
     
-    if browser_name.lower() == "all":
-        browser_types = ["chromium", "firefox", "webkit"]
-    else:
-        browser_types = [browser_name.lower()]
-    
-    # Launch each browser once
-    for browser_type in browser_types:
-        logger.info(f"Launching {browser_type} browser in {'headless' if headless else 'headed'} mode (session scope)")
-        
-        if browser_type == "chromium":
-            browsers[browser_type] = playwright.chromium.launch(headless=headless)
-        elif browser_type == "firefox":
-            browsers[browser_type] = playwright.firefox.launch(headless=headless)
-        elif browser_type == "webkit":
-            browsers[browser_type] = playwright.webkit.launch(headless=headless)
+    # Launch (or connect to) each browser once
+    start_time = time.time()
+    for name in browser_types:
+        if ws_endpoints.get(name):
+            logger.info(f"Connecting to shared {name} browser server at {ws_endpoints[name]} (session scope)")
         else:
-            raise ValueError(f"Unsupported browser {browser_type}. Supported browsers are: chromium, firefox, webkit.")
+            logger.info(f"Launching {name} browser in {'headless' if headless else 'headed'} mode (session scope)")
+        browsers[name] = _launch_browser(playwright, name, headless, ws_endpoints.get(name))
+    startup_seconds = time.time() - start_time
     
     logger.info(f"Launched {len(browsers)} browses(s) for test session/")
     
     yield browsers
     
+    # Measure while the browsers are still open. Only this process's children
+    # count: the Playwright driver, plus the browsers when launched locally.
+    _record_browser_startup(request.config, len(browsers), startup_seconds,
+                            process_tree_rss_mb(os.getpid(), include_root=False))
+    
     # Teardown - close all browsers at end of session
     for browser_type, browser in browsers.items():
         logger.info(f"Closing {browser_type} browser (session scope)")
         browser.close()
         
+def _capture_auth_state(browser: Browser, browser_type: str, username: str, password: str) -> Dict[str, Any]:
+    """
+    Log in through the UI in a temporary context and return its storage state.
+    """
+    logger.info("="* 80)
+    logger.info(f"Performing one-time login on {browser_type} to capture auth state")
+    logger.info("=" * 80)
+    
+    # Create temporary context just for login
+    context = browser.new_context()
+    page = context.new_page()
+    
+    # Perform actual login
+    page.goto(QA_LOGIN_URL)
+    page.get_by_role("textbox", name="Username").fill(username)
+    page.get_by_role("textbox", name="Password").fill(password)
+    page.get_by_role("button", name="Log In").click()
+    page.get_by_role("button", name="LOG OUT").wait_for(state="visible")
+    
+    # Capture the authentication state (cookies, local storage)
+    storage_state = context.storage_state()
+    logger.info(f"Captured auth state for {browser_type} browser")
+
+    # Close this temporary context immediately — we only needed it to capture
+    # the auth state.
+    context.close()
+    return storage_state
+
+
 @pytest.fixture(scope="session")
 def auth_states(browser_instances, request) -> Dict[str, str]: # type: ignore
     """
     Fixture that provides authentication states for each browser.
+
+    States come from the on-disk cache (utilities/storage_state_cache.py)
+    while they are valid, so the UI login only runs when the cached state for
+    this environment, user and browser is missing or about to expire. xdist
+    workers share the cache files under a lock and log in at most once per
+    browser. --no-auth-cache forces a fresh login.
     
     Args:
         browser_instances: A dictionary of browser instances.
         request: The pytest request object.
     """
+    from utilities.storage_state_cache import get_storage_state
     username = request.config.getoption("--username", default=SYS_ADMIN_USER)
     password = request.config.getoption("--password", default=SYS_ADMIN_PASS)
+    refresh = request.config.getoption("--no-auth-cache")
     
     auth_states = {}
     
     for browser_type, browser in browser_instances.items():
-        logger.info("="* 80)
-        logger.info(f"Performing one-time login on {browser_type} to capture auth state")
-        logger.info("=" * 80)
-        
-        # Create temporary context just for login
-        context = browser.new_context()
-        page = context.new_page()
-        
-        # Perform actual login
-        page.goto(QA_LOGIN_URL)
-        page.get_by_role("textbox", name="Username").fill(username)
-        page.get_by_role("textbox", name="Password").fill(password)
-        page.get_by_role("button", name="Log In").click()
-        page.get_by_role("button", name="LOG OUT").wait_for(state="visible")
-        
-        # Capture the authentication state (cookies, local storage)
-        storage_state = context.storage_state()
-        auth_states[browser_type] = storage_state
-
-        logger.info(f"Captured auth state for {browser_type} browser")
-
-        # Close this temporary context immediately — we only needed it to capture
-        # the auth state. Previously this close() call was outside the loop, so
-        # only the last browser's context was ever closed when running --browser all.
-        context.close()
+        auth_states[browser_type] = get_storage_state(
+            QA_WEB_BASE_URL, username, browser_type,
+            login=lambda: _capture_auth_state(browser, browser_type, username, password),
+            refresh=refresh,
+        )
 
     yield auth_states
 
@@ -281,6 +1080,15 @@ def logged_in_page(browser_instances, auth_states, request) -> List[Page]: # typ
     app will redirect to the login page when the page fixture navigates, and
     the fixture's page-title verification will fail with a clear error.
 
+    Images, media and fonts are stubbed or aborted according to
+    --block-resources unless the test is marked needs_media. The number of
+    blocked requests and known bytes saved are logged and attached to the
+    test report as user properties.
+
+    The portal's hashed JS/CSS bundles are served from the on-disk asset
+    cache (unless --no-asset-cache), since a fresh context starts with an
+    empty browser cache. Hits and misses are attached to the report too.
+
     Args:
         browser_instances: Session-scoped browsers
         auth_states: Session-scoped authentication states
@@ -292,6 +1100,10 @@ def logged_in_page(browser_instances, auth_states, request) -> List[Page]: # typ
     logger.info("Starting logged_in_page fixture.")
     contexts_and_pages : List[Tuple[BrowserContext, Page]] = []
     pages: List[Page] = []
+    blockers: List[ResourceBlocker] = []
+    asset_caches: List[StaticAssetCache] = []
+    use_asset_cache = not request.config.getoption("--no-asset-cache")
+    profile = "none" if request.node.get_closest_marker("needs_media") else request.config.getoption("--block-resources")
 
     for browser_type, browser in browser_instances.items():
         logger.info("=" * 80)
@@ -301,6 +1113,13 @@ def logged_in_page(browser_instances, auth_states, request) -> List[Page]: # typ
         # Create new context with stored auth state
         storage_state = auth_states[browser_type]
         context = browser.new_context(storage_state=storage_state)
+        blocker = ResourceBlocker(profile)
+        blocker.attach(context)
+        blockers.append(blocker)
+        if use_asset_cache:
+            asset_cache = StaticAssetCache(QA_WEB_BASE_URL)
+            asset_cache.attach(context)
+            asset_caches.append(asset_cache)
         page = context.new_page()
 
         start_test_capture(f"{browser_type}_{request.node.name}")
@@ -317,8 +1136,22 @@ def logged_in_page(browser_instances, auth_states, request) -> List[Page]: # typ
         logger.info(f"Tearing down context in {browser.browser_type.name} browser for test: {request.node.name}")
         browser_type = page.context.browser.browser_type.name
         end_test_capture(f"{browser_type}_{request.node.name}")
+        # pytest's own captured log already carries these lines into the report
+        release_test_logs(f"{browser_type}_{request.node.name}")
         context.close()
         logger.debug(f"Closed context in {browser_type} browser for test: {request.node.name}")
+
+    for blocker in blockers:
+        blocker.log_summary(request.node.name)
+    if profile != "none":
+        request.node.user_properties.append(("blocked_requests", sum(b.stats.total_requests for b in blockers)))
+        request.node.user_properties.append(("blocked_bytes", sum(b.stats.bytes_saved for b in blockers)))
+    for asset_cache in asset_caches:
+        asset_cache.log_summary(request.node.name)
+    if asset_caches:
+        request.node.user_properties.append(("asset_cache_hits", sum(c.stats.hits for c in asset_caches)))
+        request.node.user_properties.append(("asset_cache_misses", sum(c.stats.misses for c in asset_caches)))
+        request.node.user_properties.append(("asset_cache_bytes", sum(c.stats.bytes_from_disk for c in asset_caches)))
     logger.debug("Completed logged_in_page fixture teardown.")
         
 
@@ -485,6 +1318,7 @@ TEST_ENTITY_CONFIGURATIONS = {
         "create_endpoint": f"{api_url}/Installations/create",
         "delete_endpoint_template": f"{api_url}/Installations/delete?id={{id}}",
         "list_endpoint": f"{api_url}/Installations",  # For cleanup search
+        "search_endpoint": f"{api_url}/Installations/search",  # Name-filtered ResponseDto for the seeded pool
         "entity_name": "installation",
         "id_field": "installationId",
         "name_field": "name",
@@ -535,6 +1369,7 @@ TEST_ENTITY_CONFIGURATIONS = {
         "create_endpoint": f"{api_url}/Organization/Create",
         "delete_endpoint_template": f"{api_url}/Organization/Delete?id={{id}}",
         "list_endpoint": f"{api_url}/Organization",  # For cleanup search (/Organizations returns 404)
+        "search_endpoint": f"{api_url}/Organization/search",  # Name-filtered ResponseDto for the seeded pool
         "entity_name": "organization",
         "id_field": "organizationId",
         "name_field": "name",
@@ -547,6 +1382,7 @@ TEST_ENTITY_CONFIGURATIONS = {
         "create_endpoint": f"{api_url}/Device/Create",
         "delete_endpoint_template": f"{api_url}/Device/delete?id={{id}}",
         "list_endpoint": f"{api_url}/Device",
+        "search_endpoint": f"{api_url}/Device/search",  # Name-filtered ResponseDto for the seeded pool
         "entity_name": "device",
         "id_field": "deviceId",
         "name_field": "name",
@@ -585,7 +1421,7 @@ def cleanup_orphaned_test_records(entity_type, headers, logger):
     try:
         # pageNumber and pageSize are required — without them the API returns only 1 record.
         # 500 is large enough to catch all test records without multiple requests.
-        list_response = requests.get(
+        list_response = get_session().get(
             config["list_endpoint"],
             params={"pageNumber": 1, "pageSize": 500},
             headers=headers,
@@ -600,7 +1436,8 @@ def cleanup_orphaned_test_records(entity_type, headers, logger):
             logger.info(f"No {entity_name} records found for cleanup")
             return
         
-        # Filter for AUTOTEST records
+        # Filter for AUTOTEST records. Seeded pool records (AUTOSEED_ prefix,
+        # utilities/seeded_dataset.py) are kept across runs and never matched here.
         orphaned_records = []
         name_field = config["name_field"]
         id_field = config["id_field"]
@@ -624,7 +1461,7 @@ def cleanup_orphaned_test_records(entity_type, headers, logger):
         for record in orphaned_records:
             try:
                 delete_url = config["delete_endpoint_template"].format(id=record["id"])
-                delete_response = requests.delete(delete_url, headers=headers)
+                delete_response = get_session().delete(delete_url, headers=headers)
                 
                 if delete_response.status_code in [200, 204]:
                     logger.info(f"Cleaned up orphaned {entity_name}: {record['name']} (ID: {record['id']})")
@@ -647,6 +1484,22 @@ def cleanup_orphaned_test_records(entity_type, headers, logger):
 def verify_delete_endpoint_works(entity_type, headers, logger, cleanup_orphaned=True):
     """
     Enhanced function to verify delete endpoint works and optionally cleanup orphaned records.
+
+    Runs once per test run for each entity type: under xdist the first worker
+    does the check (see utilities/run_state.py) and the other workers wait for
+    it and skip their own.
+    """
+    from utilities.run_state import run_once
+    run_once(
+        f"verify_delete.{entity_type}",
+        lambda: _verify_delete_endpoint_works(entity_type, headers, logger, cleanup_orphaned) or True,
+    )
+
+
+def _verify_delete_endpoint_works(entity_type, headers, logger, cleanup_orphaned=True):
+    """
+    Create and delete one test record to prove the delete endpoint works, after
+    optionally cleaning up orphaned records. Called through verify_delete_endpoint_works.
     """
     if entity_type not in TEST_ENTITY_CONFIGURATIONS:
         pytest.fail(f"Unknown entity type: {entity_type}")
@@ -690,6 +1543,10 @@ def verify_delete_endpoint_works(entity_type, headers, logger, cleanup_orphaned=
     elif entity_type == "organizations":
         payload["organizationId"] = test_id
         payload["name"] = base_name
+    elif entity_type == "devices":
+        payload["deviceId"] = test_id
+        payload["name"] = base_name
+        payload["wildXRNumber"] = wildxr_number_for_id(test_id)
 
     # DEBUG: Log the working payload and its length
     logger.info(f"DEBUG: Delete verification payload name: '{payload['name']}' (Length: {len(payload['name'])})")
@@ -700,7 +1557,7 @@ def verify_delete_endpoint_works(entity_type, headers, logger, cleanup_orphaned=
         # Create test record
         logger.info(f"Creating test {entity_name} for delete verification: {test_id}")
         
-        create_response = requests.put(
+        create_response = get_session().put(
             config["create_endpoint"], 
             json=payload, 
             headers=headers
@@ -720,7 +1577,7 @@ def verify_delete_endpoint_works(entity_type, headers, logger, cleanup_orphaned=
         delete_url = config["delete_endpoint_template"].format(id=test_id)
         logger.info(f"Testing delete endpoint: {delete_url}")
         
-        delete_response = requests.delete(delete_url, headers=headers)
+        delete_response = get_session().delete(delete_url, headers=headers)
         
         if delete_response.status_code not in [200, 204]:
             # Delete failed - we have an orphaned record
@@ -756,10 +1613,36 @@ def verify_delete_endpoint_works(entity_type, headers, logger, cleanup_orphaned=
 # HELPER FUNCTION FOR CONSISTENT TEST RECORD CREATION
 # =============================================================================
 
-def create_test_record_payload(entity_type, suffix=""):
+PROQUINT_CONSONANTS = "bdfghjklmnprstvz"
+PROQUINT_VOWELS = "aiou"
+
+
+def wildxr_number_for_id(record_id):
+    """
+    Derive a Proquint-style wildXRNumber (e.g. 'lusab-babad') from a record UUID.
+
+    Real devices get their wildXRNumber from /Device/InitializeNew; test devices
+    created directly need one in the same format. The first 32 bits of the UUID
+    are encoded, so the number is stable for a given record ID.
+    """
+    value = int(record_id.replace("-", "")[:8], 16)
+    words = []
+    for word in ((value >> 16) & 0xFFFF, value & 0xFFFF):
+        words.append(
+            PROQUINT_CONSONANTS[(word >> 12) & 0xF]
+            + PROQUINT_VOWELS[(word >> 10) & 0x3]
+            + PROQUINT_CONSONANTS[(word >> 6) & 0xF]
+            + PROQUINT_VOWELS[(word >> 4) & 0x3]
+            + PROQUINT_CONSONANTS[word & 0xF]
+        )
+    return "-".join(words)
+
+
+def create_test_record_payload(entity_type, suffix="", name=None):
     """
     Create a standardized test record payload for any entity type.
     Uses shortened names to fit database constraints (50 char limit).
+    Pass name to use a fixed name instead (e.g. seeded pool records).
     """
     if entity_type not in TEST_ENTITY_CONFIGURATIONS:
         raise ValueError(f"Unknown entity type: {entity_type}")
@@ -793,6 +1676,9 @@ def create_test_record_payload(entity_type, suffix=""):
         else:
             test_name = base_name[:45]
     
+    if name:
+        test_name = name
+    
     # Create payload
     payload = config["payload_template"].copy()
     
@@ -809,8 +1695,116 @@ def create_test_record_payload(entity_type, suffix=""):
     elif entity_type == "organizations":
         payload["organizationId"] = record_id
         payload["name"] = test_name
+    elif entity_type == "devices":
+        payload["deviceId"] = record_id
+        payload["name"] = test_name
+        payload["wildXRNumber"] = wildxr_number_for_id(record_id)
     
     # DEBUG: Log the name length
     logger.info(f"DEBUG: Created test record name: '{test_name}' (Length: {len(test_name)})")
     
-    return record_id, payload
\ No newline at end of file
+    return record_id, payload
+
+
+# =============================================================================
+# BULK TEST RECORD SEEDING (see utilities/bulk_seeding.py)
+# =============================================================================
+
+def seed_test_records(entity_type, count, suffix_prefix="_BULK_", headers=None, probe_first=True):
+    """
+    Create count test records of one entity type concurrently.
+
+    Payloads come from create_test_record_payload, so every record carries the
+    AUTOTEST_ prefix and is picked up by cleanup_orphaned_test_records if the
+    teardown never runs.
+
+    Args:
+        entity_type (str): Key from TEST_ENTITY_CONFIGURATIONS
+        count (int): Number of records to create
+        suffix_prefix (str): Name suffix; the record index is appended to it
+        headers (dict): Headers for API requests. Defaults to get_auth_headers()
+        probe_first (bool): Create one record first and skip the rest if it fails
+
+    Returns:
+        BulkSeedReport: Per-record outcomes; succeeded_ids holds the created IDs
+    """
+    from utilities.auth import get_auth_headers
+    from utilities.bulk_seeding import bulk_create_records
+
+    if entity_type not in TEST_ENTITY_CONFIGURATIONS:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+
+    config = TEST_ENTITY_CONFIGURATIONS[entity_type]
+    logger.info(f"\n=== Creating {count} test {config['entity_name']} records ===")
+    if headers is None:
+        headers = get_auth_headers()
+    records = [create_test_record_payload(entity_type, f"{suffix_prefix}{i}") for i in range(count)]
+    return bulk_create_records(config, records, headers, probe_first=probe_first)
+
+
+def delete_test_records(entity_type, record_ids, headers=None):
+    """
+    Delete test records of one entity type concurrently.
+
+    Args:
+        entity_type (str): Key from TEST_ENTITY_CONFIGURATIONS
+        record_ids (list): IDs of the records to delete
+        headers (dict): Headers for API requests. Defaults to get_auth_headers()
+
+    Returns:
+        BulkSeedReport: Per-record outcomes; failed lists records left behind
+    """
+    from utilities.auth import get_auth_headers
+    from utilities.bulk_seeding import bulk_delete_records
+
+    if entity_type not in TEST_ENTITY_CONFIGURATIONS:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+
+    config = TEST_ENTITY_CONFIGURATIONS[entity_type]
+    logger.info(f"\n=== Cleaning up {len(record_ids)} test {config['entity_name']} records ===")
+    if headers is None:
+        headers = get_auth_headers()
+    report = bulk_delete_records(config, record_ids, headers)
+    for outcome in report.failed:
+        logger.error(f"ORPHANED RECORD ALERT: {config['entity_name']} ID {outcome.record_id} could not be deleted")
+    return report
+
+
+# =============================================================================
+# SEEDED PAGINATION POOLS (see utilities/seeded_dataset.py)
+# =============================================================================
+
+def get_seeded_pagination_ids(entity_type, headers=None):
+    """
+    Get the IDs of the persistent pagination pool for an entity type.
+
+    The pool is checked with one search call the first time it is requested in
+    the run and topped up if records are missing. Under xdist only the first
+    worker does this (see utilities/run_state.py); the others reuse the IDs it
+    publishes. It is never deleted, so fixtures using it have no teardown.
+
+    Args:
+        entity_type (str): Key from TEST_ENTITY_CONFIGURATIONS
+        headers (dict): Headers for API requests. Defaults to get_auth_headers()
+
+    Returns:
+        List[str]: IDs of the pool records, or an empty list if the pool could not be read
+    """
+    from utilities.auth import get_auth_headers
+    from utilities.run_state import run_once
+    from utilities.seeded_dataset import SeededDatasetManager, seeded_record_name
+
+    if entity_type not in TEST_ENTITY_CONFIGURATIONS:
+        raise ValueError(f"Unknown entity type: {entity_type}")
+
+    if headers is None:
+        headers = get_auth_headers()
+    return run_once(
+        f"seeded_pool.{entity_type}",
+        lambda: SeededDatasetManager().ensure(
+            entity_type,
+            TEST_ENTITY_CONFIGURATIONS[entity_type],
+            headers,
+            lambda index: create_test_record_payload(entity_type, name=seeded_record_name(index)),
+        ),
+    )
@@ -1,12 +1,10 @@
 # installations_fixtures.py (Fixture)
 import os
 import pytest
-import requests
 import uuid
 from conftest import (
     verify_delete_endpoint_works,
-    create_test_record_payload,
-    TEST_ENTITY_CONFIGURATIONS,
+    get_seeded_pagination_ids,
     api_token,
     QA_WEB_BASE_URL,
 )
@@ -64,58 +62,17 @@ def installations_page(logged_in_page):
 @pytest.fixture(scope="function")
 def installations_pagination_test_data(request):
     """
-    Enhanced fixture that creates enough installation records to test pagination on the Installations page.
-    Includes delete endpoint verification and orphaned record cleanup.
+    Enhanced fixture that provides enough installation records to test pagination on the Installations page.
+    Records come from the persistent seeded pool (get_seeded_pagination_ids) and are not deleted.
     
     Returns:
-        List[str]: List of installation IDs created for the test
+        List[str]: List of installation IDs in the seeded pool
     """
-    # Determine how many records we need for pagination
-    min_records_needed = PAGE_SIZE + 2  # At least enough to go to page 2
-    
-    # List to track created installation IDs for cleanup
-    installation_ids = []
+    installation_ids = get_seeded_pagination_ids("installations")
+
+    logger.info(f"\nUsing {len(installation_ids)} seeded test installations")
 
-    # Headers for API calls with dynamic token
-    headers = get_auth_headers()
-    
-    # Create test installations
-    logger.info(f"\n=== Creating {min_records_needed} test installations ===")
-    
-    for i in range(min_records_needed):
-        record_id, payload = create_test_record_payload("installations", f"_BULK_{i}")
-        
-        try:
-            config = TEST_ENTITY_CONFIGURATIONS["installations"]
-            response = requests.put(config["create_endpoint"], json=payload, headers=headers)
-            
-            if response.status_code in [200, 201]:
-                installation_ids.append(record_id)
-                logger.info(f"Successfully created installation with ID: {record_id}")
-            else:
-                logger.error(f"Failed to create installation: {response.status_code}")
-                logger.error(f"Response: {response.text}")
-        except Exception as e:
-            logger.error(f"Exception during creation: {str(e)}")
-    
-    logger.info(f"\nCreated {len(installation_ids)} test installations")
-    
     yield installation_ids
-    
-    # Cleanup
-    config = TEST_ENTITY_CONFIGURATIONS["installations"]
-    logger.info(f"\n=== Cleaning up {len(installation_ids)} test installations ===")
-    for installation_id in installation_ids:
-        try:
-            delete_url = config["delete_endpoint_template"].format(id=installation_id)
-            delete_response = requests.delete(delete_url, headers=headers)
-            
-            if delete_response.status_code in [200, 204]:
-                logger.info(f"Deleted installation ID: {installation_id}")
-            else:
-                logger.error(f"Failed to delete installation ID {installation_id}: {delete_response.status_code}")
-        except Exception as e:
-            logger.error(f"Exception during deletion: {str(e)}")
             
 @pytest.fixture(scope="function")
 def installations_conditional_pagination_data(installations_page):
@@ -159,80 +116,10 @@ def installations_conditional_pagination_data(installations_page):
     except Exception as e:
         logger.error(f"Error checking existing data count: {str(e)} - will create test data")
     
-    # Create test data
-    logger.info("Creating test data for pagination")
-    
-    # Calculate how many more records we need
-    records_to_create = min_records_for_pagination + 1  # Ensure we create enough to go to at least page 2
+    # Top up the persistent seeded pool; it is shared across runs and never deleted
+    logger.info("Using seeded test data for pagination")
+    installation_ids = get_seeded_pagination_ids("installations", headers=headers)
     
-    # Reuse the existing pagination test data creation logic
-    installation_ids = []
-    headers = get_auth_headers()
-    
-    logger.info(f"Creating {records_to_create} test installations")
-    
-    # DEBUG: Create first record with full debugging
-    if records_to_create > 0:
-        record_id, payload = create_test_record_payload("installations", f"_COND_0")
-        logger.info(f"DEBUG: First bulk creation payload: {payload}")
-        
-        try:
-            config = TEST_ENTITY_CONFIGURATIONS["installations"]
-            response = requests.put(config["create_endpoint"], json=payload, headers=headers)
-            
-            logger.info(f"DEBUG: First bulk creation response status: {response.status_code}")
-            logger.info(f"DEBUG: First bulk creation response text: {response.text}")
-            
-            if response.status_code in [200, 201]:
-                installation_ids.append(record_id)
-                logger.info(f"Successfully created installation with ID: {record_id}")
-            else:
-                logger.error(f"Failed to create installation: {response.status_code}")
-                logger.error(f"Response: {response.text}")
-                
-                # STOP HERE - don't create more if first one fails
-                logger.error("Stopping bulk creation due to first record failure")
-                yield installation_ids, True
-                return
-                
-        except Exception as e:
-            logger.error(f"Exception during first creation: {str(e)}")
-            yield installation_ids, True
-            return
-    
-    # If first record succeeded, create the rest (abbreviated for brevity)
-    for i in range(1, records_to_create):
-        record_id, payload = create_test_record_payload("installations", f"_COND_{i}")
-        
-        try:
-            config = TEST_ENTITY_CONFIGURATIONS["installations"]
-            response = requests.put(config["create_endpoint"], json=payload, headers=headers)
-            
-            if response.status_code in [200, 201]:
-                installation_ids.append(record_id)
-                logger.info(f"Successfully created installation with ID: {record_id}")
-            else:
-                logger.error(f"Failed to create installation: {response.status_code}")
-                break  # Stop on first failure
-        except Exception as e:
-            logger.error(f"Exception during creation: {str(e)}")
-            break
-    
-    logger.info(f"Created {len(installation_ids)} test installations for pagination")
+    logger.info(f"Using {len(installation_ids)} seeded test installations for pagination")
     
     yield installation_ids, True
-    
-    # Cleanup
-    config = TEST_ENTITY_CONFIGURATIONS["installations"]
-    logger.info(f"\n=== Cleaning up {len(installation_ids)} test installations ===")
-    for installation_id in installation_ids:
-        try:
-            delete_url = config["delete_endpoint_template"].format(id=installation_id)
-            delete_response = requests.delete(delete_url, headers=headers)
-            
-            if delete_response.status_code in [200, 204]:
-                logger.info(f"Deleted installation ID: {installation_id}")
-            else:
-                logger.error(f"Failed to delete installation ID {installation_id}: {delete_response.status_code}")
-        except Exception as e:
-            logger.error(f"Exception during deletion: {str(e)}")
\ No newline at end of file
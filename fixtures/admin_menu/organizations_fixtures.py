@@ -1,21 +1,15 @@
 #organizations_fixtures.py (Fixture)
 import os
 import pytest
-import requests
-import uuid
 from conftest import (
     verify_delete_endpoint_works,
-    create_test_record_payload,
-    TEST_ENTITY_CONFIGURATIONS,
+    get_seeded_pagination_ids,
     api_token,
     QA_WEB_BASE_URL,
 )
-from datetime import datetime
 from dotenv import load_dotenv
 from typing import List, Dict, Any
-from utilities.config import PAGE_SIZE
 from utilities.utils import logger, get_browser_name
-from utilities.auth import get_auth_headers
 from page_objects.admin_menu.organizations_page import OrganizationsPage
 
 # Load environment variables from .env file
@@ -66,104 +60,21 @@ def organizations_page(logged_in_page):
 @pytest.fixture(scope="function")
 def organizations_pagination_test_data(request):
     """
-    Fixture that creates enough organization records to test pagination on the Organizations page.
+    Fixture that provides enough organization records to test pagination on the Organizations page.
 
-    This fixture generates a specified number of organization records and returns them
-    as a list of dictionaries, each containing the organization name and ID.
+    Records come from the persistent seeded pool (get_seeded_pagination_ids in conftest.py)
+    and are not deleted in teardown.
 
     Args:
         request: The pytest request object
 
     Returns:
-        List[Dict[str, Any]]: A list of dictionaries containing organization data
+        List[str]: List of organization IDs in the seeded pool
     """
-    # Determine how many records we need for pagination
-    min_records_needed = PAGE_SIZE + 2 # At least enough to go to page 2
-    
-    # List to track created organization data for cleanup
-    organization_ids = []
-    
-    # Headers for API calls with dynamic token
-    headers = get_auth_headers()
-    
-    # Create test organizations
-    logger.info(f"\n=== Creating {min_records_needed} test organizations ===")
-    
-    for i in range(min_records_needed):
-        # Generate unique identifier for the organization
-        organization_id = str(uuid.uuid4())
-        test_run_id = organization_id[:8]
-        username = os.getenv("USER", "unknown")
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        test_organization_name = f"AUTOTEST_{username}_{timestamp}_{test_run_id}"
-        
-        # Create organization payload
-        payload ={
-            "name": test_organization_name,
-            "organizationId": organization_id,
-        }
-        
-        # Make the API call to create organizations
-        try:
-            organization_endpoint = f"{api_url}/Organization/Create"
-            logger.info(f"Creating organization: {test_organization_name}")
-
-            # Use put method for creating organizations
-            response = requests.put(organization_endpoint, json=payload, headers=headers)
-            
-            # Since we know our API returns empty responses on success,
-            # we'll just use our generated ID if the status code indicates success
-            if response.status_code in [200,201]:
-                organization_ids.append(organization_id)
-                logger.info(f"Successfully created organization with ID: {organization_id}")
-            else:
-                logger.error(f"Failed to create organization: {response.status_code}")
-                logger.error(f"Response: {response.text}")
-                
-                # STOP HERE - don't create more if first one fails
-                logger.error("Stopping bulk creation due to first record failure")
-                yield organization_ids, True
-                return
-                
-        except Exception as e:
-            logger.error(f"Exception during first creation: {str(e)}")
-            yield organization_ids, True
-            return
-    
-    # If first record succeeded, create the rest (abbreviated for brevity)
-    for i in range(1, records_to_create):
-        record_id, payload = create_test_record_payload("organizations", f"_COND_{i}")
-        
-        try:
-            config = TEST_ENTITY_CONFIGURATIONS["organizations"]
-            response = requests.put(config["create_endpoint"], json=payload, headers=headers)
-            
-            if response.status_code in [200, 201]:
-                organization_ids.append(record_id)
-                logger.info(f"Successfully created organization with ID: {record_id}")
-            else:
-                logger.error(f"Failed to create organization: {response.status_code}")
-                break  # Stop on first failure
-        except Exception as e:
-            logger.error(f"Exception during creation: {str(e)}")
+    organization_ids = get_seeded_pagination_ids("organizations")
             
     # Log summary
-    logger.info(f"\nCreated {len(organization_ids)} test organizations for pagination testing")
+    logger.info(f"\nUsing {len(organization_ids)} seeded test organizations for pagination testing")
     
-    # Yield the created organization IDs for test use
+    # Yield the seeded organization IDs for test use
     yield organization_ids
-    
-    # Clean up - delete all created organizations
-    logger.info(f"\n=== Cleaning up {len(organization_ids)}created organizations ===")
-    for organization_id in organization_ids:
-        try:
-            delete_url = config["delete_endpoint_template"].format(id=organization_id)
-            delete_response = requests.delete(delete_url, headers=headers)
-            
-            if delete_response.status_code in [200, 204]:
-                logger.info(f"Deleted organization ID: {organization_id}")
-            else:
-                logger.error(f"Failed to delete organization ID {organization_id}: {delete_response.status_code}")
-        except Exception as e:
-            logger.error(f"Exception during deletion: {str(e)}")
\ No newline at end of file
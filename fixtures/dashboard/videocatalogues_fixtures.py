@@ -1,12 +1,10 @@
 #videocatalogues_fixtures.py (Fixture)
 import os
 import pytest
-import requests
 import uuid
 from conftest import (
     verify_delete_endpoint_works,
-    create_test_record_payload,
-    TEST_ENTITY_CONFIGURATIONS,
+    get_seeded_pagination_ids,
     api_token,
     QA_WEB_BASE_URL,
 )
@@ -63,60 +61,20 @@ def video_catalogue_page(logged_in_page):
 @pytest.fixture(scope="function")
 def video_catalogue_pagination_test_data(request):
     """
-    Fixture that creates enough video catalogue records to test pagination on the Video Catalogues page.
+    Fixture that provides enough video catalogue records to test pagination on the Video Catalogues page.
+    Records come from the persistent seeded pool (get_seeded_pagination_ids) and are not deleted.
 
     Returns:
-        List[str]: List of video catalogue IDs created for the test
+        List[str]: List of video catalogue IDs in the seeded pool
     """
     logger.debug("Starting video_catalogue_pagination_test_data fixture")
 
-    # Determine the number of records to create based on the PAGE_SIZE
-    min_records_needed = PAGE_SIZE + 2
-    
-    # List to track created video catalogue IDs for cleanup
-    video_catalogue_ids = []
-    
-    # Header for API calls with dynamic token
-    headers = get_auth_headers()
-    
-    # Create test video catalogues
-    logger.info(f"\n=== Creating {min_records_needed} test video catalogues ===")
-
-    for i in range(min_records_needed):
-        record_id, payload = create_test_record_payload("video_catalogues", f"_BULK_{i}")
+    video_catalogue_ids = get_seeded_pagination_ids("video_catalogues")
 
-        try:
-            config = TEST_ENTITY_CONFIGURATIONS["video_catalogues"]
-            response = requests.put(config["create_endpoint"], json=payload, headers=headers)
-            
-            if response.status_code in [200, 201]:
-                video_catalogue_ids.append(record_id)
-                logger.info(f"Successfully created video catalogue with ID: {record_id}")
-            else:
-                logger.error(f"Failed to create video catalogue: {response.status_code}")
-                logger.error(f"Response: {response.text}")
-        except Exception as e:
-            logger.error(f"Exception during creation: {str(e)}")
-
-    logger.info(f"\nCreated {len(video_catalogue_ids)} test video catalogues")
+    logger.info(f"\nUsing {len(video_catalogue_ids)} seeded test video catalogues")
 
     yield video_catalogue_ids
 
-    # Cleanup
-    config = TEST_ENTITY_CONFIGURATIONS["video_catalogues"]
-    logger.info(f"\n=== Cleaning up {len(video_catalogue_ids)} test video catalogues ===")
-    for video_catalogue_id in video_catalogue_ids:
-        try:
-            delete_url = config["delete_endpoint_template"].format(id=video_catalogue_id)
-            delete_response = requests.delete(delete_url, headers=headers)
-            
-            if delete_response.status_code in [200, 204]:
-                logger.info(f"Deleted video catalogue ID: {video_catalogue_id}")
-            else:
-                logger.error(f"Failed to delete video catalogue ID {video_catalogue_id}: {delete_response.status_code}")
-        except Exception as e:
-            logger.error(f"Exception during deletion: {str(e)}")
-
 @pytest.fixture(scope="function")
 def video_catalogue_conditional_pagination_data(video_catalogue_page):
     """
@@ -124,13 +82,13 @@ def video_catalogue_conditional_pagination_data(video_catalogue_page):
     
     Logic:
     1. Check how many video catalogues currently exist
-    2. If insufficient for pagination, create test data
+    2. If insufficient for pagination, top up and use the seeded pool
     3. If sufficient, return empty list and skip flag
     
     Returns:
-        Tuple[List[str], bool]: (installation_ids, data_was_created)
-            - installation_ids: List of created installation IDs (empty if none created)
-            - data_was_created: Boolean indicating if test data was created
+        Tuple[List[str], bool]: (video_catalogue_ids, data_was_created)
+            - video_catalogue_ids: List of seeded pool IDs (empty if none needed)
+            - data_was_created: Boolean indicating if seeded test data is being used
     """
     # Headers for API calls with dynamic token
     headers = get_auth_headers()
@@ -169,75 +127,9 @@ def video_catalogue_conditional_pagination_data(video_catalogue_page):
     except Exception as e:
         logger.error(f"Error checking existing data count: {str(e)} - will create test data")
     
-    # Create test data
-    records_to_create = min_records_for_pagination + 1
-    video_catalogue_ids = []
-    headers = get_auth_headers()
+    # Top up the persistent seeded pool; it is shared across runs and never deleted
+    video_catalogue_ids = get_seeded_pagination_ids("video_catalogues", headers=headers)
 
-    logger.info(f"Creating {records_to_create} test video catalogues")
-
-    # DEBUG: Create first record with full debugging
-    if records_to_create > 0:
-        record_id, payload = create_test_record_payload("video_catalogues", f"_COND_0")
-        logger.info(f"DEBUG: First bulk creation payload: {payload}")
-        
-        try:
-            config = TEST_ENTITY_CONFIGURATIONS["video_catalogues"]
-            response = requests.put(config["create_endpoint"], json=payload, headers=headers)
-            
-            logger.info(f"DEBUG: First bulk creation response status: {response.status_code}")
-            logger.info(f"DEBUG: First bulk creation response text: {response.text}")
-            
-            if response.status_code in [200, 201]:
-                video_catalogue_ids.append(record_id)
-                logger.info(f"Successfully created video catalogue with ID: {record_id}")
-            else:
-                logger.error(f"Failed to create video catalogue: {response.status_code}")
-                logger.error(f"Response: {response.text}")
-                
-                # STOP HERE - don't create more if first one fails
-                logger.error("Stopping bulk creation due to first record failure")
-                yield video_catalogue_ids, True
-                return
-                
-        except Exception as e:
-            logger.error(f"Exception during first creation: {str(e)}")
-            yield video_catalogue_ids, True
-            return
-    
-    # If first record succeeded, create the rest (abbreviated for brevity)
-    for i in range(1, records_to_create):
-        record_id, payload = create_test_record_payload("video_catalogues", f"_COND_{i}")
-        
-        try:
-            config = TEST_ENTITY_CONFIGURATIONS["video_catalogues"]
-            response = requests.put(config["create_endpoint"], json=payload, headers=headers)
-            
-            if response.status_code in [200, 201]:
-                video_catalogue_ids.append(record_id)
-                logger.info(f"Successfully created video catalogue with ID: {record_id}")
-            else:
-                logger.error(f"Failed to create video catalogue: {response.status_code}")
-                break  # Stop on first failure
-        except Exception as e:
-            logger.error(f"Exception during creation: {str(e)}")
-            break
-
-    logger.info(f"Created {len(video_catalogue_ids)} test video catalogues for pagination")
+    logger.info(f"Using {len(video_catalogue_ids)} seeded test video catalogues for pagination")
 
     yield video_catalogue_ids, True
-    
-    # Cleanup
-    config = TEST_ENTITY_CONFIGURATIONS["video_catalogues"]
-    logger.info(f"\n=== Cleaning up {len(video_catalogue_ids)} test video catalogues ===")
-    for video_catalogue_id in video_catalogue_ids:
-        try:
-            delete_url = config["delete_endpoint_template"].format(id=video_catalogue_id)
-            delete_response = requests.delete(delete_url, headers=headers)
-            
-            if delete_response.status_code in [200, 204]:
-                logger.info(f"Deleted video catalogue ID: {video_catalogue_id}")
-            else:
-                logger.error(f"Failed to delete video catalogue ID {video_catalogue_id}: {delete_response.status_code}")
-        except Exception as e:
-            logger.error(f"Exception during deletion: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+merge_logs.py — merge the per-worker JSON-lines logs of a --log-jsonl run into one time-ordered stream.
+
+Each process of a --log-jsonl run writes logs/jsonl/<run>/<worker>.jsonl
+(master, gw0, gw1, ...). This script merges them by timestamp. Run from the
+repo root:
+
+    python merge_logs.py                          # latest run, JSON lines to stdout
+    python merge_logs.py logs/jsonl/<run> -o merged.jsonl
+    python merge_logs.py --nodeid test_api_videos --level WARNING --text
+
+Each file is already in the order its process wrote it, so the files are
+merged lazily with heapq.merge; a run of any size streams in constant memory.
+"""
+import argparse
+import heapq
+import json
+import logging
+import os
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from utilities.config import LOG_JSONL_DIR
+
+
+def latest_run_dir(root: str = LOG_JSONL_DIR) -> Optional[str]:
+    """The most recently modified run directory under root, or None."""
+    if not os.path.isdir(root):
+        return None
+    runs = [os.path.join(root, name) for name in os.listdir(root) if os.path.isdir(os.path.join(root, name))]
+    return max(runs, key=os.path.getmtime) if runs else None
+
+
+def read_entries(path: str) -> Iterator[Dict[str, Any]]:
+    """Entries of one .jsonl file. A line that is not valid JSON (e.g. cut off by a crash) is skipped."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def merge_entries(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """All entries of the given files, ordered by timestamp."""
+    return heapq.merge(*(read_entries(path) for path in paths), key=lambda entry: entry.get("ts", 0.0))
+
+
+def filter_entries(entries: Iterable[Dict[str, Any]], nodeid: Optional[str] = None,
+                   worker: Optional[str] = None, level: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Keep the entries matching every given filter.
+
+    Args:
+        entries: Entries from merge_entries().
+        nodeid: Substring of the test nodeid.
+        worker: Worker ID, e.g. 'gw0'.
+        level: Minimum level name, e.g. 'WARNING'.
+    """
+    min_level = logging.getLevelName(level.upper()) if level else None
+    for entry in entries:
+        if nodeid and nodeid not in (entry.get("nodeid") or ""):
+            continue
+        if worker and entry.get("worker") != worker:
+            continue
+        if isinstance(min_level, int) and logging.getLevelName(entry.get("level", "NOTSET")) < min_level:
+            continue
+        yield entry
+
+
+def format_text(entry: Dict[str, Any]) -> str:
+    elapsed = entry.get("elapsed_ms")
+    elapsed = f"{elapsed:>9.1f}ms" if isinstance(elapsed, (int, float)) else " " * 11
+    browser = f" [{entry['browser_type']}]" if entry.get("browser_type") else ""
+    line = (f"{entry.get('time', '')} {entry.get('worker') or '-':<6} {entry.get('level', ''):<8} {elapsed} "
+            f"{entry.get('nodeid') or '-'}{browser} - {entry.get('message', '')}")
+    if entry.get("exc"):
+        line += f"\n{entry['exc']}"
+    return line
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Merge the per-worker JSON-lines logs of a --log-jsonl run.")
+    parser.add_argument("run_dir", nargs="?", help=f"Run directory (default: the latest under {LOG_JSONL_DIR})")
+    parser.add_argument("-o", "--output", help="Write to this file instead of stdout")
+    parser.add_argument("--nodeid", help="Only entries whose nodeid contains this text")
+    parser.add_argument("--worker", help="Only entries from this worker, e.g. gw0")
+    parser.add_argument("--level", help="Only entries at or above this level, e.g. WARNING")
+    parser.add_argument("--text", action="store_true", help="Write readable lines instead of JSON lines")
+    args = parser.parse_args(argv)
+
+    run_dir = args.run_dir or latest_run_dir()
+    if not run_dir or not os.path.isdir(run_dir):
+        print(f"No --log-jsonl run found ({run_dir or LOG_JSONL_DIR})", file=sys.stderr)
+        return 1
+    paths = sorted(os.path.join(run_dir, name) for name in os.listdir(run_dir) if name.endswith(".jsonl"))
+
+    entries = filter_entries(merge_entries(paths), nodeid=args.nodeid, worker=args.worker, level=args.level)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        count = 0
+        for entry in entries:
+            out.write((format_text(entry) if args.text else json.dumps(entry)) + "\n")
+            count += 1
+    finally:
+        if args.output:
+            out.close()
+    print(f"Merged {count} entries from {len(paths)} file(s) in {run_dir}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
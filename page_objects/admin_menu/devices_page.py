@@ -210,12 +210,10 @@ class DevicesPage(BasePage):
     
     def get_device_by_name(self, name):
         """ Find a device in the table by name. """
-        rows = self.get_devices_table_rows()
-        for i in range(rows.count()):
-            name_cell = rows.nth(i).locator("td").first
-            if name_cell.inner_text() == name:
-                return rows.nth(i)
-        return None
+        row = self.get_table_snapshot().find_row(name)
+        if row is None:
+            return None
+        return self.get_devices_table_rows().nth(row.index)
 
     # Check Page Element presence
     def verify_page_title_present(self):
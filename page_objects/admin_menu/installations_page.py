@@ -72,12 +72,10 @@ class InstallationsPage(BasePage):
     
     def get_installation_by_name(self, name):
         """ Find an installation in the table by name. """
-        rows = self.get_installations_table_rows()
-        for i in range(rows.count()):
-            name_cell = rows.nth(i).locator("td").first
-            if name_cell.inner_text() == name:
-                return rows.nth(i)
-        return None
+        row = self.get_table_snapshot().find_row(name)
+        if row is None:
+            return None
+        return self.get_installations_table_rows().nth(row.index)
     
     # Installations Pagination Elements
     def get_installations_count_text(self):
@@ -69,12 +69,10 @@ class OrganizationsPage(BasePage):
     
     def get_organization_by_name(self, name):
         """ Find an organization in the table by name. """
-        rows = self.get_organization_table_rows()
-        for i in range(rows.count()):
-            name_cell = rows.nth(i).locator("td").first
-            if name_cell.inner_text() == name:
-                return rows.nth(i)
-        return None
+        row = self.get_table_snapshot().find_row(name)
+        if row is None:
+            return None
+        return self.get_organization_table_rows().nth(row.index)
     
     # Organizations Pagination Elements
     def get_organizations_count_text(self):
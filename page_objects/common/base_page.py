@@ -1,11 +1,197 @@
 #base_page.py (Playwright version)
 import os
 import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict as DICT, Tuple, Optional
-from utilities.config import DEFAULT_TIMEOUT, SCREENSHOT_DIR, PAGE_SIZE
+from typing import List, Dict as DICT, Tuple, Optional, Union
+from utilities.config import (
+    DEFAULT_TIMEOUT, SCREENSHOT_DIR, PAGE_SIZE,
+    PAGINATION_PROBE_TIMEOUT_MS, PAGINATION_SETTLE_MS, UI_POLL_INTERVAL_MS,
+)
 from utilities.utils import logger
 
+# Runs in the browser: reads every row, its cells and attributes, plus the
+# column headers, and returns them as plain JSON in one round trip.
+TABLE_SNAPSHOT_SCRIPT = """
+([rowSelector, cellSelector, headerSelector]) => {
+    const text = (el) => el.innerText ?? el.textContent ?? "";
+    const headers = headerSelector
+        ? Array.from(document.querySelectorAll(headerSelector), text)
+        : [];
+    const rows = Array.from(document.querySelectorAll(rowSelector), (row) => ({
+        cells: Array.from(row.querySelectorAll(cellSelector), text),
+        attributes: Object.fromEntries(Array.from(row.attributes, (a) => [a.name, a.value])),
+    }));
+    return { headers, rows };
+}
+"""
+
+# Runs in the browser: mirrors the pagination getters on BasePage and reports
+# each control's presence, visibility and disabled markers, plus the
+# "Showing X to Y of Z" text, in one round trip.
+PAGINATION_PROBE_SCRIPT = """
+() => {
+    const byRoleName = (name) => Array.from(document.querySelectorAll("button, [role='button']"))
+        .filter((el) => (el.getAttribute("aria-label") || el.innerText || "").toLowerCase().includes(name.toLowerCase()));
+    // Like get_by_text: the innermost elements whose text contains "Showing"
+    const byText = (text) => Array.from(document.body.querySelectorAll("*"))
+        .filter((el) => (el.textContent || "").includes(text)
+            && !Array.from(el.children).some((child) => (child.textContent || "").includes(text)));
+    const isVisible = (el) => {
+        const rect = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== "hidden";
+    };
+    const describe = (elements) => {
+        const el = elements[0];
+        return el ? {
+            count: elements.length,
+            visible: isVisible(el),
+            ariaDisabled: el.getAttribute("aria-disabled"),
+            disabled: el.getAttribute("disabled"),
+            className: typeof el.className === "string" ? el.className : "",
+        } : { count: 0 };
+    };
+    const showing = byText("Showing");
+    return {
+        showingText: showing.length ? showing[0].innerText : null,
+        controls: {
+            "Previous Page": describe(byRoleName("Previous page")),
+            "Next Page": describe(byRoleName("Next page")),
+            "Current Page": describe(Array.from(document.querySelectorAll("[aria-current='page']"))),
+            "Foward Ellipsis": describe(byRoleName("Jump forward")),
+            "Backward Ellipsis": describe(byRoleName("Jump backward")),
+            "Showing Count": describe(showing),
+        },
+    };
+}
+"""
+
+
+@dataclass(frozen=True)
+class PaginationControlState:
+    """
+    State of one pagination control as seen by PAGINATION_PROBE_SCRIPT.
+
+    Attributes:
+        present: Whether the control is in the DOM.
+        visible: Whether it has a size and is not visibility:hidden.
+        aria_disabled: Value of aria-disabled, or None.
+        disabled_attribute: Value of the disabled attribute, or None.
+        css_classes: The element's class attribute.
+    """
+    present: bool
+    visible: bool = False
+    aria_disabled: Optional[str] = None
+    disabled_attribute: Optional[str] = None
+    css_classes: str = ""
+
+    @property
+    def functional(self) -> bool:
+        """Visible and not disabled by aria-disabled, the disabled attribute or a CSS class."""
+        has_disabled_class = any(
+            disabled_word in self.css_classes.lower()
+            for disabled_word in ["disabled", "inactive", "unavailable"]
+        )
+        return self.visible and not (
+            self.aria_disabled == "true" or self.disabled_attribute is not None or has_disabled_class
+        )
+
+
+@dataclass(frozen=True)
+class PaginationState:
+    """
+    Pagination controls and "Showing X to Y of Z" counts read in one round trip
+    by BasePage.probe_pagination_state.
+    """
+    showing_text: Optional[str]
+    controls: DICT[str, PaginationControlState]
+
+    @property
+    def counts(self) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """(start, end, total) parsed from the showing text, or (None, None, None)."""
+        match = re.search(r'Showing\s+(\d+)\s+to\s+(\d+)\s+of\s+(\d+)', self.showing_text or "")
+        if not match:
+            return None, None, None
+        return int(match.group(1)), int(match.group(2)), int(match.group(3))
+
+
+@dataclass(frozen=True)
+class TableRow:
+    """
+    One row of a TableSnapshot.
+
+    Attributes:
+        index: Position of the row in the table (usable with rows.nth(index)).
+        cells: Text of each cell, in column order.
+        attributes: HTML attributes of the row element (class, data-*, aria-*).
+        headers: Column headers of the table, shared with the snapshot.
+    """
+    index: int
+    cells: Tuple[str, ...]
+    attributes: DICT[str, str]
+    headers: Tuple[str, ...] = ()
+
+    def cell(self, column: Union[int, str] = 0) -> Optional[str]:
+        """
+        Get a cell's text by column index or header text.
+
+        Args:
+            column: Column index, or header text (case-insensitive).
+
+        Returns:
+            str: The cell text, or None if the column does not exist in this row.
+        """
+        if isinstance(column, str):
+            lowered = [header.strip().lower() for header in self.headers]
+            if column.strip().lower() not in lowered:
+                return None
+            column = lowered.index(column.strip().lower())
+        return self.cells[column] if 0 <= column < len(self.cells) else None
+
+
+@dataclass(frozen=True)
+class TableSnapshot:
+    """
+    In-memory copy of a table (or any repeated row/card layout) read in a
+    single browser round trip by BasePage.get_table_snapshot.
+    """
+    headers: Tuple[str, ...]
+    rows: Tuple[TableRow, ...]
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows)
+
+    def column_values(self, column: Union[int, str] = 0) -> List[str]:
+        """
+        Get one column's text from every row that has it.
+
+        Args:
+            column: Column index, or header text (case-insensitive).
+
+        Returns:
+            List[str]: The column's values in row order.
+        """
+        values = (row.cell(column) for row in self.rows)
+        return [value for value in values if value is not None]
+
+    def find_row(self, value: str, column: Union[int, str] = 0) -> Optional[TableRow]:
+        """
+        Find the first row whose cell in column equals value exactly.
+
+        Args:
+            value: Text to match.
+            column: Column index, or header text (case-insensitive).
+
+        Returns:
+            TableRow: The matching row, or None if no row matches.
+        """
+        for row in self.rows:
+            if row.cell(column) == value:
+                return row
+        return None
+
 
 class BasePage:
     """Base class for all page objects using Playwright"""
@@ -239,6 +425,88 @@ class BasePage:
             self.logger.warning("Showing count element not found")
             return None, None, None
         
+    def get_table_snapshot(self, row_selector: str = "table tbody tr", cell_selector: str = "td",
+                           header_selector: Optional[str] = "table thead th") -> TableSnapshot:
+        """
+        Read a whole table into memory with a single evaluate() call.
+
+        Looping rows.nth(i).locator("td").inner_text() costs one browser round
+        trip per cell. This reads every row once, so name lookups, counts and
+        value lists can run against the returned snapshot instead. Selectors are
+        plain CSS (document.querySelectorAll), not Playwright selector syntax.
+
+        Args:
+            row_selector (str): CSS selector matching each row (or card).
+            cell_selector (str): CSS selector, relative to a row, matching its cells.
+            header_selector (str, optional): CSS selector matching the column headers, or None.
+
+        Returns:
+            TableSnapshot: The rows, cells, row attributes and headers. Empty if nothing matched.
+
+        Example:
+            >>> snapshot = self.get_table_snapshot()
+            >>> names = snapshot.column_values(0)
+        """
+        data = self.page.evaluate(TABLE_SNAPSHOT_SCRIPT, [row_selector, cell_selector, header_selector])
+        headers = tuple(data["headers"])
+        rows = tuple(
+            TableRow(index=i, cells=tuple(row["cells"]), attributes=row["attributes"], headers=headers)
+            for i, row in enumerate(data["rows"])
+        )
+        self.logger.debug(f"Table snapshot of '{row_selector}': {len(rows)} row(s), {len(headers)} header(s)")
+        return TableSnapshot(headers=headers, rows=rows)
+
+    def probe_pagination_state(self, wait_for_stable: bool = True) -> PaginationState:
+        """
+        Read every pagination control and the showing count with one evaluate() call.
+
+        With wait_for_stable, the probe is repeated until the showing text has
+        been present and unchanged for PAGINATION_SETTLE_MS. If it never
+        appears, the probe gives up after PAGINATION_PROBE_TIMEOUT_MS (e.g. a
+        page with no records) and returns the last state seen.
+
+        Args:
+            wait_for_stable (bool): Wait for the showing text to settle first.
+
+        Returns:
+            PaginationState: Control states keyed by element name, plus the showing text.
+        """
+        state = self._read_pagination_state()
+        if not wait_for_stable:
+            return state
+
+        start_time = datetime.now()
+        stable_since = start_time
+        while True:
+            elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
+            stable_ms = (datetime.now() - stable_since).total_seconds() * 1000
+            if state.showing_text is not None and stable_ms >= PAGINATION_SETTLE_MS:
+                break
+            if elapsed_ms >= PAGINATION_PROBE_TIMEOUT_MS:
+                self.logger.info(f"Showing count did not settle within {PAGINATION_PROBE_TIMEOUT_MS}ms")
+                break
+            self.page.wait_for_timeout(UI_POLL_INTERVAL_MS)
+            new_state = self._read_pagination_state()
+            if new_state.showing_text != state.showing_text:
+                stable_since = datetime.now()
+            state = new_state
+        return state
+
+    def _read_pagination_state(self) -> PaginationState:
+        """Run PAGINATION_PROBE_SCRIPT once and wrap the result."""
+        data = self.page.evaluate(PAGINATION_PROBE_SCRIPT)
+        controls = {
+            name: PaginationControlState(
+                present=control["count"] > 0,
+                visible=control.get("visible", False),
+                aria_disabled=control.get("ariaDisabled"),
+                disabled_attribute=control.get("disabled"),
+                css_classes=control.get("className") or "",
+            )
+            for name, control in data["controls"].items()
+        }
+        return PaginationState(showing_text=data["showingText"], controls=controls)
+
     def verify_navigation_updates_page(self, action, expected_page=None) -> bool:
         """
         Verify that the navigation action updates the page correctly.
@@ -479,25 +747,22 @@ class BasePage:
         showing_element_exists = False
         
         try:
-            self.page.wait_for_timeout(3000)
-            showing_element = self.get_showing_count()
-            if showing_element.count() > 0:
+            # One probe reads every control; it waits for the showing count to settle
+            state = self.probe_pagination_state()
+            if state.controls["Showing Count"].present:
                 showing_element_exists = True
-                showing_text = showing_element.inner_text()
-                
-                # Parse "Showing x to y of z" format to understand current pagination state
-                match = re.search(r'Showing\s+(\d+)\s+to\s+(\d+)\s+of\s+(\d+)', showing_text)
-                if match:
-                    current_start = int(match.group(1))
-                    current_end = int(match.group(2))
-                    total_records = int(match.group(3))
+                start, end, total = state.counts
+                if total is not None:
+                    current_start, current_end, total_records = start, end, total
                     self.logger.info(f"Pagination state: {current_start} to {current_end} of {total_records}")
                 else:
-                    self.logger.warning(f"Could not parse showing text: {showing_text}")
+                    self.logger.warning(f"Could not parse showing text: {state.showing_text}")
             else:
                 self.logger.info("No showing count element - likely no records to display")
         except Exception as e:
             self.logger.error(f"Error getting pagination info: {str(e)}")
+            self.logger.error("Cannot check pagination elements without a pagination probe")
+            return False, ["Pagination Probe"]
         
         # Calculate pagination state based on your business rules
         is_first_page = (current_start == 1)
@@ -514,16 +779,6 @@ class BasePage:
         self.logger.info(f"  - Is last page: {is_last_page}")
         self.logger.info(f"  - Has multiple pages: {has_multiple_pages}")
         
-        # Define pagination element getters
-        pagination_element_getters = {
-            "Previous Page": self.get_previous_page_button,
-            "Next Page": self.get_next_page_button,
-            "Current Page": self.get_current_page_button,
-            "Foward Ellipsis": self.get_FW_break_ellipsis_button,
-            "Backward Ellipsis": self.get_BW_break_ellipsis_button,
-            "Showing Count": self.get_showing_count
-        }
-        
         # Define when each element should be functionally available based on your business rules
         should_be_functional = {
             # Previous/Next buttons should be functional when there are multiple pages
@@ -544,106 +799,40 @@ class BasePage:
             "Backward Ellipsis": (total_pages > 3 and current_page_number >= 4)
         }
         
-        # Check each pagination element
-        for element_name, element_getter in pagination_element_getters.items():
-            element_should_be_functional = should_be_functional[element_name]
+        # Check each pagination element against the probed state
+        for element_name, element_should_be_functional in should_be_functional.items():
+            control = state.controls[element_name]
             
-            try:
-                # Get the element locator
-                locator = element_getter()
-                is_present_in_dom = locator.count() > 0
-                
-                if not is_present_in_dom:
-                    # Element not in DOM at all - this might be acceptable depending on implementation
-                    if element_should_be_functional:
-                        self.logger.error(f"Element {element_name} should be functional but is not present in DOM")
-                        all_elements_correct = False
-                        issues_found.append(element_name)
-                        self.take_screenshot(f"{element_name}_missing_from_dom")
-                    else:
-                        self.logger.info(f"Element {element_name} correctly absent from DOM")
-                    continue
-                
-                # Element is present in DOM, now check if it's functionally available
-                is_functionally_available = self._is_element_functionally_available(
-                    locator, element_name
-                )
-                
-                # Compare expected vs actual functional state
-                if is_functionally_available != element_should_be_functional:
-                    expected_state = "functional" if element_should_be_functional else "disabled/hidden"
-                    actual_state = "functional" if is_functionally_available else "disabled/hidden"
-                    
-                    self.logger.error(f"Element {element_name} should be {expected_state} but is {actual_state}")
+            if not control.present:
+                # Element not in DOM at all - this might be acceptable depending on implementation
+                if element_should_be_functional:
+                    self.logger.error(f"Element {element_name} should be functional but is not present in DOM")
                     all_elements_correct = False
                     issues_found.append(element_name)
-                    self.take_screenshot(f"{element_name}_unexpected_functional_state")
+                    self.take_screenshot(f"{element_name}_missing_from_dom")
                 else:
-                    correct_state = "functional" if is_functionally_available else "properly disabled/hidden"
-                    self.logger.info(f"Element {element_name} is correctly {correct_state}")
-                    
-            except Exception as e:
-                self.logger.error(f"Error checking pagination element {element_name}: {str(e)}")
+                    self.logger.info(f"Element {element_name} correctly absent from DOM")
+                continue
+            
+            # Element is present in DOM, now check if it's functionally available
+            is_functionally_available = control.functional
+            self.logger.debug(f"Element {element_name} functional analysis: {control}")
+            
+            # Compare expected vs actual functional state
+            if is_functionally_available != element_should_be_functional:
+                expected_state = "functional" if element_should_be_functional else "disabled/hidden"
+                actual_state = "functional" if is_functionally_available else "disabled/hidden"
+                
+                self.logger.error(f"Element {element_name} should be {expected_state} but is {actual_state}")
                 all_elements_correct = False
                 issues_found.append(element_name)
+                self.take_screenshot(f"{element_name}_unexpected_functional_state")
+            else:
+                correct_state = "functional" if is_functionally_available else "properly disabled/hidden"
+                self.logger.info(f"Element {element_name} is correctly {correct_state}")
         
         return all_elements_correct, issues_found
 
-    def _is_element_functionally_available(self, locator, element_name: str) -> bool:
-        """
-        Helper method to determine if an element is functionally available to the user.
-        
-        An element is considered functionally available if it is:
-        1. Visible on the page
-        2. Not disabled through various disability mechanisms (aria-disabled, disabled attribute, CSS classes)
-        3. Potentially clickable (for interactive elements)
-        
-        Args:
-            locator: Playwright locator for the element
-            element_name: Name of the element for logging purposes
-            
-        Returns:
-            bool: True if element is functionally available, False otherwise
-        """
-        try:
-            # Check if element is visible to the user
-            is_visible = locator.is_visible()
-            if not is_visible:
-                self.logger.debug(f"Element {element_name} is not visible")
-                return False
-            
-            # Check various disability indicators
-            aria_disabled = locator.get_attribute("aria-disabled")
-            is_aria_disabled = aria_disabled == "true"
-            
-            disabled_attribute = locator.get_attribute("disabled")
-            is_disabled_attribute = disabled_attribute is not None
-            
-            css_classes = locator.get_attribute("class") or ""
-            has_disabled_class = any(
-                disabled_word in css_classes.lower() 
-                for disabled_word in ["disabled", "inactive", "unavailable"]
-            )
-            
-            # Element is functional if it's visible and not disabled by any mechanism
-            is_functional = is_visible and not (is_aria_disabled or is_disabled_attribute or has_disabled_class)
-            
-            # Log detailed state for debugging purposes
-            self.logger.debug(f"Element {element_name} functional analysis:")
-            self.logger.debug(f"  - Visible: {is_visible}")
-            self.logger.debug(f"  - aria-disabled: {aria_disabled}")
-            self.logger.debug(f"  - disabled attribute: {disabled_attribute}")
-            self.logger.debug(f"  - CSS classes: {css_classes}")
-            self.logger.debug(f"  - Final functional state: {is_functional}")
-            
-            return is_functional
-            
-        except Exception as e:
-            self.logger.error(f"Error checking functional availability of {element_name}: {str(e)}")
-            # If we can't determine the state, assume it's not functional to be safe
-            return False
-    
-
     # Basic methods
     def find_logo(self) -> bool:
         """
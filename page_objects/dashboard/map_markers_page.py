@@ -77,12 +77,10 @@ class MapMarkersPage(BasePage):
     
     def get_map_marker_by_name(self, name):
         """Find a map marker in the table by name."""
-        rows = self.get_map_markers_table_rows()
-        for i in range(rows.count()):
-            name_cell = rows.nth(i).locator("td").nth(1)  # Name is usually the second column
-            if name_cell.inner_text() == name:
-                return rows.nth(i)
-        return None
+        row = self.get_table_snapshot().find_row(name, column=1)  # Name is usually the second column
+        if row is None:
+            return None
+        return self.get_map_markers_table_rows().nth(row.index)
     
     # Map Markers Pagination Elements
     def get_map_markers_count_text(self):
@@ -227,21 +225,9 @@ class MapMarkersPage(BasePage):
             List[str]: A list of map marker names, or empty list if none found
         """
         self.logger.info("Getting the names of all map markers in the table on current page")
-        marker_names = []
         try:
-            rows = self.get_map_markers_table_rows()
-            rows_count = rows.count()
-            
-            for i in range(rows_count):
-                try:
-                    # Get the name cell (usually second column) from each row
-                    name_cell = rows.nth(i).locator("td").nth(1)
-                    marker_name = name_cell.inner_text()
-                    marker_names.append(marker_name)
-                    self.logger.info(f"Found {len(marker_names)} map marker names")
-                except Exception as row_error:
-                    self.logger.error(f"An error occurred while trying to get the map marker name from row {i}: {str(row_error)}")
-                    continue
+            # The name is usually the second column
+            marker_names = self.get_table_snapshot().column_values(1)
             self.logger.info(f"Found a total of {len(marker_names)} map marker names")
             return marker_names
         except Exception as e:
@@ -81,12 +81,10 @@ class SpeciesPage(BasePage):
     
     def get_species_by_name(self, name):
         """ Find a species in the table by name. """
-        rows = self.get_species_table_rows()
-        for i in range(rows.count()):
-            name_cell = rows.nth(i).locator("td").nth(0)
-            if name_cell.inner_text() == name:
-                return rows.nth(i)
-        return None
+        row = self.get_table_snapshot().find_row(name)
+        if row is None:
+            return None
+        return self.get_species_table_rows().nth(row.index)
     
     # Species Pagination Elements
     def get_species_count_text(self):
@@ -220,21 +218,9 @@ class SpeciesPage(BasePage):
             List[str]: A list of species names, or empty list if none found
         """
         self.logger.info("Getting the names of all species in the table on current page")
-        species_names = []
         try:
-            rows = self.get_species_table_rows()
-            rows_count = rows.count()
-            
-            for i in range(rows_count):
-                try:
-                    # Get the first cell (species name) from each row
-                    name_cell = rows.nth(i).locator("td").first
-                    species_name = name_cell.inner_text()
-                    species_names.append(species_name)
-                    self.logger.info(f"Found {len(species_names)} species names")
-                except Exception as row_error:
-                    self.logger.error(f"An error occurred while trying to get the species name from row {i}: {str(row_error)}")
-                    continue
+            # The first cell of each row is the species name
+            species_names = self.get_table_snapshot().column_values(0)
             self.logger.info(f"Found a total of {len(species_names)} species names")
             return species_names
         except Exception as e:
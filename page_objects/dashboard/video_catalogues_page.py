@@ -72,12 +72,10 @@ class VideoCataloguesPage(BasePage):
     
     def get_video_catalogue_by_name(self, name):
         """ Find a video catalogue in the table by name. """
-        rows = self.get_video_catalogues_table_rows()
-        for i in range(rows.count()):
-            name_cell = rows.nth(i).locator("td").nth(0)
-            if name_cell.inner_text() == name:
-                return rows.nth(i)
-        return None
+        row = self.get_table_snapshot().find_row(name)
+        if row is None:
+            return None
+        return self.get_video_catalogues_table_rows().nth(row.index)
     
     # Video Catalogues Pagination Elements
     def get_video_catalogues_count_text(self):
@@ -362,21 +360,9 @@ class VideoCataloguesPage(BasePage):
             List[str]: A list of video catalogue names, or empty list if none found
         """
         self.logger.info("Getting the names of all video catalogues in the table on current page")
-        catalogue_names = []
         try:
-            rows = self.get_video_catalogues_table_rows()
-            rows_count = rows.count()
-            
-            for i in range(rows_count):
-                try:
-                    # Get the first cell (catalogue name) from each row
-                    name_cell = rows.nth(i).locator("td").first
-                    catalogue_name = name_cell.inner_text()
-                    catalogue_names.append(catalogue_name)
-                    self.logger.info(f"Found {len(catalogue_names)} video catalogue names")
-                except Exception as row_error:
-                    self.logger.error(f"An error occurred while trying to get the video catalogue name from row {i}: {str(row_error)}")
-                    continue
+            # The first cell of each row is the catalogue name
+            catalogue_names = self.get_table_snapshot().column_values(0)
             self.logger.info(f"Found a total of {len(catalogue_names)} video catalogue names")
             return catalogue_names
         except Exception as e:
@@ -531,19 +531,10 @@ class VideosPage(BasePage):
             List[str]: A list of video names, or an empty list if none found.
         """
         self.logger.info("Getting the names of all videos in the grid on the current page")
-        video_names = []
         try:
-            name_elements = self.get_video_card_names()
-            count = name_elements.count()
-
-            for i in range(count):
-                try:
-                    video_name = name_elements.nth(i).inner_text()
-                    video_names.append(video_name)
-                    self.logger.debug(f"Found video name: '{video_name}'")
-                except Exception as row_error:
-                    self.logger.error(f"Error getting video name at index {i}: {str(row_error)}")
-                    continue
+            # Each video card is a "row" whose h2 holds the video name
+            snapshot = self.get_table_snapshot(row_selector="div.group", cell_selector="h2", header_selector=None)
+            video_names = snapshot.column_values(0)
 
             self.logger.info(f"Found a total of {len(video_names)} video names")
             return video_names
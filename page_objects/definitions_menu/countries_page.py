@@ -52,12 +52,10 @@ class CountriesPage(BasePage):
         Returns:
             Locator: The row containing the country, or None if not found
         """
-        rows = self.get_countries_table_rows()
-        for i in range(rows.count()):
-            name_cell = rows.nth(i).locator("td").first
-            if name_cell.inner_text() == name:
-                return rows.nth(i)
-        return None
+        row = self.get_table_snapshot().find_row(name)
+        if row is None:
+            return None
+        return self.get_countries_table_rows().nth(row.index)
         
     # Check Page Element presence
     def verify_page_title_present(self) -> bool:
@@ -138,21 +136,9 @@ class CountriesPage(BasePage):
             List[str]: A list of country names, or empty list if none found
         """
         self.logger.info("Getting the names of all countries in the table on current page")
-        country_names = []
         try:
-            rows = self.get_countries_table_rows()
-            rows_count = rows.count()
-            
-            for i in range(rows_count):
-                try:
-                    # Get the first cell (country name) from each row
-                    name_cell = rows.nth(i).locator("td").first
-                    country_name = name_cell.inner_text()
-                    country_names.append(country_name)
-                    self.logger.info(f"Found {len(country_names)} country names")
-                except Exception as row_error:
-                    self.logger.error(f"An error occurred while trying to get the country name from row {i}: {str(row_error)}")
-                    continue
+            # The first cell of each row is the country name
+            country_names = self.get_table_snapshot().column_values(0)
             self.logger.info(f"Found a total of {len(country_names)} country names")
             return country_names
         except Exception as e:
@@ -76,12 +76,10 @@ class IUCNStatusPage(BasePage):
         Returns:
             Locator: The row containing the iucn status, or None if not found
         """
-        rows = self.get_iucn_status_table_rows()
-        for i in range(rows.count()):
-            name_cell = rows.nth(i).locator("td").first
-            if name_cell.inner_text() == name:
-                return rows.nth(i)
-        return None
+        row = self.get_table_snapshot().find_row(name)
+        if row is None:
+            return None
+        return self.get_iucn_status_table_rows().nth(row.index)
         
     # Check Page Element Presence
     
@@ -170,21 +168,9 @@ class IUCNStatusPage(BasePage):
             List[str]: A list of IUCN status names, or empty list if none found
         """
         self.logger.info("Getting the names of all IUCN statuses in the table on current page")
-        iucn_status_names = []
         try:
-            rows = self.get_iucn_status_table_rows()
-            rows_count = rows.count()
-            
-            for i in range(rows_count):
-                try:
-                    # Get the first cell (IUCN status name) from each row
-                    name_cell = rows.nth(i).locator("td").first
-                    iucn_status_name = name_cell.inner_text()
-                    iucn_status_names.append(iucn_status_name)
-                    self.logger.info(f"Found {len(iucn_status_names)} IUCN status names")
-                except Exception as row_error:
-                    self.logger.error(f"An error occurred while trying to get the IUCN status name from row {i}: {str(row_error)}")
-                    continue
+            # The first cell of each row is the IUCN status name
+            iucn_status_names = self.get_table_snapshot().column_values(0)
             self.logger.info(f"Found a total of {len(iucn_status_names)} IUCN status names")
             return iucn_status_names
         except Exception as e:
@@ -67,12 +67,10 @@ class PopulationTrendPage(BasePage):
         Returns:
             Locator: The row containing the population trend, or None if not found
         """
-        rows = self.get_population_trend_table_rows()
-        for i in range(rows.count()):
-            name_cell = rows.nth(i).locator("td").first
-            if name_cell.inner_text() == name:
-                return rows.nth(i)
-        return None
+        row = self.get_table_snapshot().find_row(name)
+        if row is None:
+            return None
+        return self.get_population_trend_table_rows().nth(row.index)
         
     # Check Page Element presence
     def verify_population_trend_page_title_present(self):
@@ -158,21 +156,9 @@ class PopulationTrendPage(BasePage):
             List[str]: A list of population trend names, or empty list if none found
         """
         self.logger.info("Getting the names of all population trends in the table on current page")
-        population_trend_names = []
         try:
-            rows = self.get_population_trend_table_rows()
-            rows_count = rows.count()
-            
-            for i in range(rows_count):
-                try:
-                    # Get the first cell (population trend name) from each row
-                    name_cell = rows.nth(i).locator("td").first
-                    population_trend_name = name_cell.inner_text()
-                    population_trend_names.append(population_trend_name)
-                    self.logger.info(f"Found {len(population_trend_names)} population trend names")
-                except Exception as row_error:
-                    self.logger.error(f"An error occurred while trying to get the population trend name from row {i}: {str(row_error)}")
-                    continue
+            # The first cell of each row is the population trend name
+            population_trend_names = self.get_table_snapshot().column_values(0)
             self.logger.info(f"Found a total of {len(population_trend_names)} population trend names")
             return population_trend_names
         except Exception as e:
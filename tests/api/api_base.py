@@ -5,14 +5,17 @@ from urllib.parse import urljoin
 from dotenv import load_dotenv
 from api_test_context import APITestContext
 from utilities.utils import logger
-from utilities.auth import get_auth_token
+from utilities.auth import get_auth_token, refresh_auth_token, get_token_for_user, refresh_token_for_user
+from utilities.http_session import get_session, identity_for_token, DEFAULT_IDENTITY
+from utilities.api_cassette import CassetteStore
+from utilities.perf_baseline import EndpointTimings
 
 load_dotenv()
 
 API_BASE_URL = os.getenv("API_BASE_URL")
 
 class APIBase:
-    def __init__(self, token: str = None):
+    def __init__(self, token: str = None, identity: str = None):
         """
         Initialize APIBase with an optional pre-fetched authentication token.
 
@@ -22,18 +25,53 @@ class APIBase:
                    you need to authenticate as a specific user account (e.g., an
                    org-admin in authorization tests). If None, the shared system
                    admin token is used (see utilities/auth.py get_auth_token()).
+            identity: Key for the pooled HTTP session (see utilities/http_session.py).
+                   Defaults to the system admin identity when no token is passed,
+                   otherwise to a fingerprint of the given token.
         """
         self.base_url = API_BASE_URL
         self.context = APITestContext()
         self.token = token if token is not None else get_auth_token()
+        # Only the shared system admin token can be refreshed on a 401 — a token
+        # passed in by the caller belongs to an account this class has no credentials for.
+        self.uses_shared_token = token is None
+        # Set by for_user(); lets a pooled per-user token be refreshed on a 401 as well
+        self.user_credentials = None
+        if identity is None:
+            identity = DEFAULT_IDENTITY if token is None else identity_for_token(token)
+        self.identity = identity
+        # Pooled keep-alive session shared by every APIBase with the same identity
+        self.session = get_session(identity)
         logger.html_logger.set_context(self.context)
         
-    def get_headers(self, auth_type='valid'):
+    @classmethod
+    def for_user(cls, username: str, password: str) -> 'APIBase':
+        """
+        Create an APIBase authenticated as a specific user through the token pool.
+
+        The token comes from utilities/auth.py TokenPool (cached per username and
+        pre-seeded on xdist workers), the pooled HTTP session is keyed by the
+        username, and a 401 on a 'valid' request refreshes this user's token
+        once and retries — the same as for the shared system admin token.
+
+        Args:
+            username: The user's login username.
+            password: The user's login password.
+
+        Returns:
+            APIBase: An instance whose requests are made as that user.
+        """
+        api = cls(token=get_token_for_user(username, password), identity=username)
+        api.user_credentials = (username, password)
+        return api
+
+    def get_headers(self, auth_type='valid', token=None):
         """
         Get headers for API requests.
         
         Args:
             auth_type (str, optional): Type of authentication ('valid', 'invalid', or 'none'). Defaults to 'valid'.
+            token (str, optional): Token for 'valid' requests. Defaults to self.token.
 
         Returns:
             dict: Headers for the API request
@@ -43,7 +81,7 @@ class APIBase:
             "Content-Type": "application/json"
         }
         if auth_type == 'valid':
-            base_headers["Authorization"] = f"Bearer {self.token}"
+            base_headers["Authorization"] = f"Bearer {token or self.token}"
         if auth_type == 'invalid':
             base_headers["Authorization"] = "Bearer invalid_token"
         # For auth_type == 'none', no Authorization header is added
@@ -59,30 +97,10 @@ class APIBase:
     #     return self.get_headers('none')
         
     def get(self, endpoint, auth_type='valid', params=None):
-        url = f"{self.base_url}{endpoint}"
-        headers = self.get_headers(auth_type)
-        self.context.set_current_request("GET", url, headers, params)
-        logger.info(f"Sending GET request to {url}")
-        
-        response = requests.get(url, headers=headers, params=params)
-        
-        self.context.set_current_response(response.status_code, response.headers, response.text)
-        logger.info(f"Received response with status code {response.status_code}")
-
-        return response
+        return self._send("GET", endpoint, auth_type, params=params)
     
     def post(self, endpoint, auth_type='valid', params=None, body=None):
-        url = f"{self.base_url}{endpoint}"
-        headers = self.get_headers(auth_type)
-        self.context.set_current_request("POST", url, headers, params=params, body=body)
-        logger.info(f"Sending POST request to {url}")
-        
-        response = requests.post(url, headers=headers, params=params, json=body)
-        
-        self.context.set_current_response(response.status_code, response.headers, response.text)
-        logger.info(f"Received response with status code {response.status_code}")
-        
-        return response
+        return self._send("POST", endpoint, auth_type, params=params, body=body)
         
     def put(self, endpoint, auth_type='valid', params=None, body=None):
         """
@@ -102,17 +120,7 @@ class APIBase:
         Returns:
             requests.Response: The HTTP response object.
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = self.get_headers(auth_type)
-        self.context.set_current_request("PUT", url, headers, params=params, body=body)
-        logger.info(f"Sending PUT request to {url}")
-
-        response = requests.put(url, headers=headers, params=params, json=body)
-
-        self.context.set_current_response(response.status_code, response.headers, response.text)
-        logger.info(f"Received response with status code {response.status_code}")
-
-        return response
+        return self._send("PUT", endpoint, auth_type, params=params, body=body)
 
     def delete(self, endpoint, auth_type='valid', params=None):
         """
@@ -130,16 +138,85 @@ class APIBase:
         Returns:
             requests.Response: The HTTP response object.
         """
-        url = f"{self.base_url}{endpoint}"
-        headers = self.get_headers(auth_type)
-        self.context.set_current_request("DELETE", url, headers, params=params)
-        logger.info(f"Sending DELETE request to {url}")
+        return self._send("DELETE", endpoint, auth_type, params=params)
+
+    def _send(self, method, endpoint, auth_type='valid', params=None, body=None):
+        """
+        Send a request through the pooled session, retrying once on a 401.
 
-        response = requests.delete(url, headers=headers, params=params)
+        When this instance uses the shared system admin token (or a pooled
+        per-user token from for_user), a 401 on a 'valid' request means the token
+        expired or was invalidated mid-run: the token is refreshed (once across
+        all callers, see refresh_auth_token) and the request is sent again. 'invalid' and 'none' requests are never
+        retried — their 401s are what the authorization tests assert on.
+
+        One instance may be shared by a thread pool (PaginatedFetcher,
+        LatencyBenchmark), so the token a request is sent with is kept in a
+        local. The retry names exactly that token as stale, whatever other threads
+        have stored in self.token meanwhile. The request/response context is
+        per thread (see APITestContext).
+
+        The elapsed time of every 2xx response is added to EndpointTimings for
+        the performance baseline (see utilities/perf_baseline.py).
+
+        Args:
+            method (str): HTTP method ('GET', 'POST', 'PUT', 'DELETE').
+            endpoint (str): The API endpoint path.
+            auth_type (str, optional): Authentication type ('valid', 'invalid', 'none'). Defaults to 'valid'.
+            params (dict, optional): Query string parameters. Defaults to None.
+            body (dict, optional): Request body; serialized to JSON. Not sent for GET/DELETE.
+
+        Returns:
+            requests.Response: The HTTP response object.
+        """
+        url = f"{self.base_url}{endpoint}"
+        json_body = body if method in ("POST", "PUT") else None
+        token = self.token
+        if self.uses_shared_token and auth_type == 'valid':
+            # Pick up any token the background refresh has swapped in since __init__
+            token = self.token = get_auth_token()
+
+        headers = self.get_headers(auth_type, token)
+        self.context.set_current_request(method, url, headers, params=params, body=json_body)
+        logger.info(f"Sending {method} request to {url}")
+
+        response = self._request(method, endpoint, url, headers, params, json_body, auth_type)
+
+        if response.status_code == 401 and auth_type == 'valid' and (self.uses_shared_token or self.user_credentials):
+            logger.warning(f"{method} {url} returned 401 with a pooled token; refreshing token and retrying once")
+            if self.uses_shared_token:
+                token = self.token = refresh_auth_token(stale_token=token)
+            else:
+                token = self.token = refresh_token_for_user(*self.user_credentials, stale_token=token)
+            headers = self.get_headers(auth_type, token)
+            self.context.set_current_request(method, url, headers, params=params, body=json_body)
+            response = self._request(method, endpoint, url, headers, params, json_body, auth_type)
 
         self.context.set_current_response(response.status_code, response.headers, response.text)
         logger.info(f"Received response with status code {response.status_code}")
+        if 200 <= response.status_code < 300:
+            EndpointTimings().add(method, endpoint, response.elapsed.total_seconds())
+
+        return response
+
+    def _request(self, method, endpoint, url, headers, params, json_body, auth_type):
+        """
+        Send one request on the pooled session, or go through the cassette
+        store in --api-mode record/replay (see utilities/api_cassette.py).
+
+        Raises:
+            CassetteMissError: In replay mode, if the request was never recorded.
+        """
+        store = CassetteStore()
+        if store.mode == "live":
+            return self.session.request(method, url, headers=headers, params=params, json=json_body)
+
+        key = store.request_key(method, endpoint, params, json_body, auth_type, self.identity)
+        if store.mode == "replay":
+            return store.replay(key, method, url)
 
+        response = self.session.request(method, url, headers=headers, params=params, json=json_body)
+        store.record(key, method, endpoint, response)
         return response
 
     def measure_response_time(self, response):
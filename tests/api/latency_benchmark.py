@@ -0,0 +1,241 @@
+# latency_benchmark.py
+"""
+Latency distribution benchmark for the endpoints in endpoints.json.
+
+test_api_connection_parametrized_valid compares one response.elapsed sample
+with each endpoint's threshold, so one slow or fast request decides the result.
+In benchmark mode (--latency-benchmark), test_api_connection_latency_benchmark
+uses LatencyBenchmark instead. For every endpoint, it:
+
+    - sends LATENCY_BENCHMARK_WARMUP unmeasured requests (pooled connection
+      and token already warm)
+    - sends N measured GET requests on a thread pool of the chosen concurrency
+    - computes p50/p90/p99/max/mean of response.elapsed for the 200 responses,
+      and throughput (200 responses per wall-clock second)
+    - checks the threshold against LATENCY_BENCHMARK_PERCENTILE, not one sample
+
+Endpoints are benchmarked one after another, so each throughput figure belongs
+to a single endpoint. write_artifact() saves the run's settings and per-endpoint
+results to LATENCY_BENCHMARK_DIR/latency_<timestamp>.json.
+
+Percentiles use the nearest-rank method: p99 of 50 samples is the largest one.
+No value is interpolated that was never measured.
+"""
+import json
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from utilities.config import (
+    LATENCY_BENCHMARK_CONCURRENCY,
+    LATENCY_BENCHMARK_DIR,
+    LATENCY_BENCHMARK_PERCENTILE,
+    LATENCY_BENCHMARK_REQUESTS,
+    LATENCY_BENCHMARK_WARMUP,
+)
+from utilities.utils import logger
+from .api_base import APIBase
+
+REPORTED_PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an ascending list.
+
+    Args:
+        sorted_samples: Samples sorted in ascending order.
+        pct: Percentile between 0 and 100.
+
+    Returns:
+        float: The sample at rank ceil(pct/100 * n), or 0.0 for no samples.
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+@dataclass
+class EndpointLatency:
+    """
+    Measured requests for one endpoint.
+
+    Attributes:
+        endpoint: Endpoint path, e.g. '/Videos'.
+        threshold: Threshold in seconds from endpoints.json.
+        samples: response.elapsed of every 200 response, ascending.
+        status_codes: Status code -> number of responses.
+        exceptions: Requests that raised instead of returning a response.
+        wall_seconds: Wall-clock time for all measured requests.
+    """
+    endpoint: str
+    threshold: float
+    samples: List[float] = field(default_factory=list)
+    status_codes: Dict[int, int] = field(default_factory=dict)
+    exceptions: int = 0
+    wall_seconds: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        return sum(self.status_codes.values()) + self.exceptions
+
+    @property
+    def errors(self) -> int:
+        """Requests that did not return 200."""
+        return self.requests - len(self.samples)
+
+    @property
+    def throughput(self) -> float:
+        """200 responses per wall-clock second."""
+        return len(self.samples) / self.wall_seconds if self.wall_seconds else 0.0
+
+    def percentile(self, pct: float) -> float:
+        return percentile(self.samples, pct)
+
+    def check(self, check_percentile: int = LATENCY_BENCHMARK_PERCENTILE) -> Optional[str]:
+        """
+        Failure message, or None if every request returned 200 and the chosen
+        percentile is under the threshold.
+        """
+        if self.errors:
+            return f"{self.endpoint}: {self.errors} of {self.requests} request(s) did not return 200 ({self.status_codes})"
+        value = self.percentile(check_percentile)
+        if value >= self.threshold:
+            return f"{self.endpoint}: p{check_percentile} {value:.3f}s is not under the {self.threshold}s threshold"
+        return None
+
+    def to_dict(self, check_percentile: int = LATENCY_BENCHMARK_PERCENTILE) -> Dict[str, Any]:
+        result = {
+            "endpoint": self.endpoint,
+            "requests": self.requests,
+            "errors": self.errors,
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items())},
+            "exceptions": self.exceptions,
+        }
+        for pct in REPORTED_PERCENTILES:
+            result[f"p{pct}"] = round(self.percentile(pct), 4)
+        result.update({
+            "max": round(self.samples[-1], 4) if self.samples else 0.0,
+            "mean": round(sum(self.samples) / len(self.samples), 4) if self.samples else 0.0,
+            "throughput_rps": round(self.throughput, 2),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "threshold": self.threshold,
+            "passed": self.check(check_percentile) is None,
+        })
+        return result
+
+
+class LatencyBenchmark:
+    """
+    Sends warm, concurrent GET requests per endpoint and collects their latency.
+
+    Example:
+        >>> benchmark = LatencyBenchmark(APIBase(), requests_per_endpoint=100, concurrency=8)
+        >>> results = benchmark.run({"/Videos": 2, "/Device": 2})
+        >>> benchmark.write_artifact(results)
+    """
+
+    def __init__(self, api: APIBase, requests_per_endpoint: int = LATENCY_BENCHMARK_REQUESTS,
+                 concurrency: int = LATENCY_BENCHMARK_CONCURRENCY, warmup: int = LATENCY_BENCHMARK_WARMUP,
+                 check_percentile: int = LATENCY_BENCHMARK_PERCENTILE):
+        """
+        Args:
+            api: APIBase used for every request (valid auth).
+            requests_per_endpoint: Measured requests per endpoint.
+            concurrency: Requests in flight at once.
+            warmup: Unmeasured requests per endpoint, sent one at a time first.
+            check_percentile: Percentile compared with each threshold.
+        """
+        self.api = api
+        self.requests_per_endpoint = max(1, requests_per_endpoint)
+        self.concurrency = max(1, concurrency)
+        self.warmup = max(0, warmup)
+        self.check_percentile = check_percentile
+        self.started_at: Optional[datetime] = None
+
+    def run_endpoint(self, endpoint: str, threshold: float) -> EndpointLatency:
+        """Warm up, then measure one endpoint."""
+        for _ in range(self.warmup):
+            try:
+                self.api.get(endpoint)
+            except Exception as e:
+                logger.warning(f"Warm-up request to {endpoint} failed: {str(e)}")
+
+        def measure(_):
+            try:
+                response = self.api.get(endpoint)
+            except Exception as e:
+                logger.debug(f"Benchmark request to {endpoint} raised: {str(e)}")
+                return None, None
+            return response.status_code, self.api.measure_response_time(response)
+
+        result = EndpointLatency(endpoint=endpoint, threshold=threshold)
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            outcomes = list(executor.map(measure, range(self.requests_per_endpoint)))
+        result.wall_seconds = time.perf_counter() - start_time
+
+        for status_code, elapsed in outcomes:
+            if status_code is None:
+                result.exceptions += 1
+                continue
+            result.status_codes[status_code] = result.status_codes.get(status_code, 0) + 1
+            if status_code == 200:
+                result.samples.append(elapsed)
+        result.samples.sort()
+        return result
+
+    def run(self, thresholds: Dict[str, float]) -> List[EndpointLatency]:
+        """
+        Benchmark every endpoint in turn.
+
+        Args:
+            thresholds: Endpoint path -> threshold in seconds.
+
+        Returns:
+            List[EndpointLatency]: One result per endpoint, in the given order.
+        """
+        self.started_at = datetime.now()
+        logger.info(
+            f"Latency benchmark: {len(thresholds)} endpoint(s), {self.requests_per_endpoint} request(s) each "
+            f"after {self.warmup} warm-up, concurrency {self.concurrency}"
+        )
+        results = []
+        for endpoint, threshold in thresholds.items():
+            result = self.run_endpoint(endpoint, threshold)
+            logger.info(
+                f"{endpoint:<18} p50 {result.percentile(50):.3f}s  p90 {result.percentile(90):.3f}s  "
+                f"p99 {result.percentile(99):.3f}s  max {(result.samples or [0.0])[-1]:.3f}s  "
+                f"{result.throughput:.1f} req/s  {result.errors} error(s)"
+            )
+            results.append(result)
+        return results
+
+    def write_artifact(self, results: List[EndpointLatency], directory: str = LATENCY_BENCHMARK_DIR) -> str:
+        """
+        Write the run's settings and results to latency_<timestamp>.json.
+
+        Returns:
+            str: Path of the written file.
+        """
+        started_at = self.started_at or datetime.now()
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"latency_{started_at.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}.json")
+        artifact = {
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "api_base_url": self.api.base_url,
+            "requests_per_endpoint": self.requests_per_endpoint,
+            "warmup": self.warmup,
+            "concurrency": self.concurrency,
+            "check_percentile": self.check_percentile,
+            "endpoints": [result.to_dict(self.check_percentile) for result in results],
+        }
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(artifact, f, indent=2)
+        os.replace(f"{path}.tmp", path)
+        logger.info(f"Latency benchmark results written to {path}")
+        return path
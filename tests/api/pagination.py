@@ -0,0 +1,177 @@
+# pagination.py
+"""
+Concurrent paginated fetcher built on APIBase.
+
+Walking a paginated endpoint one page after another makes wall time grow
+linearly with the page count. PaginatedFetcher reads page 1 first, then fetches
+the remaining pages on a bounded thread pool and yields them back in page order.
+
+Both list response shapes are supported (see
+AIsummaries/API_RESPONSE_SHAPE_EVOLUTION.md):
+    - ResponseDto wrapper ({"pageCount": ..., "results": [...]}) — the total page
+      count is read from page 1 and the remaining pages are fetched in one batch.
+    - Plain array ([...]) — there is no page count, so pages are fetched in
+      windows of max_workers until a short or empty page marks the end.
+"""
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+from utilities.config import API_MAX_CONCURRENCY
+from utilities.utils import logger
+from .api_base import APIBase
+
+# Hard stop for plain-array walks in case an endpoint ignores pageNumber and
+# keeps returning full pages.
+MAX_PLAIN_ARRAY_PAGES = 200
+
+
+@dataclass
+class PageResult:
+    """
+    One fetched page of a paginated endpoint.
+
+    Attributes:
+        page_number: The pageNumber that was requested.
+        status_code: HTTP status code, or None if the request raised.
+        data: Parsed JSON body (dict for ResponseDto, list for plain arrays).
+        items: The records on the page, regardless of response shape.
+        error: Description of what went wrong, or None for a usable page.
+    """
+    page_number: int
+    status_code: Optional[int] = None
+    data: Any = None
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PaginatedFetcher:
+    """
+    Fetch every page of a paginated endpoint with bounded concurrency.
+
+    Example:
+        >>> fetcher = PaginatedFetcher(APIBase(), "/Videos", page_size=25)
+        >>> for page in fetcher.iter_pages():
+        ...     assert page.ok, page.error
+        ...     video_ids.update(v["videoId"] for v in page.items)
+    """
+
+    def __init__(self, api: APIBase, endpoint: str, page_size: int = 25,
+                 params: Optional[Dict[str, Any]] = None, max_workers: int = API_MAX_CONCURRENCY):
+        """
+        Args:
+            api: APIBase instance whose pooled session and auth are used for every page.
+            endpoint: Endpoint path (e.g. '/Videos', '/Device').
+            page_size: pageSize query parameter sent with every request.
+            params: Extra query parameters (e.g. {'name': ''} for /search endpoints).
+            max_workers: Upper bound on concurrent requests. Never exceeds
+                API_MAX_CONCURRENCY so a single walker cannot hammer QA.
+        """
+        self.api = api
+        self.endpoint = endpoint
+        self.page_size = page_size
+        self.params = params or {}
+        self.max_workers = max(1, min(max_workers, API_MAX_CONCURRENCY))
+        self.page_count: Optional[int] = None
+        self.total_count: Optional[int] = None
+
+    def fetch_page(self, page_number: int) -> PageResult:
+        """
+        Fetch and parse a single page.
+
+        Args:
+            page_number: The pageNumber to request.
+
+        Returns:
+            PageResult: The parsed page, with error set on any failure.
+        """
+        params = {**self.params, "pageNumber": page_number, "pageSize": self.page_size}
+        result = PageResult(page_number=page_number)
+        try:
+            response = self.api.get(self.endpoint, params=params)
+        except requests.exceptions.RequestException as e:
+            result.error = f"Request for page {page_number} failed: {str(e)}"
+            logger.error(result.error)
+            return result
+
+        result.status_code = response.status_code
+        if response.status_code != 200:
+            result.error = f"Failed to get page {page_number}. Status code: {response.status_code}"
+            return result
+
+        try:
+            result.data = response.json()
+        except requests.exceptions.JSONDecodeError as e:
+            result.error = f"JSON decode error on page {page_number}: {str(e)}"
+            logger.error(result.error)
+            return result
+
+        if isinstance(result.data, list):
+            result.items = result.data
+        elif isinstance(result.data, dict) and isinstance(result.data.get("results"), list):
+            result.items = result.data["results"]
+        else:
+            result.error = f"Page {page_number}: Unrecognised response shape ({type(result.data).__name__})"
+        return result
+
+    def iter_pages(self) -> Iterator[PageResult]:
+        """
+        Yield every page in page order.
+
+        Page 1 is always fetched on its own first to discover the response
+        shape. Failed pages are yielded with error set rather than raised, so
+        callers can collect errors the same way the serial walkers did.
+
+        Yields:
+            PageResult: One result per page, starting at page 1.
+        """
+        first_page = self.fetch_page(1)
+        yield first_page
+        if not first_page.ok:
+            return
+
+        if isinstance(first_page.data, dict) and "pageCount" in first_page.data:
+            self.page_count = first_page.data["pageCount"]
+            self.total_count = first_page.data.get("totalCount")
+            yield from self._iter_known_pages(range(2, self.page_count + 1))
+        elif len(first_page.items) >= self.page_size:
+            yield from self._iter_until_short_page(start=2)
+
+    def fetch_all(self) -> List[PageResult]:
+        """
+        Fetch every page and return them as a list in page order.
+
+        Returns:
+            List[PageResult]: All pages, starting at page 1.
+        """
+        return list(self.iter_pages())
+
+    def _iter_known_pages(self, page_numbers: range) -> Iterator[PageResult]:
+        """Fetch a known set of pages on the thread pool and yield them in order."""
+        if not page_numbers:
+            return
+        logger.info(
+            f"Fetching {len(page_numbers)} remaining page(s) of {self.endpoint} "
+            f"with up to {self.max_workers} concurrent request(s)"
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # map() preserves submission order, so pages come back in order
+            # even though they complete out of order.
+            yield from executor.map(self.fetch_page, page_numbers)
+
+    def _iter_until_short_page(self, start: int) -> Iterator[PageResult]:
+        """Fetch plain-array pages in windows until a short, empty or failed page."""
+        page_number = start
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while page_number <= MAX_PLAIN_ARRAY_PAGES:
+                window = range(page_number, min(page_number + self.max_workers, MAX_PLAIN_ARRAY_PAGES + 1))
+                for result in executor.map(self.fetch_page, window):
+                    yield result
+                    if not result.ok or len(result.items) < self.page_size:
+                        return
+                page_number = window.stop
+        logger.warning(f"Stopped walking {self.endpoint} after {MAX_PLAIN_ARRAY_PAGES} pages")
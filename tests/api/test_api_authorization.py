@@ -35,7 +35,7 @@ import os
 import uuid
 import pytest
 from .api_base import APIBase
-from utilities.auth import get_token_for_user
+from utilities.auth import prefetch_persona_tokens
 from utilities.utils import logger
 
 # ---------------------------------------------------------------------------
@@ -254,18 +254,22 @@ class TestAPIOrgAdminIsolation:
 
         setup_class runs once before all tests in this class. Acquiring tokens
         here (rather than in setup_method) avoids making 3 auth network calls
-        per test.
+        per test, and the TokenPool means other classes asking for the same
+        accounts reuse these tokens.
         """
+        # Authenticate both org admins concurrently. Under xdist the tokens were
+        # already shipped to this worker by pytest_configure_node, so this is a
+        # cache hit and makes no network calls.
+        prefetch_persona_tokens(["ORG_ADMIN_BP", "ORG_ADMIN_DTA"])
+
         # System admin — uses the default shared token from SYS_ADMIN credentials
         cls.sysadmin_api = APIBase()
 
         # Butterfly Pavilion org admin
-        bp_token = get_token_for_user(ORG_ADMIN_BP_USERNAME, ORG_ADMIN_BP_PASSWORD)
-        cls.bp_api = APIBase(token=bp_token)
+        cls.bp_api = APIBase.for_user(ORG_ADMIN_BP_USERNAME, ORG_ADMIN_BP_PASSWORD)
 
         # Downtown Aquarium org admin
-        dta_token = get_token_for_user(ORG_ADMIN_DTA_USERNAME, ORG_ADMIN_DTA_PASSWORD)
-        cls.dta_api = APIBase(token=dta_token)
+        cls.dta_api = APIBase.for_user(ORG_ADMIN_DTA_USERNAME, ORG_ADMIN_DTA_PASSWORD)
 
         # Discover each org's ID from that org admin's own search results.
         # Org admins only see their own org(s), so the first result IS their org.
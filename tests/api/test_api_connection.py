@@ -1,7 +1,16 @@
 # test_api_connection.py is a test file that contains the test cases for the API connection.
+import uuid
 import pytest
 from typing import Dict, Any
 from .api_base import APIBase
+from .latency_benchmark import LatencyBenchmark
+from utilities.config import (
+    MOCK_API_ERROR_RATE,
+    MOCK_API_ERROR_STATUS,
+    MOCK_API_LATENCY_JITTER_MS,
+    MOCK_API_LATENCY_MS,
+    MOCK_API_SEED,
+)
 from utilities.data_handling import DataLoader
 from utilities.utils import logger
 
@@ -183,4 +192,112 @@ class TestAPIConnection:
                         """)
 
             # Final assertion
-            assert failed_tests == 0, f"{failed_tests} tests failed. See log for details."
\ No newline at end of file
+            assert failed_tests == 0, f"{failed_tests} tests failed. See log for details."
+
+    @pytest.mark.api
+    @pytest.mark.connection
+    @pytest.mark.performance
+    def test_api_connection_latency_benchmark(self, request):
+        """
+        Benchmark mode (--latency-benchmark): N warm requests per endpoint at the
+        chosen concurrency, with each endpoint's threshold checked against a
+        latency percentile instead of a single sample.
+
+        p50/p90/p99/max and throughput per endpoint are written to a JSON
+        artefact in LATENCY_BENCHMARK_DIR, attached to the report as
+        'latency_benchmark'.
+        """
+        if not request.config.getoption("--latency-benchmark"):
+            pytest.skip("Benchmark mode is off - run with --latency-benchmark")
+
+        benchmark = LatencyBenchmark(
+            self.api,
+            requests_per_endpoint=request.config.getoption("--benchmark-requests"),
+            concurrency=request.config.getoption("--benchmark-concurrency"),
+        )
+        thresholds = {endpoint: self.data_loader.get_endpoint_threshold(endpoint) for endpoint in get_endpoints()}
+        results = benchmark.run(thresholds)
+        artifact_path = benchmark.write_artifact(results)
+        request.node.user_properties.append(("latency_benchmark", artifact_path))
+
+        failures = [message for message in (result.check(benchmark.check_percentile) for result in results) if message]
+        for message in failures:
+            logger.error(f"✗ {message}")
+        assert not failures, (
+            f"{len(failures)} endpoint(s) failed the latency benchmark (p{benchmark.check_percentile} check):\n"
+            + "\n".join(failures)
+        )
+
+
+# Fault injection tests (--mock-api only)
+
+class TestAPIConnectionFaults:
+    """
+    APIBase behaviour under injected faults from the --mock-api server.
+
+    Each test targets the details path of a random GUID, so its fail_next()
+    entries cannot be consumed by requests from other tests or xdist workers.
+    The record does not exist, so a request that gets through the injected
+    fault is answered 400 by the mock.
+    """
+    def setup_method(self):
+        self.api = APIBase()
+        self.endpoint = f"/Organization/{uuid.uuid4()}/Details"
+
+    @pytest.mark.api
+    @pytest.mark.connection
+    @pytest.mark.authentication
+    def test_api_retries_once_after_401_with_shared_token(self, mock_api_faults):
+        """
+        A 401 on a 'valid' request made with the shared token refreshes the
+        token and sends the request again, once.
+        """
+        mock_api_faults.fail_next(1, status=401, path=f"{self.endpoint}$")
+
+        response = self.api.get(self.endpoint)
+
+        assert response.status_code == 400, (
+            f"Expected the retried request to reach the mock (400 not found), got {response.status_code}"
+        )
+
+    @pytest.mark.api
+    @pytest.mark.connection
+    @pytest.mark.authentication
+    def test_api_does_not_retry_401_twice(self, mock_api_faults):
+        """A second 401 after the token refresh is returned to the caller."""
+        mock_api_faults.fail_next(2, status=401, path=f"{self.endpoint}$")
+
+        response = self.api.get(self.endpoint)
+
+        assert response.status_code == 401, f"Expected the second 401 to be returned, got {response.status_code}"
+        assert self.api.get(self.endpoint).status_code == 400, "fail_next entries were not used up"
+
+    @pytest.mark.api
+    @pytest.mark.connection
+    def test_api_does_not_retry_injected_503(self, mock_api_faults):
+        """fail_next answers exactly the next `count` matching requests; APIBase does not retry a 503."""
+        mock_api_faults.fail_next(2, status=503, path=f"{self.endpoint}$")
+
+        statuses = [self.api.get(self.endpoint).status_code for _ in range(3)]
+
+        assert statuses == [503, 503, 400], f"Unexpected status sequence: {statuses}"
+
+    @pytest.mark.api
+    @pytest.mark.connection
+    def test_mock_api_clear_faults_restores_configured_settings(self, mock_api_faults):
+        """clear_faults() restores the MOCK_API_* settings rather than zeroing them."""
+        configured = {
+            "latency_ms": MOCK_API_LATENCY_MS,
+            "jitter_ms": MOCK_API_LATENCY_JITTER_MS,
+            "error_rate": MOCK_API_ERROR_RATE,
+            "error_status": MOCK_API_ERROR_STATUS,
+            "seed": MOCK_API_SEED,
+            "scripted": [],
+        }
+        mock_api_faults.set_faults(error_status=MOCK_API_ERROR_STATUS + 1, seed=MOCK_API_SEED + 1)
+        mock_api_faults.fail_next(1, status=503, path=f"{self.endpoint}$")
+
+        restored = mock_api_faults.clear_faults()
+
+        assert restored == configured, f"Expected the configured fault settings {configured}, got {restored}"
+        assert self.api.get(self.endpoint).status_code == 400, "Pending fail_next entry survived clear_faults()"
@@ -1,6 +1,6 @@
 import pytest
 import requests
-from jsonschema import validate, ValidationError # type: ignore
+from jsonschema import ValidationError # type: ignore
 from .api_base import APIBase
 from utilities.utils import logger
 from utilities.data_handling import DataLoader
@@ -11,12 +11,13 @@ data_loader = DataLoader()
 
 @pytest.fixture(scope='session')
 def video_schema_data():
-    schema_file = data_loader.schema_path / "data_schemas" / "video_data.json"
     try:
-        return data_loader._load_json_file(schema_file)
+        validator = data_loader.get_validator("video_data", schema_dir="data_schemas")
     except Exception as e:
         logger.error(f"Failed to load video schema: {str(e)}")
         raise
+    assert validator is not None, "Video data schema not found in data_schemas"
+    return validator
 
 @pytest.fixture(scope='session')
 def random_video_data():
@@ -48,7 +49,7 @@ class TestAPISchemas:
             
         # Validate against schema
         try:
-            validate(instance=json_response, schema=video_schema_data)
+            video_schema_data.validate(json_response)
             logger.info(f"Schema validation passed for video id: {video_id}")
         except ValidationError as e:
             logger.error(f"Schema validation failed for video id: {video_id}: {str(e)}")
@@ -1,9 +1,9 @@
 # test_api_videos.py is a test file that contains the test cases for the API videos endpoints.
 import pytest
-import random
 import math
 import requests
 from .api_base import APIBase
+from .video_snapshot import VideoCatalogueSnapshot
 from utilities.utils import logger
 from utilities.data_handling import DataLoader
 
@@ -23,6 +23,17 @@ INTEGRITY_CHECK_EXCLUDED_NAME_PREFIX = "#"
 def random_video_data():
     return data_loader.get_random_video()
 
+@pytest.fixture(scope="session")
+def video_catalogue_snapshot():
+    """
+    Crawl the full /Videos catalogue once per worker session.
+
+    Tests that need to walk or sample the whole catalogue read from this
+    snapshot instead of issuing their own /Videos requests. See
+    tests/api/video_snapshot.py for the stored form and available views.
+    """
+    return VideoCatalogueSnapshot.crawl(APIBase(), page_size=25)
+
 class TestAPIVideos:
     def setup_method(self):
         """
@@ -35,7 +46,7 @@ class TestAPIVideos:
     @pytest.mark.video
     #@pytest.mark.debug
     # @pytest.mark.github
-    def test_basic_pagination_mathematics(self):
+    def test_basic_pagination_mathematics(self, video_catalogue_snapshot):
         """
         This test verifies that:
             1. The API response contains valid pagination data
@@ -44,18 +55,14 @@ class TestAPIVideos:
             3. All required pagination fields are present
         """
         try:
-        # Make API request with specific pagination parameters
-            response = self.api.get("/Videos", params={"pageNumber": 1, "pageSize": 25})
-            assert response.status_code == 200, (
+            # Page 1 of the session snapshot, requested with pageNumber=1, pageSize=25
+            assert video_catalogue_snapshot.page_status.get(1) == 200, (
                 f"Failed to get videos list. Expected status code 200, "
-                f"got {response.status_code}"
+                f"got {video_catalogue_snapshot.page_status.get(1)}"
                 )
-            # Parse JSON response
-            try:
-                json_response = response.json()
-            except requests.exceptions.JSONDecodeError as e:
-                logger.error(f"Failed to decode JSON response: {str(e)}")
-                raise
+            json_response = video_catalogue_snapshot.page(1)
+            if json_response is None:
+                raise ValueError(video_catalogue_snapshot.page_errors.get(1, "Page 1 was not captured"))
             
             # Verify required pagination fields are present
             required_fields = ["page", "pageSize", "totalCount", "pageCount"]
@@ -92,55 +99,52 @@ class TestAPIVideos:
     @pytest.mark.api
     @pytest.mark.video
     #@pytest.mark.debug
-    def test_page_size_constraints(self):
+    def test_page_size_constraints(self, video_catalogue_snapshot):
         """
         Verifies that:
             1. All full pages contain exactly 25 videos
             2. The last page contains the correct remaining number of videos
             3. Page numbers and page sizes are consistent throughout
             4. API responses are valid and properly formatted
+
+        Pages are read from the session snapshot of /Videos.
         """
+        snapshot = video_catalogue_snapshot
         errors = []
         try:
-        # Make API request to get the total number of pages
-            response = self.api.get("/Videos", params={"pageNumber": 1, "pageSize": 25})
-            assert response.status_code == 200, (
+            assert snapshot.page_status.get(1) == 200, (
                 f"Failed to get videos list, expected status code 200, "
-                f"got response code: {response.status_code}"
+                f"got response code: {snapshot.page_status.get(1)}"
                 )
-            # Parse JSON response
-            try:
-                json_response = response.json()
-            except requests.exceptions.JSONDecodeError as e:
-                logger.error(f"Failed to decode JSON response: {str(e)}")
-                raise
+            page_count = snapshot.page_count
+            
+            # Expected size of the last page
+            # This may need adjustment because we are allowing 0 page length which was not allowed previously
+            last_page_size = snapshot.total_count % 25
                 
-            # All pages except the last page should have 25 videos    
-            for page in range(1, json_response["pageCount"]):
+            for page in range(1, page_count + 1):
                 try:
-                    page_response = self.api.get("/Videos", params={"pageNumber": page, "pageSize": 25})
-                    
-                    if page_response.status_code != 200:
-                        errors.append(
-                            f"Failed to get page {page}. "
-                            f"Status code: {page_response.status_code}"
-                        )
-                        continue
-                        
-                    try:
-                        page_data = page_response.json()
-                    except requests.exceptions.JSONDecodeError as e:
-                        logger.error(f"Failed to decode JSON response: {str(e)}")
-                        errors.append(f"JSON decode error on page {page}")
+                    if page in snapshot.page_errors:
+                        errors.append(snapshot.page_errors[page])
                         continue
                     
-                    # Verify page size (except for last page)
+                    page_data = snapshot.page(page)
+                    if page_data is None:
+                        errors.append(f"Page {page} was not captured")
+                        continue
                     
-                    if page < page_data["pageCount"] and len(page_data["results"]) != 25:
+                    # All pages except the last page should have 25 videos
+                    if page < page_count and len(page_data["results"]) != 25:
                         errors.append(
                             f"Page {page} has {len(page_data["results"])} videos, "
                             f"expected 25 videos"
                         )
+                    # Verify last page size
+                    if page == page_count and len(page_data["results"]) != last_page_size:
+                        errors.append(
+                            f"Last page has {len(page_data["results"])} videos, "
+                            f"expected {last_page_size}"
+                        )
                     # Verify page number for consistency
                     if page_data['page'] != page:
                         errors.append(
@@ -151,37 +155,11 @@ class TestAPIVideos:
                     if page_data['pageSize'] != 25:
                         errors.append(
                             f"Page size mismatch."
-                            f"Expected: 25, Actual: {page_data["page_size"]}"
+                            f"Expected: 25, Actual: {page_data['pageSize']}"
                         )
-                except AssertionError as e: 
+                except (KeyError, TypeError) as e:
                     logger.error(f"Unexpected error processing page {page}: {str(e)}")
                     errors.append(f"Error processing page {page}: {str(e)}")
-            
-            # Verify last page size
-            # This may need adjustment because we are allowing 0 page length which was not allowed previously
-            try:
-                last_page_size = json_response["totalCount"] % 25
-                if last_page_size == 0:
-                    last_page_size == 0
-                
-                last_page_response = self.api.get("/Videos", params={"pageNumber": json_response["pageCount"], "pageSize": 25})
-                
-                if last_page_response.status_code == 200:
-                    last_page_data = last_page_response.json()
-                    if len(last_page_data["results"]) != last_page_size:
-                        errors.append(
-                            f"Last page has {len(last_page_data["results"])} videos, "
-                            f"expected {last_page_size}"
-                        )
-                else:
-                    errors.append(
-                        f"Failed to get last page. "
-                        f"Status code: {last_page_response.status_code}"
-                    )
-
-            except Exception as e:
-                logger.error(f"Error verifying last page: {str(e)}")
-                errors.append(f"Last page verification failed: {str(e)}")
 
             # Log results
             if errors:
@@ -205,75 +183,40 @@ class TestAPIVideos:
     @pytest.mark.api
     @pytest.mark.video
     #@pytest.mark.debug
-    def test_no_duplicate_videos(self):
+    def test_no_duplicate_videos(self, video_catalogue_snapshot):
         """
         This test verifies that:
             1. Each video ID appears only once in the entire dataset
             2. All pages can be successfully retrieved
             3. All responses contain valid JSON data
             4. The pagination process completes successfully
+
+        Duplicates and missing IDs are recorded while the session snapshot of
+        /Videos is crawled.
         """
+        snapshot = video_catalogue_snapshot
         try:
-            video_ids = set()
-            page = 1
-            total_videos_checked = 0
+            assert not snapshot.page_errors, (
+                f"Failed to get videos list: {list(snapshot.page_errors.values())}"
+                )
             
-            while True:
-                # Get current page of videos
-                response = self.api.get("/Videos", params={"pageNumber": page, "pageSize": 25})
-                assert response.status_code == 200, (
-                    f"Failed to get videos list. Expected status code 200, "
-                    f"got {response.status_code}"
-                    )
-                
-                # Parse JSON response
-                try:
-                    json_response = response.json()
-                except requests.exceptions.JSONDecodeError as e:
-                    logger.error(f"Failed to decode JSON response: {str(e)}")
-                    raise
-                
-                # Verify required fields are present
-                required_fields = ["results", "pageCount"]
-                missing_fields = [field for field in required_fields if field not in json_response]
-                if missing_fields:
-                    raise KeyError(
-                        f"Response missing required fields: {missing_fields} on page: {page}"
-                        )
-                    
-                # Check each video on current page for duplicates
-                try:
-                    for video in json_response["results"]:
-                        video_id = video.get("videoId")
-                        
-                        # Verify video has an ID
-                        if not video_id:
-                            raise ValueError(
-                                f"Video on page {page} is missing videoId field"
-                            )
-                        
-                        # Check for duplicates
-                        assert video_id not in video_ids, (
-                            f"Duplicate video found: {video_id} on page: {page}"
-                        )
-                        
-                        video_ids.add(video_id)
-                        total_videos_checked += 1
-                    
-                except (KeyError, ValueError) as e:
-                    logger.error(f"Error processing page {page}: {str(e)}")
-                    raise
-                
-                if page >= json_response["pageCount"]:
-                    break
-                
-                page += 1
+            # Verify every video has an ID
+            if snapshot.missing_ids:
+                raise ValueError(
+                    f"Video on page {snapshot.missing_ids[0]} is missing videoId field"
+                )
+            
+            # Check for duplicates
+            assert not snapshot.duplicates, (
+                f"Duplicate video found: {snapshot.duplicates[0][0]} on page: {snapshot.duplicates[0][1]}"
+            )
             
+            total_videos_checked = sum(len(results) for results in snapshot.page_index.values())
             logger.info(
-                f"Successfully verified no duplicate videos across {page} pages."
+                f"Successfully verified no duplicate videos across {len(snapshot.page_index)} pages."
                 f"Total videos checked: {total_videos_checked}"
-                f"Total unique videos found: {len(video_ids)}"
-                f"Here are the video IDs: {video_ids}"
+                f"Total unique videos found: {len(snapshot.videos)}"
+                f"Here are the video IDs: {set(snapshot.videos)}"
             )    
         
         except AssertionError as e:
@@ -289,7 +232,7 @@ class TestAPIVideos:
     @pytest.mark.video
     @pytest.mark.github
     #@pytest.mark.debug
-    def test_video_data_integrity(self):
+    def test_video_data_integrity(self, video_catalogue_snapshot):
         """
         Test video data meets both schema requirements and business rules.
         
@@ -299,37 +242,27 @@ class TestAPIVideos:
         3. Video objects contain valid data
         4. Required relationships are present (species, countries)
         5. Geographical data is valid
+
+        Pages are sampled from the session snapshot of /Videos.
         """
         logger.info("\nTesting Video Data Integrity")
         
         # Test multiple pages to ensure consistent data quality
         
         page_size = 25
-        test_pages = self._get_random_pages_to_test(3)
+        test_pages = self._get_random_pages_to_test(video_catalogue_snapshot, 3)
         all_validation_errors = []
         test_summary = []
         
         for page in test_pages:
             try:
-                # Make API request
-                response = self.api.get("/Videos", params={
-                    "pageNumber": page,
-                    "pageSize": page_size
-                })
-                
-                if response.status_code != 200:
-                    error_msg = f"Failed to get page: {page}: Status code {response.status_code}"
+                if page in video_catalogue_snapshot.page_errors:
+                    error_msg = video_catalogue_snapshot.page_errors[page]
                     test_summary.append(error_msg)
                     logger.error(error_msg)
                     continue
                 
-                try:
-                    data = response.json()
-                except ValueError:
-                    error_msg = f"Page {page}: Failed to parse JSON response"
-                    test_summary.append(error_msg)
-                    logger.error(error_msg)
-                    continue
+                data = video_catalogue_snapshot.page(page)
                 
                 # Verify response structure before processing
                 if not isinstance(data, dict):
@@ -352,9 +285,15 @@ class TestAPIVideos:
                     "errors": []
                 }
                 
-                # 1. Schema Validation
+                # 1. Schema Validation — envelope first, then every video on the page in one batch
                 if not self.data_loader.validate_response("video_list_response", data):
                     page_validation["errors"].append(f"Page {page}: Schema validation failed")
+                    schema_errors = self.data_loader.validate_many(
+                        "video_list_response", data["results"], definition="video"
+                    )
+                    page_validation["errors"].extend(
+                        f"Page {page}: Schema error in video {error}" for error in schema_errors
+                    )
                 
                 # 2. Metadata Validation
                 try:
@@ -719,48 +658,21 @@ class TestAPIVideos:
         
         return errors
     
-    def _get_random_pages_to_test(self, num_pages: int =2) -> tuple[int]:
+    def _get_random_pages_to_test(self, snapshot: VideoCatalogueSnapshot, num_pages: int =2) -> tuple[int]:
         """
         Get a list of random page numbers to test
         
         Args:
+            snapshot: Session snapshot of /Videos providing the total page count
             num_pages: Number of pages to generate
             
         Returns:
             tuple[int]: List of random page numbers
         """
-        # Make the inital API call to get the total page count
-        response = self.api.get("/Videos", params={"pageNumber": 1, "pageSize": 25})
-        
-        try:
-            total_pages = response.json()["pageCount"]
-            
-            # If we request more pages than exist, adjust num_pages down
-            num_pages = min(num_pages, total_pages)
-            
-            if total_pages < 2:
-                # If there is only one page, reutn a tuple of that page repeated
-                return tuple([1] * num_pages)
-            
-            # Create a list to store our random pages
-            random_pages = []
-            
-            # Keep generating random pages until we have enough unique ones
-            while len(random_pages) < num_pages:
-                # Generate a new random page
-                new_page = random.randint(1, total_pages)
-                
-                # Only add it if we haven't seen this page number before
-                if new_page not in random_pages:
-                    random_pages.append(new_page)
-            
-            # Convert our list to a tuple before returning it
-            return tuple(random_pages)
-        
-        except (KeyError, ValueError) as e:
-            logger.error(f"Failed to get page count: {str(e)}")
-            # Fall back to testing sequential pages starting from page 1
-            return tuple(range(1, num_pages + 1))
+        if snapshot.page_count < 1:
+            # random_pages() falls back to sequential pages starting from page 1
+            logger.error("Failed to get page count from the /Videos snapshot")
+        return snapshot.random_pages(num_pages)
                 
     @pytest.mark.api
     @pytest.mark.video
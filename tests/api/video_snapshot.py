@@ -0,0 +1,130 @@
+# video_snapshot.py
+"""
+Crawl-once snapshot of the /Videos catalogue.
+
+Several tests in test_api_videos.py need to look at the whole catalogue
+(pagination math, page sizes, duplicates, data integrity). Instead of each test
+walking /Videos on its own, the session-scoped video_catalogue_snapshot fixture
+crawls it once per worker with PaginatedFetcher and stores it here:
+
+    - page_index: page number -> the page's results list exactly as the API returned it
+    - page_meta:  page number -> pagination envelope without its results list
+    - videos:     videoId -> first record seen with that ID, for duplicate checks
+
+Tests then read whole pages and random page picks from memory.
+"""
+import random
+from typing import Any, Dict, List, Optional, Tuple
+from utilities.utils import logger
+from .api_base import APIBase
+from .pagination import PaginatedFetcher
+
+VIDEOS_ENDPOINT = "/Videos"
+
+
+class VideoCatalogueSnapshot:
+    """
+    In-memory copy of every /Videos page, with a videoId index.
+
+    Crawl problems are recorded rather than raised so each test can report them
+    in its own terms:
+        - page_errors:  page number -> error message for pages that could not be fetched
+        - duplicates:   (videoId, page number) for every repeat sighting of an ID
+        - missing_ids:  page numbers holding a video with no videoId
+    """
+
+    def __init__(self, page_size: int = 25):
+        self.page_size = page_size
+        self.page_index: Dict[int, List[Any]] = {}
+        self.videos: Dict[str, Dict[str, Any]] = {}
+        self.page_meta: Dict[int, Dict[str, Any]] = {}
+        self.page_status: Dict[int, Optional[int]] = {}
+        self.page_errors: Dict[int, str] = {}
+        self.duplicates: List[Tuple[str, int]] = []
+        self.missing_ids: List[int] = []
+
+    @classmethod
+    def crawl(cls, api: APIBase, page_size: int = 25) -> 'VideoCatalogueSnapshot':
+        """
+        Fetch every /Videos page and build the snapshot.
+
+        Args:
+            api: APIBase used for every request.
+            page_size: pageSize to crawl with. Tests assume 25.
+
+        Returns:
+            VideoCatalogueSnapshot: The populated snapshot.
+        """
+        snapshot = cls(page_size=page_size)
+        for page_result in PaginatedFetcher(api, VIDEOS_ENDPOINT, page_size=page_size).iter_pages():
+            snapshot._add_page(page_result)
+        logger.info(
+            f"Captured /Videos snapshot: {len(snapshot.page_index)} page(s), "
+            f"{len(snapshot.videos)} unique video(s), {len(snapshot.page_errors)} failed page(s)"
+        )
+        return snapshot
+
+    def _add_page(self, page_result) -> None:
+        """Index one PageResult into the snapshot."""
+        page_number = page_result.page_number
+        self.page_status[page_number] = page_result.status_code
+        if not page_result.ok:
+            self.page_errors[page_number] = page_result.error
+            return
+        if not isinstance(page_result.data, dict):
+            self.page_errors[page_number] = f"Page {page_number}: Invalid response structure, not a dictionary"
+            return
+
+        self.page_meta[page_number] = {k: v for k, v in page_result.data.items() if k != "results"}
+        self.page_index[page_number] = list(page_result.items)
+        for video in self.page_index[page_number]:
+            video_id = video.get("videoId") if isinstance(video, dict) else None
+            if not video_id:
+                self.missing_ids.append(page_number)
+            elif video_id in self.videos:
+                self.duplicates.append((video_id, page_number))
+            else:
+                self.videos[video_id] = video
+
+    @property
+    def page_count(self) -> int:
+        """pageCount reported by page 1, or 0 if page 1 failed."""
+        return self.page_meta.get(1, {}).get("pageCount", 0)
+
+    @property
+    def total_count(self) -> int:
+        """totalCount reported by page 1, or 0 if page 1 failed."""
+        return self.page_meta.get(1, {}).get("totalCount", 0)
+
+    def page(self, page_number: int) -> Optional[Dict[str, Any]]:
+        """
+        The response body of a page as the API returned it.
+
+        Args:
+            page_number: Page to rebuild.
+
+        Returns:
+            dict: Pagination envelope with a 'results' list, or None if the page
+                  was not captured.
+        """
+        if page_number not in self.page_meta:
+            return None
+        return {**self.page_meta[page_number], "results": list(self.page_index[page_number])}
+
+    def random_pages(self, num_pages: int = 2) -> Tuple[int, ...]:
+        """
+        Pick distinct random page numbers from the captured catalogue.
+
+        Args:
+            num_pages: Number of pages to pick.
+
+        Returns:
+            tuple[int]: Page numbers. If there is only one page, that page repeated.
+        """
+        total_pages = self.page_count
+        if total_pages < 1:
+            return tuple(range(1, num_pages + 1))
+        num_pages = min(num_pages, total_pages)
+        if total_pages < 2:
+            return tuple([1] * num_pages)
+        return tuple(random.sample(range(1, total_pages + 1), num_pages))
@@ -117,6 +117,7 @@ class TestVideoPageUI:
     @pytest.mark.UI
     @pytest.mark.video
     @pytest.mark.grid
+    @pytest.mark.needs_media
     def test_video_grid_elements(self, videos_page):
         """
         Test that all video grid and card elements are present and properly structured.
@@ -0,0 +1,209 @@
+# api_cassette.py
+"""
+Record/replay store for API responses made through APIBase.
+
+The API suite normally talks to the live QA API (--api-mode=live). Two other
+modes are selected with --api-mode:
+
+    record  every request goes to the API as usual, and the final response is
+            also written to the cassette store
+    replay  responses are served from the cassette store and nothing goes over
+            the network. A request with no recorded response raises
+            CassetteMissError.
+
+Each response is one gzip-compressed JSON file under API_CASSETTE_DIR, named
+after a hash of what identifies the request:
+
+    method, endpoint path, query params, body hash, auth type, identity
+
+The host is left out, so a store recorded against one environment replays
+anywhere. The identity is 'sysadmin', the for_user() username, or a generic
+placeholder for raw tokens, because token fingerprints change every run.
+
+Replay suits read-only suites (Videos, Connection, Schema, ...). Requests whose
+body holds a fresh uuid4 on every run (creates) cannot match a recording.
+Replayed responses keep their recorded elapsed time, so response-time
+assertions behave as they did when recorded.
+
+In replay mode, seed_replay_tokens() fills TokenCache and TokenPool with a
+placeholder JWT, so APIBase never authenticates over the network either.
+"""
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+import requests
+from datetime import timedelta
+from requests.structures import CaseInsensitiveDict
+from typing import Any, Dict, Optional
+from utilities.config import API_CASSETTE_DIR
+from utilities.utils import logger
+
+API_MODES = ("live", "record", "replay")
+
+# Unsigned JWT with exp in 2100 - never refreshed, never sent anywhere in replay mode
+REPLAY_TOKEN = "replay.{}.replay".format(
+    base64.urlsafe_b64encode(json.dumps({"exp": 4102444800}).encode("utf-8")).decode("ascii").rstrip("=")
+)
+
+# Response headers kept in a recording; the rest (dates, request ids, cookies) only add noise
+RECORDED_HEADERS = ("content-type",)
+
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class CassetteStore:
+    """
+    Singleton holding the API mode and reading/writing recorded responses.
+
+    Counters cover this process (one xdist worker).
+    """
+    _instance: Optional['CassetteStore'] = None
+    _mode: str = "live"
+    _cassette_dir: str = API_CASSETTE_DIR
+    _stats: Dict[str, int] = {"recorded": 0, "replayed": 0, "missed": 0}
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(CassetteStore, cls).__new__(cls)
+        return cls._instance
+
+    def configure(self, mode: str, cassette_dir: str = API_CASSETTE_DIR):
+        """
+        Set the API mode for this process.
+
+        Args:
+            mode: 'live', 'record' or 'replay'.
+            cassette_dir: Directory holding the recorded responses.
+
+        Raises:
+            ValueError: If mode is not one of API_MODES.
+        """
+        if mode not in API_MODES:
+            raise ValueError(f"Unknown API mode '{mode}'. Available modes: {', '.join(API_MODES)}")
+        CassetteStore._mode = mode
+        CassetteStore._cassette_dir = cassette_dir
+        if mode != "live":
+            logger.info(f"API {mode} mode using cassette store {cassette_dir}")
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def request_key(self, method: str, endpoint: str, params: Optional[Dict[str, Any]],
+                    body: Any, auth_type: str, identity: str) -> str:
+        """
+        Hash of everything that identifies a request, used as the file name.
+
+        Args:
+            method: HTTP method.
+            endpoint: Endpoint path relative to API_BASE_URL.
+            params: Query string parameters.
+            body: JSON body, or None.
+            auth_type: 'valid', 'invalid' or 'none'.
+            identity: APIBase identity (pooled session key).
+
+        Returns:
+            str: Hex digest.
+        """
+        if identity.startswith("token-"):
+            identity = "token"
+        canonical_params = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        body_hash = hashlib.sha256(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest() if body is not None else ""
+        key = json.dumps([method.upper(), endpoint, canonical_params, body_hash, auth_type, identity])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        # Two-character subdirectories keep directory listings small
+        return os.path.join(self._cassette_dir, key[:2], f"{key}.json.gz")
+
+    def record(self, key: str, method: str, endpoint: str, response: requests.Response):
+        """
+        Write the response for a request key, replacing any earlier recording.
+
+        Args:
+            key: Result of request_key().
+            method: HTTP method (stored for readability only).
+            endpoint: Endpoint path (stored for readability only).
+            response: The live response.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = {
+            "method": method,
+            "endpoint": endpoint,
+            "status_code": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "body": response.text,
+            "elapsed": response.elapsed.total_seconds(),
+            "recorded_at": time.time(),
+        }
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            json.dump(entry, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+        with self._lock:
+            self._stats["recorded"] += 1
+
+    def replay(self, key: str, method: str, url: str) -> requests.Response:
+        """
+        Build a requests.Response from the recording for a request key.
+
+        Args:
+            key: Result of request_key().
+            method: HTTP method (for the error message).
+            url: Full request URL, set on the returned response.
+
+        Returns:
+            requests.Response: The recorded response.
+
+        Raises:
+            CassetteMissError: If nothing was recorded for this request.
+        """
+        try:
+            with gzip.open(self._path(key), "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self._stats["missed"] += 1
+            raise CassetteMissError(
+                f"No recorded response for {method} {url} in {self._cassette_dir} - "
+                f"run this test once with --api-mode=record"
+            )
+
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = url
+        response.elapsed = timedelta(seconds=entry["elapsed"])
+        with self._lock:
+            self._stats["replayed"] += 1
+        return response
+
+
+def seed_replay_tokens():
+    """
+    Cache REPLAY_TOKEN for the system admin and every configured persona.
+
+    Called in replay mode so that APIBase(), APIBase.for_user() and
+    prefetch_persona_tokens() find a usable token and never authenticate.
+    """
+    from utilities.auth import PERSONAS, TokenCache, TokenPool, get_persona_credentials
+    TokenCache().set_token(REPLAY_TOKEN)
+    for persona in PERSONAS:
+        credentials = get_persona_credentials(persona)
+        if credentials is not None:
+            TokenPool().set_token(credentials[0], REPLAY_TOKEN)
@@ -0,0 +1,211 @@
+# asset_cache.py
+"""
+On-disk cache of the web portal's hashed JS/CSS bundles for UI contexts.
+
+Every test gets a fresh browser context, and context isolation discards the
+browser's HTTP cache, so each test downloaded the portal's bundles again from
+Azure. StaticAssetCache is a context.route() handler that serves those bundles
+from STATIC_ASSET_CACHE_DIR instead:
+
+    miss  the first request for a bundle goes to the network
+          (route.fetch()), and the body is written to disk
+    hit   every later request, from any context and any xdist worker, is
+          fulfilled from disk
+
+Only GET script/stylesheet requests on the portal's own origin whose file name
+carries a content hash (e.g. /assets/index-3f9a1c2b.js) are cached. Those URLs
+are immutable: a new build produces new URLs, so the cache can never serve
+stale code.
+
+To stop old builds piling up, manifest.json in the cache directory records the
+current build. The build id is a hash of the bundle URLs referenced by the
+first portal HTML document each process sees. When it changes, the cached files
+are removed under a filelock.FileLock, so concurrent workers do not clear each
+other's fresh entries more than once.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from filelock import FileLock
+from typing import Optional, Tuple
+from urllib.parse import urlparse
+from utilities.config import STATIC_ASSET_CACHE_DIR
+from utilities.utils import logger
+
+CACHEABLE_RESOURCE_TYPES = ("script", "stylesheet")
+# File names with a content hash of 8+ characters containing a digit: index-3f9a1c2b.js, main.a1b2c3d4.css
+HASHED_ASSET_PATTERN = re.compile(r"[.-](?=[A-Za-z0-9_]*\d)[A-Za-z0-9_]{8,}\.(?:m?js|css)$")
+# src/href attribute values in an HTML document
+ASSET_REFERENCE_PATTERN = re.compile(r"""(?:src|href)=["']([^"']+\.(?:m?js|css))["']""")
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class AssetCacheStats:
+    """
+    Cache activity for one context.
+
+    Attributes:
+        hits: Bundles served from disk.
+        misses: Bundles fetched from the network and stored.
+        bytes_from_disk: Total size of the bundles served from disk.
+    """
+    hits: int = 0
+    misses: int = 0
+    bytes_from_disk: int = 0
+
+
+class StaticAssetCache:
+    """
+    Route handler serving hashed portal bundles from disk for one context.
+
+    The build check runs once per process and is shared at class level.
+    """
+    _build_checked = False
+    _build_lock = threading.Lock()
+
+    def __init__(self, origin: str, cache_dir: str = STATIC_ASSET_CACHE_DIR):
+        """
+        Args:
+            origin: Web portal base URL, e.g. QA_WEB_BASE_URL. Only its bundles are cached.
+            cache_dir: Directory shared by all runs and workers.
+        """
+        parsed = urlparse(origin)
+        self.origin = f"{parsed.scheme}://{parsed.netloc}"
+        self.cache_dir = cache_dir
+        self.stats = AssetCacheStats()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def attach(self, context):
+        """Serve the context's cacheable requests from disk and fall back for everything else."""
+        if not StaticAssetCache._build_checked:
+            context.on("response", self._check_build)
+        context.route(f"{self.origin}/**", self._handle)
+
+    def is_cacheable(self, request) -> bool:
+        return (
+            request.method == "GET"
+            and request.resource_type in CACHEABLE_RESOURCE_TYPES
+            and request.url.startswith(f"{self.origin}/")
+            and HASHED_ASSET_PATTERN.search(urlparse(request.url).path) is not None
+        )
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"{key}.body"), os.path.join(self.cache_dir, f"{key}.json")
+
+    def _handle(self, route):
+        request = route.request
+        if not self.is_cacheable(request):
+            route.fallback()
+            return
+
+        body_path, meta_path = self._paths(request.url)
+        cached = self._read(body_path, meta_path)
+        if cached is not None:
+            body, content_type = cached
+            self.stats.hits += 1
+            self.stats.bytes_from_disk += len(body)
+            route.fulfill(status=200, content_type=content_type, body=body)
+            return
+
+        response = route.fetch()
+        if response.status == 200:
+            self._write(body_path, meta_path, request.url, response.body(),
+                        response.headers.get("content-type", "application/octet-stream"))
+        self.stats.misses += 1
+        route.fulfill(response=response)
+
+    def _read(self, body_path: str, meta_path: str) -> Optional[Tuple[bytes, str]]:
+        """(body, content type) from disk, or None if the entry is missing or incomplete."""
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if len(body) != meta.get("size"):
+            return None
+        return body, meta["content_type"]
+
+    def _write(self, body_path: str, meta_path: str, url: str, body: bytes, content_type: str):
+        """Store one bundle. The body is written before the metadata that makes it visible to readers."""
+        suffix = f"{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(f"{body_path}.{suffix}", "wb") as f:
+                f.write(body)
+            os.replace(f"{body_path}.{suffix}", body_path)
+            with open(f"{meta_path}.{suffix}", "w") as f:
+                json.dump({"url": url, "content_type": content_type, "size": len(body), "stored_at": time.time()}, f)
+            os.replace(f"{meta_path}.{suffix}", meta_path)
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {str(e)}")
+
+    def _check_build(self, response):
+        """On the first portal HTML document, clear the cache if the bundle set has changed."""
+        if StaticAssetCache._build_checked or response.request.resource_type != "document":
+            return
+        if not response.url.startswith(self.origin) or response.status != 200:
+            return
+        with StaticAssetCache._build_lock:
+            if StaticAssetCache._build_checked:
+                return
+            StaticAssetCache._build_checked = True
+        try:
+            html = response.text()
+        except Exception as e:
+            logger.debug(f"Could not read {response.url} for the asset cache build check: {str(e)}")
+            return
+        bundles = sorted(set(ASSET_REFERENCE_PATTERN.findall(html)))
+        if bundles:
+            self.check_build(hashlib.sha256("\n".join(bundles).encode("utf-8")).hexdigest()[:16], len(bundles))
+
+    def check_build(self, build_id: str, bundle_count: int = 0):
+        """
+        Clear the cache if manifest.json records a different build.
+
+        Args:
+            build_id: Identifier of the portal build currently being served.
+            bundle_count: Number of bundles the id was computed from (for the log).
+        """
+        manifest_path = os.path.join(self.cache_dir, MANIFEST_NAME)
+        with FileLock(f"{manifest_path}.lock", timeout=60):
+            try:
+                with open(manifest_path, "r") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            if manifest.get("build") == build_id:
+                return
+            removed = self._clear_entries()
+            with open(f"{manifest_path}.tmp", "w") as f:
+                json.dump({"build": build_id, "bundles": bundle_count, "updated_at": time.time()}, f, indent=2)
+            os.replace(f"{manifest_path}.tmp", manifest_path)
+        logger.info(
+            f"Portal build changed ({manifest.get('build')} -> {build_id}); "
+            f"removed {removed} cached asset file(s)"
+        )
+
+    def _clear_entries(self) -> int:
+        """Delete every cached body/metadata file and return how many were removed."""
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith((".body", ".json")) and name != MANIFEST_NAME:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def log_summary(self, test_name: str):
+        if self.stats.hits or self.stats.misses:
+            logger.info(
+                f"Asset cache for {test_name}: {self.stats.hits} hit(s), {self.stats.misses} miss(es), "
+                f"{self.stats.bytes_from_disk / 1024:.0f} KB served from disk"
+            )
@@ -4,11 +4,17 @@ Shared authentication utility for API requests.
 Provides token generation and caching during test sessions.
 """
 import os
+import base64
+import time
+import threading
 import requests
 import json
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 from utilities.utils import logger
+from utilities.config import TOKEN_REFRESH_MARGIN_SECONDS, TOKEN_REFRESH_MIN_DELAY_SECONDS
+from utilities.http_session import get_session, ANONYMOUS_IDENTITY
 
 # Load environment variables
 load_dotenv()
@@ -23,9 +29,19 @@ class TokenCache:
     """
     Singleton class to cache authentication token during test session.
     This prevents repeated authentication calls while ensuring fresh tokens.
+
+    The JWT "exp" claim is decoded whenever a token is stored, and the refresh
+    time is worked out by token_refresh_at(). A daemon timer refreshes the
+    token at that time, and get_token() refreshes synchronously if it has
+    already passed (e.g. the timer has not fired yet), so long runs never send
+    an expired token.
     """
     _instance: Optional['TokenCache'] = None
     _token: Optional[str] = None
+    _expires_at: Optional[float] = None
+    _refresh_at: Optional[float] = None
+    _refresh_timer: Optional[threading.Timer] = None
+    _lock = threading.RLock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -34,7 +50,7 @@ class TokenCache:
 
     def get_token(self) -> str:
         """
-        Get cached token or generate a new one if not available.
+        Get cached token or generate a new one if not available or about to expire.
 
         Returns:
             str: Valid authentication token
@@ -42,9 +58,62 @@ class TokenCache:
         Raises:
             Exception: If authentication fails
         """
-        if self._token is None:
-            self._token = self._fetch_new_token()
-        return self._token
+        with self._lock:
+            if self._token is None or self._is_near_expiry():
+                if self._token is not None:
+                    logger.info("Cached authentication token is about to expire; refreshing")
+                self.set_token(self._fetch_new_token())
+            return self._token
+
+    def set_token(self, token: str):
+        """
+        Store a token and schedule its background refresh.
+
+        Used when a token is obtained elsewhere — e.g. the token shipped to xdist
+        workers by pytest_configure_node in conftest.py.
+
+        Args:
+            token: JWT token string
+        """
+        with self._lock:
+            self._token = token
+            self._expires_at = decode_token_expiry(token)
+            self._refresh_at = token_refresh_at(token, self._expires_at)
+            self._schedule_refresh()
+
+    def _is_near_expiry(self) -> bool:
+        """True if the cached token has reached its refresh time."""
+        if self._refresh_at is None:
+            return False
+        return time.time() >= self._refresh_at
+
+    def _schedule_refresh(self):
+        """(Re)start the daemon timer that refreshes the token ahead of expiry."""
+        self._cancel_refresh()
+        if self._refresh_at is None:
+            logger.debug("Authentication token has no exp claim; background refresh not scheduled")
+            return
+        delay = max(0.0, self._refresh_at - time.time())
+        self._refresh_timer = threading.Timer(delay, self._background_refresh, args=(self._token,))
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+        logger.debug(f"Scheduled background token refresh in {delay:.0f} seconds")
+
+    def _cancel_refresh(self):
+        """Cancel any pending background refresh."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    def _background_refresh(self, scheduled_token: str):
+        """Timer callback: refresh the token, keeping the old one if the call fails."""
+        try:
+            # Passing the token the timer was scheduled for makes this a no-op
+            # if get_token() already replaced it synchronously.
+            self.refresh_token(stale_token=scheduled_token)
+        except Exception as e:
+            # get_token() and the APIBase 401 retry will try again on demand
+            logger.error(f"Background token refresh failed: {str(e)}")
 
     def _fetch_new_token(self) -> str:
         """
@@ -64,7 +133,7 @@ class TokenCache:
 
         try:
             logger.debug(f"Fetching new authentication token from {auth_endpoint}")
-            response = requests.post(
+            response = get_session(ANONYMOUS_IDENTITY).post(
                 auth_endpoint,
                 headers={"Content-Type": "application/json"},
                 data=json.dumps(auth_data),
@@ -83,21 +152,255 @@ class TokenCache:
             logger.error(f"Failed to obtain authentication token: {str(e)}")
             raise Exception(f"Authentication failed: {str(e)}")
 
-    def refresh_token(self) -> str:
+    def refresh_token(self, stale_token: Optional[str] = None) -> str:
         """
         Force refresh the cached token.
 
+        Args:
+            stale_token: The token the caller found to be rejected. If another
+                thread has already replaced it, the current token is returned
+                without another authentication call.
+
         Returns:
             str: New authentication token
         """
-        logger.info("Refreshing authentication token")
-        self._token = self._fetch_new_token()
-        return self._token
+        with self._lock:
+            if stale_token is not None and self._token is not None and self._token != stale_token:
+                return self._token
+            logger.info("Refreshing authentication token")
+            self.set_token(self._fetch_new_token())
+            return self._token
 
     def clear_token(self):
         """Clear the cached token."""
         logger.debug("Clearing cached authentication token")
-        self._token = None
+        with self._lock:
+            self._cancel_refresh()
+            self._token = None
+            self._expires_at = None
+            self._refresh_at = None
+
+
+def _decode_token_claim(token: str, claim: str) -> Optional[float]:
+    """Read a numeric claim from a JWT without verifying its signature, or None."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        value = claims.get(claim)
+        return float(value) if value is not None else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        logger.debug(f"Could not decode {claim} claim from authentication token")
+        return None
+
+
+def decode_token_expiry(token: str) -> Optional[float]:
+    """
+    Read the "exp" claim from a JWT without verifying its signature.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        float: Expiry as a Unix timestamp, or None if the token is not a JWT
+               or carries no exp claim.
+    """
+    return _decode_token_claim(token, "exp")
+
+
+# Set once a token shorter-lived than twice TOKEN_REFRESH_MARGIN_SECONDS has been logged
+_short_lifetime_logged = False
+
+
+def token_refresh_at(token: str, expires_at: Optional[float] = None) -> Optional[float]:
+    """
+    Work out when a token that is being stored should be refreshed.
+
+    The refresh margin is TOKEN_REFRESH_MARGIN_SECONDS, capped at half the
+    token's lifetime (from its "iat" claim, or from now if it has none), and
+    the refresh is never sooner than TOKEN_REFRESH_MIN_DELAY_SECONDS from now.
+    Without the cap, a token living no longer than the margin would be due
+    for refresh as soon as it arrived, and every refresh would trigger the next.
+
+    Args:
+        token: JWT token string
+        expires_at: The token's exp claim, if already decoded.
+
+    Returns:
+        float: Refresh time as a Unix timestamp, or None if the token carries no exp claim.
+    """
+    global _short_lifetime_logged
+    if expires_at is None:
+        expires_at = decode_token_expiry(token)
+        if expires_at is None:
+            return None
+    now = time.time()
+    lifetime = expires_at - (_decode_token_claim(token, "iat") or now)
+    margin = min(TOKEN_REFRESH_MARGIN_SECONDS, lifetime / 2)
+    if margin < TOKEN_REFRESH_MARGIN_SECONDS and not _short_lifetime_logged:
+        _short_lifetime_logged = True
+        logger.warning(f"Authentication token lifetime ({lifetime:.0f}s) is under twice "
+                       f"TOKEN_REFRESH_MARGIN_SECONDS ({TOKEN_REFRESH_MARGIN_SECONDS}s); "
+                       f"refreshing tokens {max(margin, 0):.0f}s before expiry instead")
+    return max(expires_at - margin, now + TOKEN_REFRESH_MIN_DELAY_SECONDS)
+
+
+# Personas whose tokens are fetched up front and shipped to xdist workers.
+# Maps persona name -> (username env var, password env var).
+PERSONAS = {
+    "SYS_ADMIN": ("SYS_ADMIN_USERNAME", "SYS_ADMIN_PASSWORD"),
+    "ORG_ADMIN_BP": ("ORG_ADMIN_BP_USERNAME", "ORG_ADMIN_BP_PASSWORD"),
+    "ORG_ADMIN_DTA": ("ORG_ADMIN_DTA_USERNAME", "ORG_ADMIN_DTA_PASSWORD"),
+    "ORG_ADMIN_WPS": ("ORG_ADMIN_WPS_USERNAME", "ORG_ADMIN_WPS_PASSWORD"),
+}
+
+
+def get_persona_credentials(persona: str) -> Optional[Tuple[str, str]]:
+    """
+    Look up the (username, password) configured for a persona.
+
+    Args:
+        persona: Key from PERSONAS (e.g. 'ORG_ADMIN_BP').
+
+    Returns:
+        tuple: (username, password), or None if either env var is not set.
+    """
+    username_var, password_var = PERSONAS[persona]
+    username, password = os.getenv(username_var), os.getenv(password_var)
+    if not username or not password:
+        return None
+    return username, password
+
+
+class TokenPool:
+    """
+    Singleton cache of authentication tokens keyed by username.
+
+    The system admin account is served from TokenCache so it keeps a single
+    token (and its background refresh). Every other account gets one cached
+    token, replaced lazily once it reaches its token_refresh_at() time.
+    """
+    _instance: Optional['TokenPool'] = None
+    _tokens: Dict[str, str] = {}
+    _refresh_at: Dict[str, Optional[float]] = {}
+    _user_locks: Dict[str, threading.Lock] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TokenPool, cls).__new__(cls)
+        return cls._instance
+
+    def _user_lock(self, username: str) -> threading.Lock:
+        """Per-username lock so two callers never authenticate the same account at once."""
+        with self._lock:
+            return self._user_locks.setdefault(username, threading.Lock())
+
+    def _is_usable(self, username: str) -> bool:
+        """True if a token is cached for the user and has not reached its refresh time."""
+        if username not in self._tokens:
+            return False
+        refresh_at = self._refresh_at.get(username)
+        return refresh_at is None or time.time() < refresh_at
+
+    def _store(self, username: str, token: str):
+        """Cache a user's token with its refresh time. Call with the user's lock held."""
+        self._tokens[username] = token
+        self._refresh_at[username] = token_refresh_at(token)
+
+    def get_token(self, username: str, password: str) -> str:
+        """
+        Get the cached token for a user, authenticating only if needed.
+
+        Args:
+            username: The user's login username.
+            password: The user's login password.
+
+        Returns:
+            str: A valid JWT authentication token.
+        """
+        if username == SYS_ADMIN_USERNAME:
+            return TokenCache().get_token()
+        with self._user_lock(username):
+            if not self._is_usable(username):
+                self._store(username, _fetch_token_for_user(username, password))
+            return self._tokens[username]
+
+    def set_token(self, username: str, token: str):
+        """
+        Store a token obtained elsewhere (e.g. shipped to an xdist worker).
+
+        Args:
+            username: The user's login username.
+            token: JWT token string.
+        """
+        if username == SYS_ADMIN_USERNAME:
+            TokenCache().set_token(token)
+            return
+        with self._user_lock(username):
+            self._store(username, token)
+
+    def refresh_token(self, username: str, password: str, stale_token: Optional[str] = None) -> str:
+        """
+        Replace the cached token for a user.
+
+        Args:
+            username: The user's login username.
+            password: The user's login password.
+            stale_token: The rejected token; skipped if it has already been replaced.
+
+        Returns:
+            str: New authentication token
+        """
+        if username == SYS_ADMIN_USERNAME:
+            return TokenCache().refresh_token(stale_token)
+        with self._user_lock(username):
+            token = self._tokens.get(username)
+            if stale_token is None or token is None or token == stale_token:
+                logger.info(f"Refreshing authentication token for user '{username}'")
+                token = _fetch_token_for_user(username, password)
+                self._store(username, token)
+            return token
+
+    def prefetch(self, personas: Optional[List[str]] = None) -> Dict[str, str]:
+        """
+        Authenticate every configured persona concurrently.
+
+        Personas whose credentials are not set are skipped. A persona that
+        fails to authenticate is logged and left out — tests that need it will
+        retry (and fail with the real error) through get_token().
+
+        Args:
+            personas: Persona names from PERSONAS. Defaults to all of them.
+
+        Returns:
+            Dict[str, str]: username -> token for every persona now cached.
+        """
+        credentials = {}
+        for persona in personas or list(PERSONAS):
+            creds = get_persona_credentials(persona)
+            if creds is None:
+                logger.debug(f"Skipping token prefetch for persona {persona}: credentials not configured")
+                continue
+            credentials[persona] = creds
+
+        if not credentials:
+            return {}
+
+        def _fetch(item):
+            persona, (username, password) = item
+            try:
+                return username, self.get_token(username, password)
+            except Exception as e:
+                logger.error(f"Token prefetch failed for persona {persona}: {str(e)}")
+                return username, None
+
+        with ThreadPoolExecutor(max_workers=len(credentials)) as executor:
+            results = dict(executor.map(_fetch, credentials.items()))
+
+        tokens = {username: token for username, token in results.items() if token}
+        logger.info(f"Prefetched authentication tokens for {len(tokens)}/{len(credentials)} persona(s)")
+        return tokens
 
 
 def get_auth_token() -> str:
@@ -118,12 +421,17 @@ def get_auth_token() -> str:
     return cache.get_token()
 
 
-def refresh_auth_token() -> str:
+def refresh_auth_token(stale_token: Optional[str] = None) -> str:
     """
     Force refresh the authentication token.
 
     Use this when you suspect the token has expired or been invalidated.
 
+    Args:
+        stale_token: The token that was rejected. When several callers hit a 401
+            at once, only the first triggers an authentication call; the rest
+            receive the token it fetched.
+
     Returns:
         str: New authentication token
 
@@ -131,7 +439,19 @@ def refresh_auth_token() -> str:
         >>> token = refresh_auth_token()
     """
     cache = TokenCache()
-    return cache.refresh_token()
+    return cache.refresh_token(stale_token)
+
+
+def stop_token_refresh():
+    """
+    Cancel the pending background token refresh, keeping the cached token.
+
+    Called from pytest_sessionfinish in conftest.py so no refresh fires while
+    the process is shutting down.
+    """
+    cache = TokenCache()
+    with cache._lock:
+        cache._cancel_refresh()
 
 
 def get_auth_headers() -> dict:
@@ -152,6 +472,25 @@ def get_auth_headers() -> dict:
     }
 
 
+def prefetch_persona_tokens(personas: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    Authenticate all configured personas concurrently and cache their tokens.
+
+    Called from pytest_configure_node in conftest.py so an xdist run does one
+    authentication round per persona, however many workers there are.
+
+    Args:
+        personas: Persona names from PERSONAS. Defaults to all of them.
+
+    Returns:
+        Dict[str, str]: username -> token for every persona now cached.
+
+    Example:
+        >>> prefetch_persona_tokens(["ORG_ADMIN_BP", "ORG_ADMIN_DTA"])
+    """
+    return TokenPool().prefetch(personas)
+
+
 def clear_token_cache():
     """
     Clear the cached token.
@@ -164,9 +503,12 @@ def clear_token_cache():
 
 def get_token_for_user(username: str, password: str) -> str:
     """
-    Fetch a fresh authentication token for the given username and password.
+    Get an authentication token for the given username and password.
 
-    Unlike get_auth_token(), this function does NOT use the singleton cache.
+    Tokens are cached per username in the TokenPool, so repeated calls for the
+    same account (e.g. from several test classes, or after xdist workers have
+    been seeded by pytest_configure_node) do not re-authenticate. A cached
+    token that has reached its token_refresh_at() time is replaced.
     Use it when you need a token for a non-default user account — for example,
     org-admin accounts in authorization tests.
 
@@ -184,12 +526,48 @@ def get_token_for_user(username: str, password: str) -> str:
         >>> bp_token = get_token_for_user("QAOrgBPADMIN", "secret")
         >>> bp_api = APIBase(token=bp_token)
     """
+    return TokenPool().get_token(username, password)
+
+
+def refresh_token_for_user(username: str, password: str, stale_token: Optional[str] = None) -> str:
+    """
+    Force refresh the pooled token for a user.
+
+    Args:
+        username: The user's login username.
+        password: The user's login password.
+        stale_token: The token that was rejected; if another caller has already
+            replaced it, the newer token is returned without re-authenticating.
+
+    Returns:
+        str: New authentication token
+    """
+    return TokenPool().refresh_token(username, password, stale_token)
+
+
+def _fetch_token_for_user(username: str, password: str) -> str:
+    """
+    Fetch a fresh authentication token for the given username and password.
+
+    This always makes a network call; use get_token_for_user() to go through
+    the per-username cache.
+
+    Args:
+        username: The user's login username.
+        password: The user's login password.
+
+    Returns:
+        str: A valid JWT authentication token.
+
+    Raises:
+        Exception: If authentication fails (wrong credentials, network error, etc.)
+    """
     auth_endpoint = f"{API_BASE_URL}/Users/Authenticate"
     auth_data = {"username": username, "password": password}
 
     try:
         logger.debug(f"Fetching authentication token for user '{username}'")
-        response = requests.post(
+        response = get_session(ANONYMOUS_IDENTITY).post(
             auth_endpoint,
             headers={"Content-Type": "application/json"},
             data=json.dumps(auth_data),
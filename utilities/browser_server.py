@@ -0,0 +1,202 @@
+# browser_server.py
+"""
+One shared browser process per browser type for all pytest-xdist workers.
+
+Without it, each xdist worker launches its own browser in the session-scoped
+browser_instances fixture, so -n 16 means 16 Chromium processes and 16 launch
+delays. With --browser-server, the controller starts one browser server per
+browser type. It passes the websocket endpoints to the workers through
+workerinput, and each worker calls browser_type.connect(ws_endpoint) instead of
+launch(). Contexts are still created per test, so tests stay isolated.
+
+The Python Playwright API has no launch_server(), so the server is started
+through the Node.js driver that ships inside the playwright package: its
+bundled node binary runs LAUNCH_SERVER_SCRIPT against driver/package, which is
+the same playwright-core build the Python client talks to.
+
+process_tree_rss_mb() measures resident memory of a process and its
+descendants from /proc. conftest.py uses it to compare the shared servers with
+per-worker launches in its "browser startup" terminal section. It returns None
+on platforms without /proc.
+"""
+import json
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from utilities.config import BROWSER_SERVER_START_TIMEOUT, BROWSER_SERVER_STOP_TIMEOUT
+from utilities.utils import logger
+
+# Runs under the driver's node binary. argv: <playwright-core path> <browser type> <launch options JSON>.
+# Prints one JSON line once the server is listening, then closes it when stdin closes.
+LAUNCH_SERVER_SCRIPT = """
+const [packagePath, browserName, optionsJson] = process.argv.slice(1);
+const playwright = require(packagePath);
+playwright[browserName].launchServer(JSON.parse(optionsJson)).then((server) => {
+  process.stdout.write(JSON.stringify({ wsEndpoint: server.wsEndpoint() }) + "\\n");
+  const shutdown = () => server.close().then(() => process.exit(0), () => process.exit(1));
+  process.stdin.on("end", shutdown);
+  process.stdin.resume();
+  process.on("SIGTERM", shutdown);
+}).catch((error) => {
+  process.stderr.write(String((error && error.stack) || error) + "\\n");
+  process.exit(1);
+});
+"""
+
+
+@dataclass
+class BrowserServer:
+    """
+    A browser server started by start_browser_server().
+
+    Attributes:
+        browser_type: 'chromium', 'firefox' or 'webkit'.
+        ws_endpoint: Websocket endpoint for browser_type.connect().
+        launch_seconds: Time from spawning the driver to the endpoint being ready.
+        process: The node driver process hosting the server (parent of the browser).
+    """
+    browser_type: str
+    ws_endpoint: str
+    launch_seconds: float
+    process: subprocess.Popen
+
+    @property
+    def rss_mb(self) -> Optional[float]:
+        """Resident memory of the driver and browser processes, in MB."""
+        return process_tree_rss_mb(self.process.pid)
+
+
+def _driver_paths():
+    """(node executable, playwright-core package directory) bundled with the playwright package."""
+    from playwright._impl._driver import compute_driver_executable
+    node_path, cli_path = compute_driver_executable()
+    return node_path, os.path.dirname(cli_path)
+
+
+def start_browser_server(browser_type: str, headless: bool = True,
+                         timeout: float = BROWSER_SERVER_START_TIMEOUT) -> BrowserServer:
+    """
+    Start a browser server and wait for its websocket endpoint.
+
+    Args:
+        browser_type: 'chromium', 'firefox' or 'webkit'.
+        headless: Launch the browser headless.
+        timeout: Seconds to wait for the server to report its endpoint.
+
+    Returns:
+        BrowserServer: The running server. Stop it with stop_browser_server().
+
+    Raises:
+        RuntimeError: If the server exits or does not report an endpoint in time.
+
+    Example:
+        >>> server = start_browser_server("chromium")
+        >>> browser = playwright.chromium.connect(server.ws_endpoint)
+    """
+    from playwright._impl._driver import get_driver_env
+    node_path, package_path = _driver_paths()
+    start_time = time.time()
+    process = subprocess.Popen(
+        [node_path, "-e", LAUNCH_SERVER_SCRIPT, package_path, browser_type, json.dumps({"headless": headless})],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=get_driver_env(),
+        text=True,
+    )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        try:
+            line = executor.submit(process.stdout.readline).result(timeout=timeout)
+        except FutureTimeoutError:
+            process.kill()
+            raise RuntimeError(f"{browser_type} browser server did not start within {timeout}s")
+
+    if not line:
+        process.wait()
+        error = process.stderr.read().strip()
+        raise RuntimeError(f"{browser_type} browser server exited with code {process.returncode}: {error}")
+
+    ws_endpoint = json.loads(line)["wsEndpoint"]
+    server = BrowserServer(
+        browser_type=browser_type,
+        ws_endpoint=ws_endpoint,
+        launch_seconds=time.time() - start_time,
+        process=process,
+    )
+    logger.info(f"Started shared {browser_type} browser server at {ws_endpoint} in {server.launch_seconds:.2f}s")
+    return server
+
+
+def stop_browser_server(server: BrowserServer, timeout: float = BROWSER_SERVER_STOP_TIMEOUT):
+    """
+    Close the browser and stop the driver process.
+
+    Closing stdin asks the script to close the server cleanly; the process is
+    killed if it has not exited after timeout seconds.
+    """
+    if server.process.poll() is not None:
+        return
+    try:
+        server.process.stdin.close()
+        server.process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        logger.warning(f"{server.browser_type} browser server did not stop within {timeout}s - killing it")
+        server.process.kill()
+        server.process.wait()
+    logger.info(f"Stopped shared {server.browser_type} browser server")
+
+
+def _children_by_parent() -> Dict[int, List[int]]:
+    """Map of pid -> child pids from /proc."""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name can contain spaces, so split after its closing parenthesis
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+    return children
+
+
+def _rss_kb(pid: int) -> int:
+    """VmRSS of one process in kB, or 0 if it has gone away."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss_mb(root_pid: int, include_root: bool = True) -> Optional[float]:
+    """
+    Resident memory of a process and all of its descendants, in MB.
+
+    Args:
+        root_pid: Process at the top of the tree.
+        include_root: Count root_pid itself (False for e.g. "everything this
+            worker spawned", without the worker's own Python process).
+
+    Returns:
+        Optional[float]: Total RSS in MB, or None where /proc is not available.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    children = _children_by_parent()
+    pids = [root_pid] if include_root else []
+    pending = list(children.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        pids.append(pid)
+        pending.extend(children.get(pid, []))
+    return sum(_rss_kb(pid) for pid in pids) / 1024
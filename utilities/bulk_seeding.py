@@ -0,0 +1,209 @@
+# bulk_seeding.py
+"""
+Concurrent create/delete of test records for pagination fixtures.
+
+The pagination fixtures need PAGE_SIZE + 2 records, and creating then deleting
+them one request at a time made each fixture 50+ sequential round-trips. This
+module sends the create (PUT) and delete (DELETE) calls on a bounded thread
+pool over the pooled HTTP session instead.
+
+It is driven by an entity configuration from TEST_ENTITY_CONFIGURATIONS in
+conftest.py (create_endpoint, delete_endpoint_template, entity_name). Fixtures
+normally go through the seed_test_records / delete_test_records wrappers in
+conftest.py, which bind the configuration and payload builder for them.
+
+A failed record never aborts the batch. Every record gets a SeedOutcome, and the
+BulkSeedReport tells the fixture which IDs actually exist.
+"""
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from utilities.config import API_MAX_CONCURRENCY
+from utilities.http_session import get_session
+from utilities.utils import logger
+
+CREATE_SUCCESS_CODES = (200, 201)
+DELETE_SUCCESS_CODES = (200, 204)
+
+
+@dataclass
+class SeedOutcome:
+    """
+    Result of creating or deleting one record.
+
+    Attributes:
+        index: Position of the record in the batch.
+        record_id: The record's ID (generated client-side for creates).
+        action: 'create' or 'delete'.
+        status_code: HTTP status code, or None if the request raised or was skipped.
+        error: Description of what went wrong, or None on success.
+        skipped: True if the request was never sent (e.g. the probe record failed).
+        elapsed: Seconds spent on the request.
+    """
+    index: int
+    record_id: str
+    action: str
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    skipped: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.skipped
+
+
+@dataclass
+class BulkSeedReport:
+    """
+    Per-record outcomes of one bulk create or delete.
+
+    Attributes:
+        entity_name: Human-readable entity name from the configuration.
+        action: 'create' or 'delete'.
+        outcomes: One SeedOutcome per record, in batch order.
+        elapsed: Wall time for the whole batch in seconds.
+    """
+    entity_name: str
+    action: str
+    outcomes: List[SeedOutcome] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded_ids(self) -> List[str]:
+        """IDs of records whose request succeeded, in batch order."""
+        return [outcome.record_id for outcome in self.outcomes if outcome.ok]
+
+    @property
+    def failed(self) -> List[SeedOutcome]:
+        """Outcomes of records whose request was sent and failed."""
+        return [outcome for outcome in self.outcomes if outcome.error is not None]
+
+    @property
+    def skipped(self) -> List[SeedOutcome]:
+        """Outcomes of records whose request was never sent."""
+        return [outcome for outcome in self.outcomes if outcome.skipped]
+
+    def log_summary(self):
+        """Log one line for the batch and one line per failed record."""
+        logger.info(
+            f"Bulk {self.action} of {len(self.outcomes)} {self.entity_name} record(s) finished in "
+            f"{self.elapsed:.2f}s: {len(self.succeeded_ids)} succeeded, "
+            f"{len(self.failed)} failed, {len(self.skipped)} skipped"
+        )
+        for outcome in self.failed:
+            logger.error(
+                f"Bulk {self.action} failed for {self.entity_name} [{outcome.index}] "
+                f"ID {outcome.record_id}: {outcome.error}"
+            )
+
+
+def _send(method: str, url: str, headers: Dict[str, str], success_codes: Tuple[int, ...],
+          outcome: SeedOutcome, json_body: Optional[Dict[str, Any]] = None) -> SeedOutcome:
+    """Send one request on the pooled session and record the result on outcome."""
+    start_time = time.time()
+    try:
+        response = get_session().request(method, url, json=json_body, headers=headers)
+        outcome.status_code = response.status_code
+        if response.status_code not in success_codes:
+            outcome.error = f"{response.status_code} - {response.text[:200]}"
+    except requests.exceptions.RequestException as e:
+        outcome.error = f"Request failed: {str(e)}"
+    outcome.elapsed = time.time() - start_time
+    return outcome
+
+
+def _clamp_workers(max_workers: int) -> int:
+    """Keep the pool size between 1 and API_MAX_CONCURRENCY."""
+    return max(1, min(max_workers, API_MAX_CONCURRENCY))
+
+
+def bulk_create_records(config: Dict[str, Any], records: List[Tuple[str, Dict[str, Any]]],
+                        headers: Dict[str, str], max_workers: int = API_MAX_CONCURRENCY,
+                        probe_first: bool = True) -> BulkSeedReport:
+    """
+    Create records concurrently through the entity's create endpoint.
+
+    Args:
+        config: Entry from TEST_ENTITY_CONFIGURATIONS.
+        records: (record_id, payload) pairs, e.g. from create_test_record_payload.
+        headers: Headers for the API calls.
+        max_workers: Upper bound on concurrent requests (capped at API_MAX_CONCURRENCY).
+        probe_first: Create the first record on its own and skip the rest if it
+            fails, so a broken payload or endpoint costs one request, not N.
+
+    Returns:
+        BulkSeedReport: Per-record outcomes; succeeded_ids are the records that exist.
+
+    Example:
+        >>> report = bulk_create_records(config, records, get_auth_headers())
+        >>> created_ids = report.succeeded_ids
+    """
+    report = BulkSeedReport(entity_name=config["entity_name"], action="create")
+    start_time = time.time()
+
+    def create(indexed_record):
+        index, (record_id, payload) = indexed_record
+        outcome = SeedOutcome(index=index, record_id=record_id, action="create")
+        return _send("PUT", config["create_endpoint"], headers, CREATE_SUCCESS_CODES, outcome, payload)
+
+    pending = list(enumerate(records))
+    if probe_first and pending:
+        probe = create(pending.pop(0))
+        report.outcomes.append(probe)
+        if not probe.ok:
+            logger.error(
+                f"First {config['entity_name']} record failed ({probe.error}) - "
+                f"skipping the remaining {len(pending)} record(s)"
+            )
+            report.outcomes.extend(
+                SeedOutcome(index=index, record_id=record_id, action="create", skipped=True)
+                for index, (record_id, _) in pending
+            )
+            pending = []
+
+    if pending:
+        workers = _clamp_workers(max_workers)
+        logger.info(f"Creating {len(pending)} {config['entity_name']} record(s) with up to {workers} concurrent request(s)")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            report.outcomes.extend(executor.map(create, pending))
+
+    report.elapsed = time.time() - start_time
+    report.log_summary()
+    return report
+
+
+def bulk_delete_records(config: Dict[str, Any], record_ids: List[str], headers: Dict[str, str],
+                        max_workers: int = API_MAX_CONCURRENCY) -> BulkSeedReport:
+    """
+    Delete records concurrently through the entity's delete endpoint.
+
+    Args:
+        config: Entry from TEST_ENTITY_CONFIGURATIONS.
+        record_ids: IDs of the records to delete.
+        headers: Headers for the API calls.
+        max_workers: Upper bound on concurrent requests (capped at API_MAX_CONCURRENCY).
+
+    Returns:
+        BulkSeedReport: Per-record outcomes; failed lists records that may be orphaned.
+    """
+    report = BulkSeedReport(entity_name=config["entity_name"], action="delete")
+    start_time = time.time()
+
+    def delete(indexed_id):
+        index, record_id = indexed_id
+        outcome = SeedOutcome(index=index, record_id=record_id, action="delete")
+        url = config["delete_endpoint_template"].format(id=record_id)
+        return _send("DELETE", url, headers, DELETE_SUCCESS_CODES, outcome)
+
+    if record_ids:
+        workers = _clamp_workers(max_workers)
+        logger.info(f"Deleting {len(record_ids)} {config['entity_name']} record(s) with up to {workers} concurrent request(s)")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            report.outcomes.extend(executor.map(delete, enumerate(record_ids)))
+
+    report.elapsed = time.time() - start_time
+    report.log_summary()
+    return report
@@ -22,11 +22,95 @@ PAGE_SIZE = 25
 # Timeouts
 DEFAULT_TIMEOUT = 10
 EXTENDED_TIMEOUT = 30
+UI_POLL_INTERVAL_MS = 100  # Interval between DOM polls while waiting for the UI to settle
+
+# Search completion (see utilities/search_mixins.py)
+SEARCH_SIGNAL_TIMEOUT_MS = int(os.getenv("SEARCH_SIGNAL_TIMEOUT_MS", 5000))  # Max wait for the /search XHR or a row-count change
+SEARCH_SETTLE_MS = int(os.getenv("SEARCH_SETTLE_MS", 300))                  # Row count must hold this long to count as rendered
+
+# Pagination probe (see BasePage.probe_pagination_state)
+PAGINATION_PROBE_TIMEOUT_MS = int(os.getenv("PAGINATION_PROBE_TIMEOUT_MS", 3000))  # Max wait for the showing count to appear and settle
+PAGINATION_SETTLE_MS = int(os.getenv("PAGINATION_SETTLE_MS", 300))                # Showing count must hold this long to count as rendered
 
 # Log Levels
 LOG_LEVEL_FILE = logging.DEBUG
 LOG_LEVEL_CONSOLE = logging.WARNING # Changed from INFO to WARNING
 LOG_LEVEL_OVERALL = min(LOG_LEVEL_FILE, LOG_LEVEL_CONSOLE)
 
+# Per-test log capture (see HTMLReportLogger in utilities/utils.py)
+LOG_CAPTURE_MAX_LINES = int(os.getenv("LOG_CAPTURE_MAX_LINES", 5000))         # Newest lines kept per test and logging thread
+LOG_CAPTURE_MAX_BYTES = int(os.getenv("LOG_CAPTURE_MAX_BYTES", 512 * 1024))   # ...within this many message characters
+LOG_CAPTURE_SPILL = os.getenv("LOG_CAPTURE_SPILL", "false").lower() == "true"  # Write each released capture to LOG_CAPTURE_DIR
+LOG_CAPTURE_DIR = os.getenv("LOG_CAPTURE_DIR", os.path.join(LOG_DIR, "captures"))
+
+# JSON-lines log sink for --log-jsonl (see enable_jsonl_sink in utilities/utils.py and merge_logs.py)
+LOG_JSONL = os.getenv("LOG_JSONL", "false").lower() == "true"          # Default for --log-jsonl
+LOG_JSONL_DIR = os.getenv("LOG_JSONL_DIR", os.path.join(LOG_DIR, "jsonl"))  # One subdirectory per run, one file per worker
+
+# HTTP connection pooling (see utilities/http_session.py)
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", 4))   # Distinct hosts kept in the pool
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", 16))          # Open connections kept per host
+HTTP_KEEP_ALIVE = os.getenv("HTTP_KEEP_ALIVE", "true").lower() == "true"
+API_MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", 4))       # Cap on parallel requests to QA per worker
+
+# Seeded pagination pools (see utilities/seeded_dataset.py)
+SEEDED_POOL_SIZE = int(os.getenv("SEEDED_POOL_SIZE", PAGE_SIZE + 2))  # Records kept per entity to reach page 2
+
+# Cross-worker coordination (see utilities/run_state.py)
+RUN_STATE_LOCK_TIMEOUT = int(os.getenv("RUN_STATE_LOCK_TIMEOUT", 600))  # Max seconds to wait for another worker's setup
+
+# Shared browser servers for --browser-server (see utilities/browser_server.py)
+BROWSER_SERVER_START_TIMEOUT = int(os.getenv("BROWSER_SERVER_START_TIMEOUT", 60))  # Max seconds for a server to report its endpoint
+BROWSER_SERVER_STOP_TIMEOUT = int(os.getenv("BROWSER_SERVER_STOP_TIMEOUT", 10))    # Seconds to wait for a clean close before killing
+
+# API record/replay (see utilities/api_cassette.py)
+API_MODE = os.getenv("API_MODE", "live")  # 'live', 'record' or 'replay'; --api-mode overrides
+API_CASSETTE_DIR = os.getenv("API_CASSETTE_DIR", os.path.join(BASE_DIR, ".api_cassettes"))
+
+# Latency benchmark for --latency-benchmark (see tests/api/latency_benchmark.py)
+LATENCY_BENCHMARK_REQUESTS = int(os.getenv("LATENCY_BENCHMARK_REQUESTS", 50))          # Measured requests per endpoint; --benchmark-requests overrides
+LATENCY_BENCHMARK_CONCURRENCY = int(os.getenv("LATENCY_BENCHMARK_CONCURRENCY", API_MAX_CONCURRENCY))  # --benchmark-concurrency overrides
+LATENCY_BENCHMARK_WARMUP = int(os.getenv("LATENCY_BENCHMARK_WARMUP", 3))               # Unmeasured requests per endpoint first
+LATENCY_BENCHMARK_PERCENTILE = int(os.getenv("LATENCY_BENCHMARK_PERCENTILE", 90))      # Percentile compared with the endpoints.json threshold
+LATENCY_BENCHMARK_DIR = os.getenv("LATENCY_BENCHMARK_DIR", os.path.join(BASE_DIR, "benchmarks"))
+
+# Performance history and regression detection (see utilities/perf_baseline.py)
+PERF_BASELINE_DB = os.getenv("PERF_BASELINE_DB", os.path.join(BASE_DIR, ".perf_baseline", "baseline.sqlite3"))
+PERF_REPORT_PATH = os.getenv("PERF_REPORT_PATH", os.path.join(BASE_DIR, "perf_report.json"))  # Machine-readable comparison of the last run
+PERF_BASELINE_WINDOW = int(os.getenv("PERF_BASELINE_WINDOW", 10))          # Previous runs making up the rolling baseline
+PERF_BASELINE_MIN_RUNS = int(os.getenv("PERF_BASELINE_MIN_RUNS", 3))       # Baseline runs a metric needs before it is compared
+PERF_BASELINE_KEEP_RUNS = int(os.getenv("PERF_BASELINE_KEEP_RUNS", 100))   # Runs kept per environment
+PERF_MIN_SAMPLES = int(os.getenv("PERF_MIN_SAMPLES", 5))                   # Samples in a run for the Mann-Whitney test
+PERF_REGRESSION_ALPHA = float(os.getenv("PERF_REGRESSION_ALPHA", 0.01))    # Significance level of the slowdown
+PERF_REGRESSION_MIN_RATIO = float(os.getenv("PERF_REGRESSION_MIN_RATIO", 1.2))           # Median at least this much slower...
+PERF_REGRESSION_MIN_DELTA_SECONDS = float(os.getenv("PERF_REGRESSION_MIN_DELTA_SECONDS", 0.05))  # ...and by at least this many seconds
+
+# Per-test phase and fixture timing for --phase-timing (see utilities/phase_timing.py)
+PHASE_TIMING_REPORT = os.getenv("PHASE_TIMING_REPORT", os.path.join(BASE_DIR, "phase_timing.json"))  # Per-test breakdown and fixture totals
+
+# Local WildXR API stand-in for --mock-api (see utilities/mock_api_server.py)
+MOCK_API_PORT = int(os.getenv("MOCK_API_PORT", 0))                             # 0 picks a free port
+MOCK_API_LATENCY_MS = int(os.getenv("MOCK_API_LATENCY_MS", 0))                 # Added to every response
+MOCK_API_LATENCY_JITTER_MS = int(os.getenv("MOCK_API_LATENCY_JITTER_MS", 0))   # Extra 0..N ms, derived from MOCK_API_SEED
+MOCK_API_ERROR_RATE = float(os.getenv("MOCK_API_ERROR_RATE", 0))               # Fraction of requests answered with MOCK_API_ERROR_STATUS
+MOCK_API_ERROR_STATUS = int(os.getenv("MOCK_API_ERROR_STATUS", 503))
+MOCK_API_SEED = int(os.getenv("MOCK_API_SEED", 0))                             # Same seed, same injected errors and jitter
+
+# Resource blocking for UI contexts (see utilities/network_profile.py)
+RESOURCE_BLOCK_PROFILE = os.getenv("RESOURCE_BLOCK_PROFILE", "media")  # 'media', 'strict' or 'none'; --block-resources overrides
+
+# Static asset disk cache for UI contexts (see utilities/asset_cache.py)
+STATIC_ASSET_CACHE_DIR = os.getenv("STATIC_ASSET_CACHE_DIR", os.path.join(BASE_DIR, ".asset_cache"))
+
+# Cached UI login state (see utilities/storage_state_cache.py)
+STORAGE_STATE_CACHE_DIR = os.getenv("STORAGE_STATE_CACHE_DIR", os.path.join(BASE_DIR, ".auth_cache"))
+STORAGE_STATE_MIN_VALIDITY_SECONDS = int(os.getenv("STORAGE_STATE_MIN_VALIDITY_SECONDS", 1800))  # Cached state must stay valid this long
+STORAGE_STATE_MAX_AGE_SECONDS = int(os.getenv("STORAGE_STATE_MAX_AGE_SECONDS", 4 * 3600))       # Used when the state carries no expiry
+STORAGE_STATE_LOCK_TIMEOUT = int(os.getenv("STORAGE_STATE_LOCK_TIMEOUT", 300))                  # Max seconds to wait for another worker's login
+
+# Authentication
+TOKEN_REFRESH_MARGIN_SECONDS = int(os.getenv("TOKEN_REFRESH_MARGIN_SECONDS", 300))  # Refresh JWTs this long before exp (at most half their lifetime)
+TOKEN_REFRESH_MIN_DELAY_SECONDS = int(os.getenv("TOKEN_REFRESH_MIN_DELAY_SECONDS", 30))  # Never refresh a token sooner than this after storing it
+
 # Other constants
 MAX_RETRIES = 3
\ No newline at end of file
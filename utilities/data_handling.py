@@ -1,7 +1,12 @@
 import json
+import threading
 import jsonschema # type: ignore
+from jsonschema.exceptions import best_match # type: ignore
+from jsonschema.protocols import Validator # type: ignore
+from referencing import Registry, Resource # type: ignore
+from referencing.jsonschema import DRAFT7 # type: ignore
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from utilities.utils import logger
 
@@ -34,7 +39,15 @@ class VideoEndpointConfig(BaseEndpointConfig):
 class DataLoader:
     """Enhanced data loader maintaining compatibility with existing test suite"""
     
+    # Compiled validators and $ref registries are shared by every DataLoader in
+    # the process — tests create a new DataLoader per test method, so per-instance
+    # caches would be rebuilt for every test.
+    _validators: Dict[Tuple[str, str], Validator] = {}
+    _registries: Dict[str, Registry] = {}
+    _validator_lock = threading.Lock()
+    
     def __init__(self, env: str = "qa"):
+        self.env = env
         self.base_path = Path(__file__).parent.parent / "test_data" / "api" / env
         self.data_path = self.base_path / "data"
         self.schema_path = self.base_path / "schemas"
@@ -79,19 +92,125 @@ class DataLoader:
         data = self._load_json_file(self.data_path / "endpoints.json")
         return list(data["ENDPOINTS"].keys())
 
-    def validate_response(self, schema_name: str, response_data: Dict) -> bool:
-        """Validate API response against schema"""
-        schema_file = self.schema_path / "response_schemas" / f"{schema_name}.json"
+    def _schema_uri(self, schema_file: Path) -> str:
+        """URI a schema file is registered under (file URI of its absolute path)"""
+        return schema_file.resolve().as_uri()
+
+    def _schema_registry(self) -> Registry:
+        """
+        Build (once per environment) a referencing Registry over every schema file
+        under test_data/api/<env>/schemas.
+
+        Each schema is registered under its file URI, so both in-document refs
+        ("#/definitions/video") and relative refs to sibling files
+        ("../data_schemas/video_data.json") resolve locally with no network lookups.
+        Schemas without a $schema keyword are treated as Draft 7.
+        """
+        registry = self._registries.get(self.env)
+        if registry is None:
+            resources = []
+            for schema_file in sorted(self.schema_path.rglob("*.json")):
+                try:
+                    contents = {"$id": self._schema_uri(schema_file), **self._load_json_file(schema_file)}
+                except (json.JSONDecodeError, TypeError) as e:
+                    logger.warning(f"Skipping unreadable schema file {schema_file}: {str(e)}")
+                    continue
+                resources.append((contents["$id"], Resource.from_contents(contents, default_specification=DRAFT7)))
+            registry = Registry().with_resources(resources).crawl()
+            self._registries[self.env] = registry
+        return registry
+
+    def get_validator(self, schema_name: str, schema_dir: str = "response_schemas",
+                      definition: Optional[str] = None) -> Optional[Validator]:
+        """
+        Get a compiled validator for a schema, building and caching it on first use.
+
+        The schema is checked against its metaschema once, when the validator is
+        compiled, rather than on every validation call.
+
+        Args:
+            schema_name: Schema file name without extension (e.g. 'video_list_response')
+            schema_dir: Sub-directory of the schema path ('response_schemas' or 'data_schemas')
+            definition: Optional name under the schema's "definitions" to validate
+                against instead of the whole schema (e.g. 'video' for list items)
+
+        Returns:
+            Validator: Compiled Draft*Validator, or None if the schema file does not exist
+        """
+        key = (self.env, f"{schema_dir}/{schema_name}#{definition or ''}")
+        validator = self._validators.get(key)
+        if validator is not None:
+            return validator
+
+        schema_file = self.schema_path / schema_dir / f"{schema_name}.json"
         if not schema_file.exists():
             logger.warning(f"Schema file not found: {schema_file}")
+            return None
+
+        with self._validator_lock:
+            validator = self._validators.get(key)
+            if validator is None:
+                registry = self._schema_registry()
+                uri = self._schema_uri(schema_file)
+                try:
+                    schema = registry.contents(uri)
+                except LookupError:
+                    logger.warning(f"Schema file could not be loaded: {schema_file}")
+                    return None
+                validator_class = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+                validator_class.check_schema(schema)
+                if definition:
+                    # A bare $ref lets the registry resolve the definition in the
+                    # context of its own document, so its internal refs still work.
+                    schema = {"$ref": f"{uri}#/definitions/{definition}"}
+                validator = validator_class(schema, registry=registry)
+                self._validators[key] = validator
+                logger.debug(f"Compiled {validator_class.__name__} for schema '{key[1]}'")
+        return validator
+
+    def validate_response(self, schema_name: str, response_data: Dict) -> bool:
+        """Validate API response against schema"""
+        validator = self.get_validator(schema_name)
+        if validator is None:
             return True  # No schema defined = no validation needed
-        try:
-            schema = self._load_json_file(schema_file)
-            jsonschema.validate(instance=response_data, schema=schema)
-            return True
-        except jsonschema.exceptions.ValidationError as e:
-            logger.error(f"Schema validation failed: {str(e)}")
+        error = best_match(validator.iter_errors(response_data))
+        if error is not None:
+            logger.error(f"Schema validation failed: {str(error)}")
             return False
+        return True
+
+    def validate_many(self, schema_name: str, instances: List[Any], schema_dir: str = "response_schemas",
+                      definition: Optional[str] = None) -> List[str]:
+        """
+        Validate a batch of instances against one compiled schema and collect every error.
+
+        Unlike validate_response, this does not stop at the first failure: every
+        error in every instance is reported, prefixed with the instance's index
+        and the JSON path of the offending value.
+
+        Args:
+            schema_name: Schema file name without extension
+            instances: Objects to validate (e.g. the 'results' of one page)
+            schema_dir: Sub-directory of the schema path
+            definition: Optional definition to validate each instance against
+                (e.g. 'video' to validate /Videos results individually)
+
+        Returns:
+            List[str]: Error messages; empty if every instance is valid
+
+        Example:
+            >>> errors = DataLoader().validate_many("video_list_response", data["results"], definition="video")
+        """
+        validator = self.get_validator(schema_name, schema_dir, definition)
+        if validator is None:
+            return []
+        errors = []
+        for index, instance in enumerate(instances):
+            for error in validator.iter_errors(instance):
+                errors.append(f"[{index}] {error.json_path}: {error.message}")
+        if errors:
+            logger.error(f"Schema validation found {len(errors)} error(s) across {len(instances)} instance(s) for '{schema_name}'")
+        return errors
         
     def get_total_pages(self) -> int:
         """
@@ -0,0 +1,147 @@
+# http_session.py
+"""
+Shared, pooled HTTP sessions for API requests.
+
+Calling the module-level requests.get/post/put/delete opens a fresh TCP + TLS
+connection to the Azure API on every call. This module keeps one
+requests.Session per auth identity in each process (so one per xdist worker),
+each backed by a connection pool, so the whole run reuses connections.
+
+Sessions are closed by close_all_sessions(), which conftest.py calls from
+pytest_sessionfinish.
+
+Every request sent on a pooled session counts as http time for --phase-timing
+(see utilities/phase_timing.py), whether it comes from APIBase, bulk seeding or
+a conftest helper.
+"""
+import hashlib
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+from utilities.config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_KEEP_ALIVE
+from utilities.phase_timing import PhaseTimer
+from utilities.utils import logger
+
+# Identity used for the shared system admin token (see utilities/auth.py)
+DEFAULT_IDENTITY = "sysadmin"
+# Identity used for unauthenticated calls (e.g. /Users/Authenticate)
+ANONYMOUS_IDENTITY = "anonymous"
+
+
+class TimedSession(requests.Session):
+    """requests.Session whose requests are timed as http for --phase-timing."""
+
+    def request(self, *args, **kwargs) -> requests.Response:
+        with PhaseTimer().measure("http"):
+            return super().request(*args, **kwargs)
+
+
+class SessionPool:
+    """
+    Singleton registry of pooled requests.Session objects keyed by auth identity.
+
+    Keeping sessions per identity stops cookies set for one user leaking into
+    requests made as another. The Authorization header is still supplied per
+    request by the caller, so 'invalid' and 'none' auth types keep working
+    against any session.
+    """
+    _instance: Optional['SessionPool'] = None
+    _sessions: Dict[str, requests.Session] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SessionPool, cls).__new__(cls)
+        return cls._instance
+
+    def get_session(self, identity: str = DEFAULT_IDENTITY) -> requests.Session:
+        """
+        Get the pooled session for an identity, creating it on first use.
+
+        Args:
+            identity: Key for the auth identity (username or token fingerprint).
+
+        Returns:
+            requests.Session: A session with a mounted connection pool.
+        """
+        with self._lock:
+            session = self._sessions.get(identity)
+            if session is None:
+                session = self._create_session()
+                self._sessions[identity] = session
+                logger.debug(
+                    f"Created pooled HTTP session for identity '{identity}' "
+                    f"(pool_connections={HTTP_POOL_CONNECTIONS}, pool_maxsize={HTTP_POOL_MAXSIZE}, "
+                    f"keep_alive={HTTP_KEEP_ALIVE})"
+                )
+            return session
+
+    def _create_session(self) -> requests.Session:
+        """
+        Build a new session with a sized connection pool for http and https.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = TimedSession()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not HTTP_KEEP_ALIVE:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close_all(self):
+        """Close every pooled session and release its connections."""
+        with self._lock:
+            for identity, session in self._sessions.items():
+                logger.debug(f"Closing pooled HTTP session for identity '{identity}'")
+                session.close()
+            self._sessions.clear()
+
+
+def identity_for_token(token: Optional[str]) -> str:
+    """
+    Derive a session identity from a JWT without keeping the token itself as a key.
+
+    Args:
+        token: A JWT token string, or None for unauthenticated calls.
+
+    Returns:
+        str: A short, stable fingerprint of the token.
+    """
+    if not token:
+        return ANONYMOUS_IDENTITY
+    return "token-" + hashlib.sha256(token.encode("utf-8")).hexdigest()[:12]
+
+
+def get_session(identity: str = DEFAULT_IDENTITY) -> requests.Session:
+    """
+    Get the pooled HTTP session for an auth identity.
+
+    This is the main function to use in fixtures and conftest helpers in place
+    of the module-level requests.get/post/put/delete calls.
+
+    Args:
+        identity: Auth identity key. Defaults to the shared system admin identity.
+
+    Returns:
+        requests.Session: Pooled session for the identity.
+
+    Example:
+        >>> response = get_session().get(url, headers=get_auth_headers())
+    """
+    return SessionPool().get_session(identity)
+
+
+def close_all_sessions():
+    """
+    Close all pooled sessions in this process.
+
+    Called once per process from pytest_sessionfinish in conftest.py.
+    """
+    SessionPool().close_all()
@@ -0,0 +1,1202 @@
+# mock_api_server.py
+"""
+Local stand-in for the WildXR API, so tests/api can run without the Azure QA API.
+
+MockAPIServer is a ThreadingHTTPServer on 127.0.0.1 that serves the endpoints
+the suite exercises from an in-memory store:
+
+    /Users/Authenticate
+    /Organization, /Installations, /Device, /Panels, /Videos, /VideoCatalogue
+        with their /search, /{id}/Details, create, update and delete variants
+    /MapMarker, /Species, /Users, /Countries, /IUCNStatus, /PopulationTrend, /Tag
+        as read-only lists
+
+It reproduces the quirks the tests document for the real API:
+
+    - /Organization, /Installations and /Device return plain arrays; /search,
+      /Panels and /Videos return the ResponseDto envelope
+    - /Videos reports pageCount as totalCount // pageSize + 1
+    - not found is 400 with a plain-text message, except /Device details and
+      update (404)
+    - creates are PUT and return an empty body; updates are POST
+    - Installations update is a full replace (a missing organizationId is a 500);
+      Device update nulls every omitted field
+    - routes and query parameter names are case-insensitive (ASP.NET Core)
+    - org admins only see their own organizations, and get 403 for another
+      organization's details
+
+Tokens are HS256 JWTs signed with a per-server secret. The system admin and
+every persona (SYS_ADMIN_USERNAME, ORG_ADMIN_BP_USERNAME, ...) can log in; each
+org admin persona is the admin of one seeded organization. Videos are seeded
+from test_data/api/qa/data/videos.json so the schema tests find their GUIDs.
+
+Latency and error injection apply to every API request:
+
+    latency_ms / jitter_ms   fixed delay plus 0..jitter_ms extra
+    error_rate / error_status  answer that fraction of requests with error_status
+    fail_next(count, status, path)  answer the next count matching requests
+                                    with status, before anything else
+
+Jitter and random errors are derived from a hash of (seed, method, path, n),
+where n counts requests to that path, so a run with the same seed sees the same
+errors on the same requests however requests to different paths interleave.
+Defaults come from MOCK_API_* in utilities/config.py. At runtime, any process
+can change them through the /__mock__ control endpoints with MockAPIControl.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import math
+import os
+import re
+import secrets
+import threading
+import time
+import uuid
+import requests
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, urlparse
+from utilities.config import (
+    BASE_DIR,
+    MOCK_API_ERROR_RATE,
+    MOCK_API_ERROR_STATUS,
+    MOCK_API_LATENCY_JITTER_MS,
+    MOCK_API_LATENCY_MS,
+    MOCK_API_PORT,
+    MOCK_API_SEED,
+)
+from utilities.utils import logger
+
+API_PREFIX = "/api"
+CONTROL_PREFIX = "/__mock__"
+GUID_EMPTY = "00000000-0000-0000-0000-000000000000"
+TOKEN_LIFETIME_SECONDS = 3600
+VIDEOS_FILE = os.path.join(BASE_DIR, "test_data", "api", "qa", "data", "videos.json")
+
+# Same defaults as conftest.py and the API test modules
+TEST_ORGANIZATION_ID = os.getenv("TEST_ORGANIZATION_ID", "4ffbb8fe-d8b4-49d9-982d-5617856c9cce")
+TEST_VIDEO_CATALOGUE_ID = os.getenv("TEST_VIDEO_CATALOGUE_ID", "b05980db-5833-43bd-23ca-08dc63b567ef")
+
+# Org admin persona -> name of the organization it administers.
+# Credentials come from <persona>_USERNAME / <persona>_PASSWORD, as in utilities/auth.py PERSONAS.
+PERSONA_ORGANIZATIONS = {
+    "ORG_ADMIN_BP": "Butterfly Pavilion",
+    "ORG_ADMIN_DTA": "Downtown Aquarium",
+    "ORG_ADMIN_WPS": "WPS",
+}
+MOCK_PASSWORD = "mock-password"
+
+# uuid5 namespace for the stable ids of seeded records
+SEED_NAMESPACE = uuid.UUID("5f0c6d2e-8a41-4f7b-9a53-0d7c2b1e6a90")
+
+PROQUINT_CONSONANTS = "bdfghjklmnprstvz"
+PROQUINT_VOWELS = "aiou"
+
+
+def mock_credentials_env() -> Dict[str, str]:
+    """
+    Environment variables giving the system admin and every org admin persona a
+    mock login. conftest.py applies them with os.environ.setdefault(), so real
+    credentials in .env are used unchanged.
+    """
+    env = {}
+    for persona in ("SYS_ADMIN", *PERSONA_ORGANIZATIONS):
+        env[f"{persona}_USERNAME"] = f"mock.{persona.lower()}"
+        env[f"{persona}_PASSWORD"] = MOCK_PASSWORD
+    return env
+
+
+def _seed_id(label: str) -> str:
+    return str(uuid.uuid5(SEED_NAMESPACE, label))
+
+
+def _proquint(value: int) -> str:
+    """Proquint encoding of a 32-bit value, e.g. 'lusab-babad' (the wildXRNumber format)."""
+    words = []
+    for word in ((value >> 16) & 0xFFFF, value & 0xFFFF):
+        words.append(
+            PROQUINT_CONSONANTS[(word >> 12) & 0xF]
+            + PROQUINT_VOWELS[(word >> 10) & 0x3]
+            + PROQUINT_CONSONANTS[(word >> 6) & 0xF]
+            + PROQUINT_VOWELS[(word >> 4) & 0x3]
+            + PROQUINT_CONSONANTS[word & 0xF]
+        )
+    return "-".join(words)
+
+
+def _b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+class MockAPIError(Exception):
+    """
+    Raised by a route handler to answer with an error status.
+
+    Args:
+        status: HTTP status code.
+        body: str (sent as text/plain, like ASP.NET BadRequest("...")), a
+            dict (sent as JSON), or None for an empty body.
+    """
+
+    def __init__(self, status: int, body: Any = None):
+        super().__init__(f"{status}: {body}")
+        self.status = status
+        self.body = body
+
+
+def _validation_error(field_name: str, message: str) -> MockAPIError:
+    """400 with the ASP.NET Core model validation problem details body."""
+    return MockAPIError(400, {
+        "type": "https://tools.ietf.org/html/rfc9110#section-15.5.1",
+        "title": "One or more validation errors occurred.",
+        "status": 400,
+        "errors": {field_name: [message]},
+    })
+
+
+@dataclass
+class MockRequest:
+    """
+    One request as seen by a route handler.
+
+    Attributes:
+        method: HTTP method.
+        path: Path below the /api prefix.
+        params: Query parameters, with lower-cased names.
+        body: Parsed JSON body, or None.
+        user: Authenticated user record, or None for anonymous routes.
+        route_args: Values captured from the route template, e.g. {'id': ...}.
+    """
+    method: str
+    path: str
+    params: Dict[str, str]
+    body: Any
+    user: Optional[Dict[str, Any]] = None
+    route_args: Dict[str, str] = field(default_factory=dict)
+
+    def param(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self.params.get(name.lower(), default)
+
+    def int_param(self, name: str, default: int) -> int:
+        value = self.param(name)
+        if value is None or value == "":
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise _validation_error(name, f"The value '{value}' is not valid.")
+
+    def body_field(self, name: str, default: Any = None) -> Any:
+        """Field of a JSON object body, matched case-insensitively like the API's model binding."""
+        if not isinstance(self.body, dict):
+            return default
+        for key, value in self.body.items():
+            if key.lower() == name.lower():
+                return value
+        return default
+
+
+@dataclass
+class FaultSettings:
+    """
+    Latency and error injection settings of a MockAPIServer.
+
+    Attributes:
+        latency_ms: Delay added to every API response.
+        jitter_ms: Extra delay of 0..jitter_ms, derived from the seed.
+        error_rate: Fraction of API requests answered with error_status.
+        error_status: Status used for injected random errors.
+        seed: Seed for jitter and random errors.
+        scripted: Pending fail_next() entries: {'remaining', 'status', 'path'}.
+    """
+    latency_ms: int = MOCK_API_LATENCY_MS
+    jitter_ms: int = MOCK_API_LATENCY_JITTER_MS
+    error_rate: float = MOCK_API_ERROR_RATE
+    error_status: int = MOCK_API_ERROR_STATUS
+    seed: int = MOCK_API_SEED
+    scripted: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class MockAPIStats:
+    """
+    Requests handled by a MockAPIServer.
+
+    Attributes:
+        requests: API requests received (control requests excluded).
+        by_status: Status code -> number of responses.
+        injected_errors: Responses replaced by an injected error.
+        latency_ms: Total delay added by latency injection.
+    """
+    requests: int = 0
+    by_status: Dict[int, int] = field(default_factory=dict)
+    injected_errors: int = 0
+    latency_ms: float = 0.0
+
+
+class MockWildXRStore:
+    """
+    In-memory WildXR data and the route handlers that read and change it.
+
+    Handlers take a MockRequest and return (status, body); a body of None is
+    sent as an empty response. Callers hold the server's lock, so handlers do
+    not lock themselves.
+    """
+
+    def __init__(self, users: Dict[str, Dict[str, Any]]):
+        self.users = users
+        self.organizations: Dict[str, Dict[str, Any]] = {}
+        self.installations: Dict[str, Dict[str, Any]] = {}
+        self.devices: Dict[str, Dict[str, Any]] = {}
+        self.panels: Dict[str, Dict[str, Any]] = {}
+        self.videos: Dict[str, Dict[str, Any]] = {}
+        self.video_catalogues: Dict[str, Dict[str, Any]] = {}
+        self.reference: Dict[str, List[Dict[str, Any]]] = {}
+        self.next_device_number = 0x6B5A0000
+        self._seed()
+
+    # ------------------------------------------------------------------
+    # Seed data
+    # ------------------------------------------------------------------
+
+    def _seed(self):
+        org_names = {
+            TEST_ORGANIZATION_ID: "QA Automation Organization",
+            _seed_id("org:wildlife-sanctuary"): "Wildlife Sanctuary",
+            _seed_id("org:marine-park"): "Marine Park",
+        }
+        for persona, org_name in PERSONA_ORGANIZATIONS.items():
+            org_names[_seed_id(f"org:{persona}")] = org_name
+        for org_id, name in org_names.items():
+            self.organizations[org_id] = {"organizationId": org_id, "name": name}
+
+        for username, user in self.users.items():
+            persona = user["persona"]
+            if persona in PERSONA_ORGANIZATIONS:
+                user["organizationIds"] = [_seed_id(f"org:{persona}")]
+
+        self.video_catalogues[TEST_VIDEO_CATALOGUE_ID] = {
+            "videoCatalogueId": TEST_VIDEO_CATALOGUE_ID,
+            "name": "QA Automation Catalogue",
+            "description": "Seeded by the mock API",
+            "organizationId": TEST_ORGANIZATION_ID,
+            "lastEditedDate": _now_iso(),
+            "mapMarkers": [],
+            "videos": [],
+        }
+
+        for index, (name, org_id) in enumerate([
+            ("Main Hall Installation", TEST_ORGANIZATION_ID),
+            ("Aquarium Gallery", TEST_ORGANIZATION_ID),
+            ("Safari Lounge", _seed_id("org:wildlife-sanctuary")),
+            ("Pavilion Dome", _seed_id("org:ORG_ADMIN_BP")),
+            ("Reef Tank Kiosk", _seed_id("org:ORG_ADMIN_DTA")),
+        ]):
+            installation_id = _seed_id(f"installation:{index}")
+            self.installations[installation_id] = self._installation_record(
+                {"installationId": installation_id, "name": name, "organizationId": org_id,
+                 "videoCatalogueId": TEST_VIDEO_CATALOGUE_ID}
+            )
+
+        first_installation = next(iter(self.installations))
+        for index, (name, org_id, installation_id) in enumerate([
+            ("Lobby Headset A", TEST_ORGANIZATION_ID, first_installation),
+            ("Gallery Headset", TEST_ORGANIZATION_ID, None),
+            ("Safari Headset", _seed_id("org:wildlife-sanctuary"), None),
+            ("Pavilion Headset", _seed_id("org:ORG_ADMIN_BP"), None),
+            ("Aquarium Headset", _seed_id("org:ORG_ADMIN_DTA"), None),
+            (None, None, None),  # initialized but never registered
+        ]):
+            device = self._new_device()
+            device.update(name=name, organizationId=org_id, installationId=installation_id)
+            self.devices[device["deviceId"]] = device
+
+        species = []
+        for name, scientific_name in [
+            ("African Elephant", "Loxodonta africana"),
+            ("Monarch Butterfly", "Danaus plexippus"),
+            ("Green Sea Turtle", "Chelonia mydas"),
+        ]:
+            species.append({
+                "speciesId": _seed_id(f"species:{name}"),
+                "name": name,
+                "colloquialName": name,
+                "scientificName": scientific_name,
+                "description": f"{name} ({scientific_name})",
+                "iucnStatusId": _seed_id("iucn:EN"),
+                "populationTrendId": _seed_id("trend:decreasing"),
+                "speciesCategoryId": _seed_id("category:animal"),
+                "videos": [],
+            })
+        country_id = _seed_id("country:KE")
+        map_marker = {
+            "mapMarkerId": _seed_id("marker:amboseli"),
+            "name": "Amboseli",
+            "description": "Amboseli National Park",
+            "organizationId": TEST_ORGANIZATION_ID,
+            "latitude": -2.6527,
+            "longitude": 37.2606,
+            "iconID": 1,
+            "videos": [],
+        }
+        tag = {"tagId": _seed_id("tag:wildlife"), "name": "Wildlife", "videos": []}
+
+        self.reference = {
+            "mapmarker": [map_marker],
+            "species": species,
+            "countries": [{"countryId": country_id, "name": "Kenya", "code": "KE"}],
+            "iucnstatus": [{"iucnStatusId": _seed_id("iucn:EN"), "name": "Endangered", "code": "EN"}],
+            "populationtrend": [{"populationTrendId": _seed_id("trend:decreasing"), "name": "Decreasing"}],
+            "tag": [tag],
+        }
+
+        try:
+            with open(VIDEOS_FILE, "r", encoding="utf-8") as f:
+                seed_videos = json.load(f)["data"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Mock API could not read {VIDEOS_FILE}: {str(e)} - seeding no videos")
+            seed_videos = []
+        created = _now_iso()
+        for index, entry in enumerate(seed_videos):
+            video_id = entry["guid"]
+            self.videos[video_id] = {
+                "videoId": video_id,
+                "name": entry["Name"],
+                "overview": entry["Overview"],
+                "dateCreated": created,
+                "thumbnailUrl": f"https://mock.wildxr.local/thumbnails/{video_id}.jpg",
+                "youTubeUrl": f"https://mock.wildxr.local/videos/{video_id}",
+                "totalViews": 0,
+                "totalLikes": 0,
+                "totalDislikes": 0,
+                "rating": 0,
+                "mapMarkers": [map_marker],
+                "countryObtainedId": country_id,
+                "tags": [tag],
+                "lastEditedBy": "mock",
+                "lastEditedDate": created,
+                "species": [species[index % len(species)]],
+                "videoFormat": 0,
+                "videoStatusId": 2,
+                "videoResolutionId": 1,
+            }
+
+        for index, name in enumerate(["Featured Animals", "Ocean Life", "New Arrivals"]):
+            panel_id = _seed_id(f"panel:{index}")
+            self.panels[panel_id] = {
+                "panelId": panel_id,
+                "name": name,
+                "videoCatalogueId": TEST_VIDEO_CATALOGUE_ID,
+                "newFlag": index == 2,
+                "backgroundImageUrl": None,
+                # Contents may be null on the real API until a panel is edited
+                "contents": None if index == 2 else [
+                    {"videoId": video_id, "order": order}
+                    for order, video_id in enumerate(list(self.videos)[index * 3:index * 3 + 3])
+                ],
+            }
+
+    # ------------------------------------------------------------------
+    # Shared helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _is_sysadmin(user: Dict[str, Any]) -> bool:
+        return user["persona"] == "SYS_ADMIN"
+
+    def _can_see_org(self, user: Dict[str, Any], org_id: Optional[str]) -> bool:
+        return self._is_sysadmin(user) or (org_id is not None and str(org_id).lower() in
+                                           [o.lower() for o in user.get("organizationIds", [])])
+
+    @staticmethod
+    def _paging(request: MockRequest) -> Tuple[int, int]:
+        page = request.int_param("pageNumber", 1)
+        page_size = request.int_param("pageSize", 10)
+        if page < 1:
+            raise _validation_error("pageNumber", "pageNumber must be greater than 0.")
+        if page_size < 1:
+            raise _validation_error("pageSize", "pageSize must be greater than 0.")
+        return page, page_size
+
+    @staticmethod
+    def _page_slice(items: List[Any], page: int, page_size: int) -> List[Any]:
+        start = (page - 1) * page_size
+        return items[start:start + page_size]
+
+    def _plain_list(self, request: MockRequest, items: List[Dict[str, Any]]) -> Tuple[int, Any]:
+        """Plain-array list endpoints (/Organization, /Installations, /Device) still honour pageSize."""
+        page, page_size = self._paging(request)
+        return 200, self._page_slice(items, page, page_size)
+
+    def _response_dto(self, request: MockRequest, items: List[Dict[str, Any]],
+                      legacy_page_count: bool = False) -> Tuple[int, Dict[str, Any]]:
+        """
+        The ResponseDto envelope. With legacy_page_count (as /Videos does) pageCount
+        is totalCount // pageSize + 1, one too many when the division is exact.
+        """
+        page, page_size = self._paging(request)
+        total = len(items)
+        page_count = total // page_size + 1 if legacy_page_count else math.ceil(total / page_size)
+        return 200, {
+            "page": page,
+            "pageSize": page_size,
+            "pageCount": page_count,
+            "totalCount": total,
+            "results": self._page_slice(items, page, page_size),
+        }
+
+    @staticmethod
+    def _name_filter(request: MockRequest, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Case-insensitive 'name contains' filter used by every /search endpoint."""
+        name = (request.param("name") or "").lower()
+        if not name:
+            return items
+        return [item for item in items if name in (item.get("name") or "").lower()]
+
+    @staticmethod
+    def _require_id(value: Any, field_name: str) -> str:
+        if not value or str(value) == GUID_EMPTY:
+            raise MockAPIError(400, f"{field_name} is required.")
+        return str(value)
+
+    @staticmethod
+    def _find(records: Dict[str, Dict[str, Any]], record_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Look up a record by GUID, ignoring case like SQL Server does."""
+        if record_id is None:
+            return None
+        record = records.get(record_id)
+        if record is None:
+            for key, value in records.items():
+                if key.lower() == str(record_id).lower():
+                    return value
+        return record
+
+    # ------------------------------------------------------------------
+    # /Users
+    # ------------------------------------------------------------------
+
+    def users_list(self, request: MockRequest):
+        return 200, [
+            {"userId": user["userId"], "username": username, "role": user["role"],
+             "organizationIds": user.get("organizationIds", [])}
+            for username, user in self.users.items()
+        ]
+
+    # ------------------------------------------------------------------
+    # /Organization
+    # ------------------------------------------------------------------
+
+    def _visible_organizations(self, user: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [org for org in self.organizations.values() if self._can_see_org(user, org["organizationId"])]
+
+    def organization_list(self, request: MockRequest):
+        return self._plain_list(request, self._visible_organizations(request.user))
+
+    def organization_search(self, request: MockRequest):
+        return self._response_dto(request, self._name_filter(request, self._visible_organizations(request.user)))
+
+    def organization_details(self, request: MockRequest):
+        org = self._find(self.organizations, request.route_args["id"])
+        if org is None:
+            raise MockAPIError(400, "Organization not found.")
+        if not self._can_see_org(request.user, org["organizationId"]):
+            raise MockAPIError(403)
+        return 200, org
+
+    def organization_create(self, request: MockRequest):
+        name = request.body_field("name")
+        if not name:
+            raise _validation_error("Name", "The Name field is required.")
+        if len(name) > 50:
+            # Name is VARCHAR(50); SQL Server rejects the insert
+            raise MockAPIError(500, "String or binary data would be truncated in column 'Name'.")
+        org_id = request.body_field("organizationId")
+        if not org_id or org_id == GUID_EMPTY:
+            org_id = str(uuid.uuid4())
+        self.organizations[org_id] = {"organizationId": org_id, "name": name}
+        return 200, None
+
+    def organization_update(self, request: MockRequest):
+        org_id = self._require_id(request.body_field("organizationId"), "OrganizationId")
+        org = self._find(self.organizations, org_id)
+        if org is None:
+            raise MockAPIError(400, "Organization not found.")
+        name = request.body_field("name")
+        if not name:
+            raise _validation_error("Name", "The Name field is required.")
+        org["name"] = name
+        return 200, None
+
+    def organization_delete(self, request: MockRequest):
+        org = self._find(self.organizations, self._require_id(request.param("id"), "Id"))
+        if org is None:
+            raise MockAPIError(400, "Organization not found.")
+        del self.organizations[org["organizationId"]]
+        return 200, None
+
+    # ------------------------------------------------------------------
+    # /Installations
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _installation_record(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Full InstallationDto: every field not in the payload gets its null/zero default."""
+        record = {
+            "installationId": None,
+            "name": None,
+            "organizationId": None,
+            "videoCatalogueId": None,
+            "panelCollectionId": GUID_EMPTY,
+            "forceOfflineMode": False,
+            "showGraphicDeath": False,
+            "showGraphicSex": False,
+            "controls": None,
+            "demoMode": False,
+            "globeStartLat": 0,
+            "globeStartLong": 0,
+            "appTimerLengthSeconds": 0,
+            "idleTimerLengthSeconds": 0,
+            "idleTimerDelaySeconds": 0,
+            "startupVideoId": None,
+            "resumeStartupVideoOnAwake": False,
+            "startupVideoLoop": False,
+            "showMenuTray": False,
+            "tips": None,
+            "favorites": [],
+            "filterFavoritesByDefault": False,
+            "tutorialMode": None,
+            "tutorialText": None,
+        }
+        record.update(payload)
+        return record
+
+    def _visible_installations(self, user: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [i for i in self.installations.values() if self._can_see_org(user, i["organizationId"])]
+
+    def installation_list(self, request: MockRequest):
+        return self._plain_list(request, self._visible_installations(request.user))
+
+    def installation_search(self, request: MockRequest):
+        return self._response_dto(request, self._name_filter(request, self._visible_installations(request.user)))
+
+    def installation_details(self, request: MockRequest):
+        installation = self._find(self.installations, request.route_args["id"])
+        if installation is None:
+            raise MockAPIError(400, "Installation not found.")
+        return 200, installation
+
+    def installation_create(self, request: MockRequest):
+        # No field validation and no FK check on organizationId, as on the real API
+        payload = dict(request.body) if isinstance(request.body, dict) else {}
+        if not payload.get("installationId") or payload["installationId"] == GUID_EMPTY:
+            payload["installationId"] = str(uuid.uuid4())
+        self.installations[payload["installationId"]] = self._installation_record(payload)
+        return 200, None
+
+    def installation_update(self, request: MockRequest):
+        installation_id = self._require_id(request.body_field("installationId"), "InstallationId")
+        installation = self._find(self.installations, installation_id)
+        if installation is None:
+            raise MockAPIError(400, "Installation not found.")
+        if not request.body_field("organizationId"):
+            # Full replace: the omitted organizationId becomes NULL in a NOT NULL column
+            raise MockAPIError(500, "Cannot insert the value NULL into column 'OrganizationID'.")
+        replacement = self._installation_record(dict(request.body))
+        replacement["installationId"] = installation["installationId"]
+        self.installations[installation["installationId"]] = replacement
+        return 200, None
+
+    def installation_delete(self, request: MockRequest):
+        installation = self._find(self.installations, self._require_id(request.param("id"), "Id"))
+        if installation is None:
+            raise MockAPIError(400, "Installation not found.")
+        del self.installations[installation["installationId"]]
+        return 200, None
+
+    # ------------------------------------------------------------------
+    # /Device
+    # ------------------------------------------------------------------
+
+    def _new_device(self) -> Dict[str, Any]:
+        self.next_device_number += 1
+        return {
+            "deviceId": str(uuid.uuid4()),
+            "name": None,
+            "wildXRNumber": _proquint(self.next_device_number),
+            "organizationId": None,
+            "installationId": None,
+            "rowVersion": _b64url(os.urandom(8)),
+        }
+
+    def _find_device_by_number(self, wildxr_number: str) -> Optional[Dict[str, Any]]:
+        for device in self.devices.values():
+            if (device.get("wildXRNumber") or "").lower() == wildxr_number.lower():
+                return device
+        return None
+
+    def device_list(self, request: MockRequest):
+        devices = [d for d in self.devices.values() if self._can_see_org(request.user, d["organizationId"])]
+        return self._plain_list(request, devices)
+
+    def device_search(self, request: MockRequest):
+        # Devices without an organization are left out of search entirely
+        devices = [d for d in self.devices.values()
+                   if d["organizationId"] and self._can_see_org(request.user, d["organizationId"])]
+        return self._response_dto(request, self._name_filter(request, devices))
+
+    def device_details(self, request: MockRequest):
+        device = self._find(self.devices, request.route_args["id"])
+        if device is None:
+            raise MockAPIError(404)
+        return 200, device
+
+    def device_initialize_new(self, request: MockRequest):
+        device = self._new_device()
+        self.devices[device["deviceId"]] = device
+        return 200, device
+
+    def device_lookup(self, request: MockRequest):
+        wildxr_number = request.param("wildXRNumber")
+        if not wildxr_number:
+            raise MockAPIError(400, "WildXRNumber is required.")
+        device = self._find_device_by_number(wildxr_number)
+        # Registered devices (with an organization) are no longer found by lookup
+        if device is None or device["organizationId"]:
+            raise MockAPIError(404)
+        return 200, device
+
+    def device_create(self, request: MockRequest):
+        # Low-level insert without validation; an empty payload is accepted
+        device = self._new_device()
+        for key in ("deviceId", "name", "wildXRNumber", "organizationId", "installationId"):
+            value = request.body_field(key)
+            if value:
+                device[key] = value
+        self.devices[device["deviceId"]] = device
+        return 200, None
+
+    def device_update(self, request: MockRequest):
+        device_id = self._require_id(request.body_field("deviceId"), "DeviceId")
+        device = self._find(self.devices, device_id)
+        if device is None:
+            raise MockAPIError(404)
+        # Every omitted field is set to null
+        for key in ("name", "wildXRNumber", "installationId", "organizationId"):
+            device[key] = request.body_field(key)
+        device["rowVersion"] = _b64url(os.urandom(8))
+        return 200, device
+
+    def device_delete(self, request: MockRequest):
+        device = self._find(self.devices, self._require_id(request.param("id"), "Id"))
+        if device is None:
+            raise MockAPIError(400, "Device not found.")
+        if not self._can_see_org(request.user, device["organizationId"]):
+            raise MockAPIError(403)
+        del self.devices[device["deviceId"]]
+        return 200, None
+
+    def device_associated_installation(self, request: MockRequest):
+        wildxr_number = request.param("wildXRNumber")
+        if not wildxr_number:
+            raise MockAPIError(400, "WildXRNumber is required.")
+        device = self._find_device_by_number(wildxr_number)
+        if device is None:
+            raise MockAPIError(400, "Device not found.")
+        installation = self._find(self.installations, device.get("installationId"))
+        if installation is None:
+            raise MockAPIError(400, "Device is not associated with an installation.")
+        return 200, installation
+
+    # ------------------------------------------------------------------
+    # /Panels
+    # ------------------------------------------------------------------
+
+    def panel_list(self, request: MockRequest):
+        return self._response_dto(request, list(self.panels.values()))
+
+    def panel_search(self, request: MockRequest):
+        return self._response_dto(request, self._name_filter(request, list(self.panels.values())))
+
+    def panel_details(self, request: MockRequest):
+        panel = self._find(self.panels, request.route_args["id"])
+        if panel is None:
+            raise MockAPIError(400, "Panel not found.")
+        return 200, panel
+
+    # ------------------------------------------------------------------
+    # /Videos
+    # ------------------------------------------------------------------
+
+    def video_list(self, request: MockRequest):
+        return self._response_dto(request, list(self.videos.values()), legacy_page_count=True)
+
+    def video_details(self, request: MockRequest):
+        video = self._find(self.videos, request.route_args["id"])
+        if video is None:
+            raise MockAPIError(400, "Video not found.")
+        return 200, video
+
+    def video_query(self, request: MockRequest):
+        name = (request.body_field("name") or "").lower()
+        videos = [v for v in self.videos.values() if name in v["name"].lower()]
+        page = max(int(request.body_field("page") or 1), 1)
+        page_size = int(request.body_field("pageSize") or 0)
+        results = self._page_slice(videos, page, page_size) if page_size > 0 else []
+        return 200, {
+            "page": page,
+            "pageSize": page_size,
+            "pageCount": math.ceil(len(videos) / page_size) if page_size > 0 else 0,
+            "totalCount": len(videos),
+            "results": results,
+        }
+
+    # ------------------------------------------------------------------
+    # /VideoCatalogue
+    # ------------------------------------------------------------------
+
+    def video_catalogue_list(self, request: MockRequest):
+        return 200, list(self.video_catalogues.values())
+
+    def video_catalogue_details(self, request: MockRequest):
+        catalogue = self._find(self.video_catalogues, request.route_args["id"])
+        if catalogue is None:
+            raise MockAPIError(400, "Video catalogue not found.")
+        return 200, catalogue
+
+    def video_catalogue_create(self, request: MockRequest):
+        payload = dict(request.body) if isinstance(request.body, dict) else {}
+        if not payload.get("videoCatalogueId") or payload["videoCatalogueId"] == GUID_EMPTY:
+            payload["videoCatalogueId"] = str(uuid.uuid4())
+        self.video_catalogues[payload["videoCatalogueId"]] = payload
+        return 200, None
+
+    def video_catalogue_delete(self, request: MockRequest):
+        catalogue = self._find(self.video_catalogues, self._require_id(request.param("id"), "Id"))
+        if catalogue is None:
+            raise MockAPIError(400, "Video catalogue not found.")
+        del self.video_catalogues[catalogue["videoCatalogueId"]]
+        return 200, None
+
+    # ------------------------------------------------------------------
+    # Read-only reference lists
+    # ------------------------------------------------------------------
+
+    def reference_list(self, request: MockRequest):
+        return 200, self.reference[request.path.strip("/").lower()]
+
+
+def _route(method: str, template: str, handler: str, requires_auth: bool = True):
+    """(method, compiled case-insensitive path pattern, handler name, requires_auth) for ROUTES."""
+    pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template)
+    return method, re.compile(f"^{pattern}/?$", re.IGNORECASE), handler, requires_auth
+
+
+ROUTES: List[Tuple[str, Pattern, str, bool]] = [
+    _route("POST", "/Users/Authenticate", "authenticate", requires_auth=False),
+    _route("GET", "/Users", "users_list"),
+
+    _route("GET", "/Organization", "organization_list"),
+    _route("GET", "/Organization/search", "organization_search"),
+    _route("GET", "/Organization/{id}/Details", "organization_details"),
+    _route("PUT", "/Organization/Create", "organization_create"),
+    _route("POST", "/Organization/Update", "organization_update"),
+    _route("DELETE", "/Organization/Delete", "organization_delete"),
+
+    _route("GET", "/Installations", "installation_list"),
+    _route("GET", "/Installations/search", "installation_search"),
+    _route("GET", "/Installations/{id}/details", "installation_details"),
+    _route("PUT", "/Installations/create", "installation_create"),
+    _route("POST", "/Installations/update", "installation_update"),
+    _route("DELETE", "/Installations/delete", "installation_delete"),
+
+    _route("GET", "/Device", "device_list"),
+    _route("GET", "/Device/search", "device_search"),
+    _route("GET", "/Device/device-lookup", "device_lookup"),
+    _route("GET", "/Device/GetAssociatedInstallation", "device_associated_installation"),
+    _route("GET", "/Device/{id}/details", "device_details"),
+    _route("POST", "/Device/InitializeNew", "device_initialize_new"),
+    _route("PUT", "/Device/Create", "device_create"),
+    _route("POST", "/Device/Update", "device_update"),
+    _route("DELETE", "/Device/delete", "device_delete"),
+
+    _route("GET", "/Panels", "panel_list"),
+    _route("GET", "/Panels/search", "panel_search"),
+    _route("GET", "/Panels/{id}/details", "panel_details"),
+
+    _route("GET", "/Videos", "video_list"),
+    _route("POST", "/Videos/Query", "video_query"),
+    _route("GET", "/Videos/{id}/Details", "video_details"),
+
+    _route("GET", "/VideoCatalogue", "video_catalogue_list"),
+    _route("GET", "/VideoCatalogue/{id}/details", "video_catalogue_details"),
+    _route("PUT", "/VideoCatalogue/create", "video_catalogue_create"),
+    _route("DELETE", "/VideoCatalogue/delete", "video_catalogue_delete"),
+
+    _route("GET", "/MapMarker", "reference_list"),
+    _route("GET", "/Species", "reference_list"),
+    _route("GET", "/Countries", "reference_list"),
+    _route("GET", "/IUCNStatus", "reference_list"),
+    _route("GET", "/PopulationTrend", "reference_list"),
+    _route("GET", "/Tag", "reference_list"),
+]
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Hands every request to the MockAPIServer that owns the HTTP server."""
+    # HTTP/1.1 keeps connections open for the pooled requests sessions
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.mock.handle(self)
+
+    do_POST = do_PUT = do_DELETE = do_GET
+
+    def log_message(self, format, *args):
+        logger.debug(f"Mock API: {format % args}")
+
+
+class MockAPIServer:
+    """
+    The local WildXR API stand-in.
+
+    Example:
+        >>> server = MockAPIServer().start()
+        >>> requests.post(f"{server.api_url}/Users/Authenticate", json={...})
+        >>> server.stop()
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = MOCK_API_PORT):
+        self.host = host
+        self.port = port
+        self.faults = FaultSettings()
+        self.stats = MockAPIStats()
+        self._secret = secrets.token_bytes(32)
+        self._lock = threading.RLock()
+        self._path_counters: Dict[Tuple[str, str], int] = {}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.store = MockWildXRStore(self._users_from_env())
+
+    @staticmethod
+    def _users_from_env() -> Dict[str, Dict[str, Any]]:
+        """Users that can log in: the system admin and every org admin persona with credentials set."""
+        users = {}
+        for persona in ("SYS_ADMIN", *PERSONA_ORGANIZATIONS):
+            username, password = os.getenv(f"{persona}_USERNAME"), os.getenv(f"{persona}_PASSWORD")
+            if username and password:
+                users[username] = {
+                    "userId": _seed_id(f"user:{persona}"),
+                    "persona": persona,
+                    "password": password,
+                    "role": "SysAdmin" if persona == "SYS_ADMIN" else "OrgAdmin",
+                    "organizationIds": [],
+                }
+        return users
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def api_url(self) -> str:
+        """Value for API_BASE_URL."""
+        return f"{self.base_url}{API_PREFIX}"
+
+    def start(self) -> 'MockAPIServer':
+        """Bind the port and serve requests on a daemon thread."""
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _RequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-api", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Mock WildXR API listening on {self.api_url} "
+            f"({len(self.store.videos)} videos, {len(self.store.users)} users)"
+        )
+        return self
+
+    def stop(self):
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._httpd = None
+        logger.info(f"Mock WildXR API stopped after {self.stats.requests} request(s)")
+
+    def reset(self):
+        """Restore the seeded data, the configured fault settings and the request counters."""
+        with self._lock:
+            self.store = MockWildXRStore(self._users_from_env())
+            self.faults = FaultSettings()
+            self.stats = MockAPIStats()
+            self._path_counters.clear()
+
+    # ------------------------------------------------------------------
+    # Tokens
+    # ------------------------------------------------------------------
+
+    def issue_token(self, username: str) -> str:
+        header = _b64url(json.dumps({"alg": "HS256", "typ": "JWT"}).encode("utf-8"))
+        payload = _b64url(json.dumps({
+            "unique_name": username,
+            "exp": int(time.time()) + TOKEN_LIFETIME_SECONDS,
+        }).encode("utf-8"))
+        signature = _b64url(hmac.new(self._secret, f"{header}.{payload}".encode("ascii"), hashlib.sha256).digest())
+        return f"{header}.{payload}.{signature}"
+
+    def _user_for_token(self, authorization: Optional[str]) -> Optional[Dict[str, Any]]:
+        """The user a 'Bearer <jwt>' header belongs to, or None if it is missing, forged or expired."""
+        if not authorization or not authorization.startswith("Bearer "):
+            return None
+        parts = authorization[len("Bearer "):].strip().split(".")
+        if len(parts) != 3:
+            return None
+        expected = _b64url(hmac.new(self._secret, f"{parts[0]}.{parts[1]}".encode("ascii"), hashlib.sha256).digest())
+        if not hmac.compare_digest(expected, parts[2]):
+            return None
+        try:
+            claims = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+        except ValueError:
+            return None
+        if claims.get("exp", 0) < time.time():
+            return None
+        return self.store.users.get(claims.get("unique_name"))
+
+    def authenticate(self, request: MockRequest):
+        username, password = request.body_field("username"), request.body_field("password")
+        if not username or not password:
+            raise _validation_error("Username", "The Username and Password fields are required.")
+        user = self.store.users.get(username)
+        if user is None or not hmac.compare_digest(user["password"], password):
+            raise MockAPIError(400, {"message": "Username or password is incorrect"})
+        return 200, {
+            "id": user["userId"],
+            "username": username,
+            "role": user["role"],
+            "token": self.issue_token(username),
+        }
+
+    # ------------------------------------------------------------------
+    # Fault injection
+    # ------------------------------------------------------------------
+
+    def set_faults(self, **settings) -> FaultSettings:
+        """
+        Change latency/error settings. Unknown names raise TypeError.
+
+        Args:
+            **settings: Any of latency_ms, jitter_ms, error_rate, error_status, seed.
+        """
+        with self._lock:
+            current = asdict(self.faults)
+            current.update(settings)
+            self.faults = FaultSettings(**current)
+            return self.faults
+
+    def reset_faults(self) -> FaultSettings:
+        """Restore the configured MOCK_API_* fault settings and drop pending fail_next() entries."""
+        with self._lock:
+            self.faults = FaultSettings()
+            return self.faults
+
+    def fail_next(self, count: int, status: int = 503, path: Optional[str] = None):
+        """
+        Answer the next count API requests whose path matches the regex path
+        (every path if None) with status.
+        """
+        with self._lock:
+            self.faults.scripted.append({"remaining": count, "status": status, "path": path})
+
+    def _fraction(self, method: str, path: str, n: int, purpose: str) -> float:
+        """Deterministic value in [0, 1) for the nth request to a path."""
+        digest = hashlib.sha256(f"{self.faults.seed}|{purpose}|{method}|{path}|{n}".encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+    def _plan_faults(self, method: str, path: str) -> Tuple[float, Optional[int]]:
+        """(delay in seconds, injected status or None) for one API request."""
+        with self._lock:
+            key = (method, path.lower())
+            n = self._path_counters.get(key, 0)
+            self._path_counters[key] = n + 1
+            faults = self.faults
+
+            delay_ms = faults.latency_ms
+            if faults.jitter_ms:
+                delay_ms += faults.jitter_ms * self._fraction(method, key[1], n, "jitter")
+
+            injected = None
+            for entry in faults.scripted:
+                if entry["remaining"] > 0 and (entry["path"] is None or re.search(entry["path"], path, re.IGNORECASE)):
+                    entry["remaining"] -= 1
+                    injected = entry["status"]
+                    break
+            faults.scripted = [entry for entry in faults.scripted if entry["remaining"] > 0]
+            if injected is None and faults.error_rate > 0 and self._fraction(method, key[1], n, "error") < faults.error_rate:
+                injected = faults.error_status
+            return delay_ms / 1000, injected
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def handle(self, http: BaseHTTPRequestHandler):
+        parsed = urlparse(http.path)
+        length = int(http.headers.get("Content-Length") or 0)
+        raw_body = http.rfile.read(length) if length else b""
+
+        if parsed.path.startswith(CONTROL_PREFIX):
+            status, body = self._handle_control(http.command, parsed.path[len(CONTROL_PREFIX):], raw_body)
+            self._send(http, status, body)
+            return
+
+        delay, injected = self._plan_faults(http.command, parsed.path)
+        if delay > 0:
+            time.sleep(delay)
+        if injected is not None:
+            status, body = injected, {"message": f"Injected {injected} from the mock API"}
+        else:
+            status, body = self._dispatch(http, parsed, raw_body)
+
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.by_status[status] = self.stats.by_status.get(status, 0) + 1
+            self.stats.latency_ms += delay * 1000
+            if injected is not None:
+                self.stats.injected_errors += 1
+        self._send(http, status, body)
+
+    def _dispatch(self, http: BaseHTTPRequestHandler, parsed, raw_body: bytes) -> Tuple[int, Any]:
+        if not parsed.path.lower().startswith(API_PREFIX):
+            return 404, None
+        path = parsed.path[len(API_PREFIX):] or "/"
+
+        matched = [(method, match, handler, requires_auth)
+                   for method, pattern, handler, requires_auth in ROUTES
+                   for match in [pattern.match(path)] if match]
+        if not matched:
+            return 404, None
+        route = next((entry for entry in matched if entry[0] == http.command), None)
+        if route is None:
+            return 405, None
+        _, match, handler_name, requires_auth = route
+
+        try:
+            body = json.loads(raw_body) if raw_body else None
+        except ValueError:
+            return 400, {"title": "The request body is not valid JSON.", "status": 400}
+        request = MockRequest(
+            method=http.command,
+            path=path,
+            params={name.lower(): value for name, value in parse_qsl(parsed.query, keep_blank_values=True)},
+            body=body,
+            route_args=match.groupdict(),
+        )
+
+        with self._lock:
+            if requires_auth:
+                request.user = self._user_for_token(http.headers.get("Authorization"))
+                if request.user is None:
+                    return 401, {"message": "Unauthorized"}
+            handler = getattr(self, handler_name, None) or getattr(self.store, handler_name)
+            try:
+                return handler(request)
+            except MockAPIError as e:
+                return e.status, e.body
+
+    def _handle_control(self, method: str, path: str, raw_body: bytes) -> Tuple[int, Any]:
+        """The /__mock__ endpoints used by MockAPIControl."""
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+            if method == "GET" and path == "/stats":
+                return 200, asdict(self.stats)
+            if method == "GET" and path == "/faults":
+                return 200, asdict(self.faults)
+            if method == "POST" and path == "/faults":
+                return 200, asdict(self.set_faults(**body))
+            if method == "POST" and path == "/faults/reset":
+                return 200, asdict(self.reset_faults())
+            if method == "POST" and path == "/fail-next":
+                self.fail_next(body["count"], body.get("status", 503), body.get("path"))
+                return 200, asdict(self.faults)
+            if method == "POST" and path == "/reset":
+                self.reset()
+                return 200, None
+        except (ValueError, TypeError, KeyError) as e:
+            return 400, {"message": str(e)}
+        return 404, None
+
+    @staticmethod
+    def _send(http: BaseHTTPRequestHandler, status: int, body: Any):
+        if body is None:
+            payload, content_type = b"", None
+        elif isinstance(body, str):
+            payload, content_type = body.encode("utf-8"), "text/plain; charset=utf-8"
+        else:
+            payload = json.dumps(body).encode("utf-8")
+            content_type = "application/problem+json" if "errors" in body and "title" in body \
+                else "application/json; charset=utf-8"
+        http.send_response(status)
+        if content_type:
+            http.send_header("Content-Type", content_type)
+        http.send_header("Content-Length", str(len(payload)))
+        http.end_headers()
+        if payload and http.command != "HEAD":
+            http.wfile.write(payload)
+
+
+class MockAPIControl:
+    """
+    Client for a running MockAPIServer's /__mock__ control endpoints.
+
+    Works from any process, so xdist workers can adjust the server the
+    controller started. Fault settings are server-wide: under xdist they also
+    affect other workers' requests, so prefer fail_next() with a path.
+
+    Example:
+        >>> control = MockAPIControl(os.environ["API_BASE_URL"])
+        >>> control.fail_next(2, status=503, path=r"/Videos$")
+    """
+
+    def __init__(self, api_url: str):
+        """
+        Args:
+            api_url: The mock's API_BASE_URL, e.g. 'http://127.0.0.1:54321/api'.
+        """
+        parsed = urlparse(api_url)
+        self.control_url = f"{parsed.scheme}://{parsed.netloc}{CONTROL_PREFIX}"
+
+    def _call(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Any:
+        response = requests.request(method, f"{self.control_url}{path}", json=body, timeout=10)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    def set_faults(self, **settings) -> Dict[str, Any]:
+        """Change any of latency_ms, jitter_ms, error_rate, error_status, seed. Returns the new settings."""
+        return self._call("POST", "/faults", settings)
+
+    def fail_next(self, count: int, status: int = 503, path: Optional[str] = None) -> Dict[str, Any]:
+        """Answer the next count requests matching the path regex with status."""
+        return self._call("POST", "/fail-next", {"count": count, "status": status, "path": path})
+
+    def clear_faults(self) -> Dict[str, Any]:
+        """
+        Undo a test's fault changes: restore the configured MOCK_API_* settings
+        and drop pending fail_next() entries. Returns the restored settings.
+        """
+        return self._call("POST", "/faults/reset")
+
+    def stats(self) -> Dict[str, Any]:
+        return self._call("GET", "/stats")
+
+    def reset(self):
+        """Restore the seeded data, the configured fault settings and the counters."""
+        self._call("POST", "/reset")
@@ -0,0 +1,131 @@
+# network_profile.py
+"""
+Request blocking profiles for UI browser contexts.
+
+Element-presence tests never look at video thumbnails, media or web fonts, yet
+every fresh context downloaded them. A ResourceBlocker attached to a context
+with context.route() handles those requests by resource type:
+
+    stub   answer with a 1x1 transparent GIF, so <img> elements still load and
+           keep their layout
+    abort  fail the request without touching the network
+
+logged_in_page in conftest.py attaches one per context using the profile chosen
+with --block-resources (default RESOURCE_BLOCK_PROFILE). Tests marked
+@pytest.mark.needs_media get the 'none' profile instead.
+
+Request counts are exact. Blocked requests never reach the server, so their
+size is only known when the same URL was seen unblocked earlier in this
+process (e.g. in a needs_media test); the others are counted as unsized.
+"""
+import base64
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from utilities.utils import logger
+
+# resource type (Request.resource_type) -> action, per profile
+BLOCK_PROFILES: Dict[str, Dict[str, str]] = {
+    "none": {},
+    "media": {"image": "stub", "media": "abort", "font": "abort"},
+    "strict": {"image": "abort", "media": "abort", "font": "abort"},
+}
+
+TRANSPARENT_GIF = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+
+
+@dataclass
+class BlockedResourceStats:
+    """
+    What a ResourceBlocker kept off the network for one context.
+
+    Attributes:
+        requests: Resource type -> number of requests stubbed or aborted.
+        bytes_saved: Total size of the blocked requests whose size is known.
+        unsized: Blocked requests whose size is unknown.
+    """
+    requests: Dict[str, int] = field(default_factory=dict)
+    bytes_saved: int = 0
+    unsized: int = 0
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.requests.values())
+
+    def summary(self) -> str:
+        """e.g. '42 request(s) (font 4, image 38), 1.8 MB saved, 7 unsized'"""
+        by_type = ", ".join(f"{resource_type} {count}" for resource_type, count in sorted(self.requests.items()))
+        return (
+            f"{self.total_requests} request(s) ({by_type or 'none'}), "
+            f"{self.bytes_saved / (1024 * 1024):.1f} MB saved, {self.unsized} unsized"
+        )
+
+
+class ResourceBlocker:
+    """
+    Route handler that stubs or aborts requests by resource type for one context.
+
+    Response sizes seen on any context in this process are shared at class
+    level, so blocked requests for a known URL are counted with their real size.
+    """
+    _sizes: Dict[str, int] = {}
+    _sizes_lock = threading.Lock()
+
+    def __init__(self, profile: str):
+        """
+        Args:
+            profile: Key of BLOCK_PROFILES.
+
+        Raises:
+            ValueError: If the profile does not exist.
+        """
+        if profile not in BLOCK_PROFILES:
+            raise ValueError(f"Unknown resource profile '{profile}'. Available profiles: {', '.join(BLOCK_PROFILES)}")
+        self.profile = profile
+        self.rules = BLOCK_PROFILES[profile]
+        self.stats = BlockedResourceStats()
+
+    def attach(self, context):
+        """
+        Start handling the context's requests.
+
+        Requests the profile does not block are passed on with route.fallback(),
+        so other route handlers on the context still see them.
+        """
+        context.on("response", self._learn_size)
+        if self.rules:
+            context.route("**/*", self._handle)
+
+    def _handle(self, route):
+        resource_type = route.request.resource_type
+        action = self.rules.get(resource_type)
+        if action is None:
+            route.fallback()
+            return
+
+        self.stats.requests[resource_type] = self.stats.requests.get(resource_type, 0) + 1
+        size = self._known_size(route.request.url)
+        if size is None:
+            self.stats.unsized += 1
+        else:
+            self.stats.bytes_saved += size
+
+        if action == "stub":
+            route.fulfill(status=200, content_type="image/gif", body=TRANSPARENT_GIF)
+        else:
+            route.abort("blockedbyclient")
+
+    def _learn_size(self, response):
+        """Remember the Content-Length of every response that reached the network."""
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            with self._sizes_lock:
+                self._sizes[response.url] = int(length)
+
+    def _known_size(self, url: str) -> Optional[int]:
+        with self._sizes_lock:
+            return self._sizes.get(url)
+
+    def log_summary(self, test_name: str):
+        if self.stats.total_requests:
+            logger.info(f"Blocked for {test_name} ({self.profile} profile): {self.stats.summary()}")
@@ -0,0 +1,411 @@
+# perf_baseline.py
+"""
+Performance history for the test suite, and detection of regressions in it.
+
+The response-time assertions only compare one run with a fixed threshold, so a
+request that slows from 0.8s to 1.5s still passes under a 2s threshold.
+BaselineStore keeps every run's timings in a SQLite file (PERF_BASELINE_DB),
+and compare_run() checks the current run against a rolling baseline of the
+PERF_BASELINE_WINDOW previous runs in the same environment.
+
+Two kinds of metric are recorded per run:
+
+    endpoint  response.elapsed of every 2xx response sent through APIBase,
+              per method and path. GUIDs and numeric ids in the path become
+              {id}, so GET /Videos/<guid> is one metric. Collected per process
+              by EndpointTimings.
+    test      the call-phase duration of every passed test, per node id
+
+A metric is a regression only if all of these hold:
+
+    - the slowdown is statistically significant (p < PERF_REGRESSION_ALPHA)
+    - the current median is at least PERF_REGRESSION_MIN_RATIO times the
+      baseline median
+    - and at least PERF_REGRESSION_MIN_DELTA_SECONDS slower
+
+With PERF_MIN_SAMPLES or more samples in the current run (endpoints), the test
+is a one-sided Mann-Whitney U test of the current samples against the pooled
+baseline samples. With fewer (tests have one sample per run), the current
+median is compared with the baseline's per-run medians as a robust z-score
+(median and MAD). Metrics with fewer than PERF_BASELINE_MIN_RUNS baseline runs
+are reported as 'insufficient-history' and never flagged.
+
+Runs are only compared with runs from the same environment string (API target,
+--api-mode/--mock-api, xdist worker count, ...), see conftest.py.
+"""
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from statistics import median
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from utilities.config import (
+    PERF_BASELINE_DB,
+    PERF_BASELINE_KEEP_RUNS,
+    PERF_BASELINE_MIN_RUNS,
+    PERF_BASELINE_WINDOW,
+    PERF_MIN_SAMPLES,
+    PERF_REGRESSION_ALPHA,
+    PERF_REGRESSION_MIN_DELTA_SECONDS,
+    PERF_REGRESSION_MIN_RATIO,
+)
+from utilities.utils import logger
+
+METRIC_KINDS = ("endpoint", "test")
+
+# Path segments that identify one record: GUIDs and plain numbers
+ID_SEGMENT_PATTERN = re.compile(r"^(?:[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}|\d+)$")
+
+# (kind, name) -> samples in seconds
+Samples = Dict[Tuple[str, str], List[float]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    environment TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_by_run ON samples (run_id, kind, name);
+CREATE INDEX IF NOT EXISTS runs_by_environment ON runs (environment, run_id);
+"""
+
+
+def endpoint_metric(method: str, endpoint: str) -> str:
+    """
+    Metric name for a request, e.g. 'GET /Videos/{id}'.
+
+    Args:
+        method: HTTP method.
+        endpoint: Endpoint path relative to API_BASE_URL, optionally with a query string.
+    """
+    path = endpoint.split("?", 1)[0]
+    segments = ["{id}" if ID_SEGMENT_PATTERN.match(segment) else segment for segment in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+class EndpointTimings:
+    """
+    Singleton collecting response.elapsed of the 2xx responses sent through
+    APIBase in this process (one xdist worker), per endpoint metric.
+    """
+    _instance: Optional['EndpointTimings'] = None
+    _samples: Dict[str, List[float]] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(EndpointTimings, cls).__new__(cls)
+        return cls._instance
+
+    def add(self, method: str, endpoint: str, seconds: float):
+        name = endpoint_metric(method, endpoint)
+        with self._lock:
+            self._samples.setdefault(name, []).append(seconds)
+
+    @property
+    def samples(self) -> Dict[str, List[float]]:
+        """Metric name -> samples, copied."""
+        with self._lock:
+            return {name: list(values) for name, values in self._samples.items()}
+
+
+@dataclass
+class MetricComparison:
+    """
+    One metric of the current run compared with the rolling baseline.
+
+    Attributes:
+        kind: 'endpoint' or 'test'.
+        name: Endpoint metric or test node id.
+        status: 'regression', 'ok' or 'insufficient-history'.
+        samples: Samples in the current run.
+        current_median: Median of the current samples, in seconds.
+        baseline_runs: Baseline runs that have this metric.
+        baseline_median: Median of the baseline's per-run medians, or None.
+        ratio: current_median / baseline_median, or None.
+        p_value: One-sided p-value of the slowdown, or None.
+        method: 'mann-whitney', 'robust-z' or None.
+    """
+    kind: str
+    name: str
+    status: str
+    samples: int
+    current_median: float
+    baseline_runs: int = 0
+    baseline_median: Optional[float] = None
+    ratio: Optional[float] = None
+    p_value: Optional[float] = None
+    method: Optional[str] = None
+
+
+@dataclass
+class RunComparison:
+    """
+    Result of compare_run() for one run.
+
+    Attributes:
+        run_id: Id of the current run in the store.
+        environment: Environment string the baseline was selected by.
+        baseline_run_ids: Runs making up the rolling baseline, newest first.
+        metrics: One comparison per metric of the current run.
+    """
+    run_id: int
+    environment: str
+    baseline_run_ids: List[int] = field(default_factory=list)
+    metrics: List[MetricComparison] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> List[MetricComparison]:
+        """Regressed metrics, largest slowdown first."""
+        found = [metric for metric in self.metrics if metric.status == "regression"]
+        return sorted(found, key=lambda metric: metric.ratio or 0.0, reverse=True)
+
+    def count(self, status: str) -> int:
+        return sum(1 for metric in self.metrics if metric.status == status)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "environment": self.environment,
+            "baseline_run_ids": self.baseline_run_ids,
+            "settings": {
+                "window": PERF_BASELINE_WINDOW,
+                "min_runs": PERF_BASELINE_MIN_RUNS,
+                "min_samples": PERF_MIN_SAMPLES,
+                "alpha": PERF_REGRESSION_ALPHA,
+                "min_ratio": PERF_REGRESSION_MIN_RATIO,
+                "min_delta_seconds": PERF_REGRESSION_MIN_DELTA_SECONDS,
+            },
+            "summary": {status: self.count(status) for status in ("regression", "ok", "insufficient-history")},
+            "regressions": [asdict(metric) for metric in self.regressions],
+            "metrics": [asdict(metric) for metric in self.metrics],
+        }
+
+    def write_report(self, path: str) -> str:
+        """Write to_dict() as JSON (atomically) and return the path."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(f"{path}.tmp", path)
+        return path
+
+
+class BaselineStore:
+    """
+    SQLite file holding the timings of every recorded run.
+
+    Only the controller (or a serial run) writes to it, once per run.
+    """
+
+    def __init__(self, path: str = PERF_BASELINE_DB):
+        """
+        Args:
+            path: SQLite file; created with its directory if missing.
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def add_run(self, environment: str, samples: Samples, started_at: float,
+                metadata: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Store one run and its samples.
+
+        Args:
+            environment: Runs are only compared within the same environment.
+            samples: (kind, name) -> samples in seconds.
+            started_at: Session start as a Unix timestamp.
+            metadata: Anything worth keeping with the run (options, counts).
+
+        Returns:
+            int: The new run's id.
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (environment, started_at, finished_at, metadata) VALUES (?, ?, ?, ?)",
+                (environment, started_at, time.time(), json.dumps(metadata or {})),
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO samples (run_id, kind, name, seconds) VALUES (?, ?, ?, ?)",
+                ((run_id, kind, name, seconds) for (kind, name), values in samples.items() for seconds in values),
+            )
+        return run_id
+
+    def previous_runs(self, environment: str, before_run_id: int, limit: int = PERF_BASELINE_WINDOW) -> List[int]:
+        """Ids of the last `limit` runs in the environment before `before_run_id`, newest first."""
+        rows = self.connection.execute(
+            "SELECT run_id FROM runs WHERE environment = ? AND run_id < ? ORDER BY run_id DESC LIMIT ?",
+            (environment, before_run_id, limit),
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def samples_for_runs(self, run_ids: Iterable[int]) -> Dict[Tuple[str, str], Dict[int, List[float]]]:
+        """(kind, name) -> run id -> samples, for the given runs."""
+        run_ids = list(run_ids)
+        result: Dict[Tuple[str, str], Dict[int, List[float]]] = {}
+        if not run_ids:
+            return result
+        placeholders = ", ".join("?" for _ in run_ids)
+        rows = self.connection.execute(
+            f"SELECT run_id, kind, name, seconds FROM samples WHERE run_id IN ({placeholders})", run_ids
+        )
+        for run_id, kind, name, seconds in rows:
+            result.setdefault((kind, name), {}).setdefault(run_id, []).append(seconds)
+        return result
+
+    def prune(self, environment: str, keep: int = PERF_BASELINE_KEEP_RUNS) -> int:
+        """Delete all but the newest `keep` runs of the environment and return how many were removed."""
+        with self.connection:
+            cursor = self.connection.execute(
+                "DELETE FROM runs WHERE environment = ? AND run_id NOT IN "
+                "(SELECT run_id FROM runs WHERE environment = ? ORDER BY run_id DESC LIMIT ?)",
+                (environment, environment, keep),
+            )
+        return cursor.rowcount
+
+
+def mann_whitney_greater(current: List[float], baseline: List[float]) -> float:
+    """
+    One-sided p-value that `current` tends to be larger than `baseline`.
+
+    Normal approximation of the Mann-Whitney U statistic with tie correction
+    and continuity correction; adequate from about five samples per side.
+    """
+    n1, n2 = len(current), len(baseline)
+    pooled = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    n = n1 + n2
+    rank_sum = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        tied = j - i + 1
+        midrank = (i + j) / 2 + 1
+        rank_sum += midrank * sum(1 for k in range(i, j + 1) if pooled[k][1] == 0)
+        tie_term += tied ** 3 - tied
+        i = j + 1
+    u = rank_sum - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def robust_z_greater(value: float, baseline: List[float]) -> float:
+    """
+    One-sided p-value that `value` is larger than the baseline values, from the
+    robust z-score (value - median) / (1.4826 * MAD).
+    """
+    center = median(baseline)
+    mad = median(abs(x - center) for x in baseline)
+    if mad == 0:
+        return 0.0 if value > center else 1.0
+    z = (value - center) / (1.4826 * mad)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_metric(kind: str, name: str, current: List[float],
+                   baseline: Dict[int, List[float]]) -> MetricComparison:
+    """
+    Compare one metric's current samples with its samples in the baseline runs.
+
+    Args:
+        kind: 'endpoint' or 'test'.
+        name: Metric name.
+        current: Samples in the current run (not empty).
+        baseline: Baseline run id -> samples, only runs that have the metric.
+    """
+    current_median = median(current)
+    comparison = MetricComparison(kind=kind, name=name, status="insufficient-history",
+                                  samples=len(current), current_median=round(current_median, 4),
+                                  baseline_runs=len(baseline))
+    if len(baseline) < PERF_BASELINE_MIN_RUNS:
+        return comparison
+
+    run_medians = [median(values) for values in baseline.values()]
+    baseline_median = median(run_medians)
+    if len(current) >= PERF_MIN_SAMPLES:
+        comparison.method = "mann-whitney"
+        p_value = mann_whitney_greater(current, [value for values in baseline.values() for value in values])
+    else:
+        comparison.method = "robust-z"
+        p_value = robust_z_greater(current_median, run_medians)
+
+    comparison.baseline_median = round(baseline_median, 4)
+    comparison.ratio = round(current_median / baseline_median, 3) if baseline_median > 0 else None
+    comparison.p_value = round(p_value, 6)
+    slower = (
+        baseline_median > 0
+        and current_median >= baseline_median * PERF_REGRESSION_MIN_RATIO
+        and current_median - baseline_median >= PERF_REGRESSION_MIN_DELTA_SECONDS
+    )
+    comparison.status = "regression" if slower and p_value < PERF_REGRESSION_ALPHA else "ok"
+    return comparison
+
+
+def compare_run(store: BaselineStore, run_id: int, environment: str, samples: Samples) -> RunComparison:
+    """
+    Compare a stored run with the PERF_BASELINE_WINDOW runs before it.
+
+    Args:
+        store: The baseline store holding the run.
+        run_id: Id returned by add_run() for the current run.
+        environment: The run's environment string.
+        samples: The current run's samples, as passed to add_run().
+    """
+    baseline_run_ids = store.previous_runs(environment, run_id)
+    baseline_samples = store.samples_for_runs(baseline_run_ids)
+    result = RunComparison(run_id=run_id, environment=environment, baseline_run_ids=baseline_run_ids)
+    for (kind, name), values in sorted(samples.items()):
+        if values:
+            result.metrics.append(compare_metric(kind, name, values, baseline_samples.get((kind, name), {})))
+    return result
+
+
+def record_and_compare(environment: str, samples: Samples, started_at: float,
+                       metadata: Optional[Dict[str, Any]] = None,
+                       path: str = PERF_BASELINE_DB) -> RunComparison:
+    """
+    Store the run, compare it with its rolling baseline and prune old runs.
+
+    Returns:
+        RunComparison: The comparison, ready for write_report().
+    """
+    store = BaselineStore(path)
+    try:
+        run_id = store.add_run(environment, samples, started_at, metadata)
+        comparison = compare_run(store, run_id, environment, samples)
+        removed = store.prune(environment)
+    finally:
+        store.close()
+    logger.info(
+        f"Performance baseline: run {run_id} ({environment}) compared with {len(comparison.baseline_run_ids)} "
+        f"earlier run(s), {len(comparison.regressions)} regression(s)"
+        + (f", pruned {removed} old run(s)" if removed else "")
+    )
+    return comparison
@@ -0,0 +1,223 @@
+# phase_timing.py
+"""
+Where a test's time goes: per-phase, per-fixture and per-activity timings for --phase-timing.
+
+A slow UI test can be slow because of its login state, navigation, data seeding
+or its own body, and report.duration only gives the total per phase. With
+--phase-timing, the hooks in conftest.py feed PhaseTimer, which collects for
+the running test:
+
+    fixtures  wall time of every fixture setup, and of its teardown (the
+              yield fixture's code after the yield), with the fixture's scope.
+              Fixtures of a wider scope are charged to the test that set them
+              up or tore them down.
+    http      wall time spent in requests on the pooled HTTP sessions
+              (utilities/http_session.py): APIBase, bulk seeding and the
+              conftest helpers
+    navigation wall time spent in Playwright page.goto, reload, go_back,
+              go_forward, wait_for_url and wait_for_load_state
+
+The http and navigation time is split by the phase it happened in (setup,
+call, teardown), so seeding in a fixture shows up as setup http time and the
+test's own requests as call http time. Requests made on several threads at
+once (bulk seeding) are summed, so http time can exceed the phase's wall time.
+
+PhaseTimer covers this process (one xdist worker). finish_test() hands the
+test's breakdown to the teardown report, which carries it to the controller.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+ACTIVITIES = ("http", "navigation")
+PHASES = ("setup", "call", "teardown")
+# Playwright Page methods timed as navigation by instrument_playwright()
+NAVIGATION_METHODS = ("goto", "reload", "go_back", "go_forward", "wait_for_url", "wait_for_load_state")
+# Fixture setups/teardowns faster than this are left out of the per-test breakdown
+FIXTURE_MIN_SECONDS = 0.001
+
+
+class PhaseTimer:
+    """
+    Singleton collecting the running test's fixture and activity timings.
+
+    Does nothing until enable() is called, so the HTTP session and Playwright
+    instrumentation costs nothing without --phase-timing.
+    """
+    _instance: Optional['PhaseTimer'] = None
+    _enabled: bool = False
+    _phase: str = "setup"
+    _fixtures: List[Dict[str, Any]] = []
+    _activity: Dict[str, Dict[str, List[float]]] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PhaseTimer, cls).__new__(cls)
+        return cls._instance
+
+    def enable(self):
+        """Start collecting in this process and time Playwright navigations."""
+        PhaseTimer._enabled = True
+        instrument_playwright()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def start_test(self):
+        """Begin a new test in its setup phase."""
+        with self._lock:
+            PhaseTimer._phase = "setup"
+            PhaseTimer._fixtures = []
+            PhaseTimer._activity = {}
+
+    def set_phase(self, phase: str):
+        """Charge the http and navigation time from now on to `phase`."""
+        PhaseTimer._phase = phase
+
+    def add_fixture(self, name: str, scope: str, phase: str, seconds: float):
+        """
+        Record one fixture setup or teardown.
+
+        Args:
+            name: Fixture name.
+            scope: 'function', 'class', 'module', 'package' or 'session'.
+            phase: 'setup' or 'teardown'.
+            seconds: Wall time.
+        """
+        with self._lock:
+            self._fixtures.append({"name": name, "scope": scope, "phase": phase, "seconds": seconds})
+
+    @contextmanager
+    def measure(self, activity: str):
+        """
+        Time the enclosed block as `activity` ('http' or 'navigation') in the
+        current phase. A no-op when not enabled.
+        """
+        if not self._enabled:
+            yield
+            return
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start_time
+            with self._lock:
+                totals = self._activity.setdefault(self._phase, {}).setdefault(activity, [0.0, 0])
+                totals[0] += seconds
+                totals[1] += 1
+
+    def finish_test(self) -> Dict[str, Any]:
+        """
+        The running test's breakdown, ready to travel in a report's user_properties.
+
+        Returns:
+            dict: 'fixtures' (setups/teardowns of at least FIXTURE_MIN_SECONDS,
+            slowest first), 'activity' (phase -> activity -> {seconds, count})
+            and 'fixture_totals' (fixture name -> totals, for build_report()).
+        """
+        with self._lock:
+            fixtures = sorted(
+                (dict(record, seconds=round(record["seconds"], 4)) for record in self._fixtures
+                 if record["seconds"] >= FIXTURE_MIN_SECONDS),
+                key=lambda record: record["seconds"], reverse=True,
+            )
+            activity = {
+                phase: {name: {"seconds": round(seconds, 4), "count": count}
+                        for name, (seconds, count) in activities.items()}
+                for phase, activities in self._activity.items()
+            }
+            # Totals per fixture, including the fast ones left out above, for the run-wide table
+            fixture_totals: Dict[str, Dict[str, Any]] = {}
+            for record in self._fixtures:
+                totals = fixture_totals.setdefault(
+                    record["name"], {"scope": record["scope"], "setups": 0, "setup": 0.0, "teardown": 0.0, "max": 0.0}
+                )
+                totals["setups"] += record["phase"] == "setup"
+                totals[record["phase"]] += record["seconds"]
+                totals["max"] = max(totals["max"], record["seconds"])
+        return {"fixtures": fixtures, "activity": activity, "fixture_totals": fixture_totals}
+
+
+def build_report(tests: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine the per-test breakdowns of a run into the --phase-timing report.
+
+    Args:
+        tests: Node id -> {'phases': phase -> report.duration, plus the keys
+            returned by finish_test()}.
+
+    Returns:
+        dict: 'tests' (slowest first, with the total of their phases) and
+        'fixtures' (per fixture name, largest setup + teardown total first).
+    """
+    fixtures: Dict[str, Dict[str, Any]] = {}
+    entries = []
+    for nodeid, breakdown in tests.items():
+        phases = {phase: round(seconds, 4) for phase, seconds in breakdown.get("phases", {}).items()}
+        entries.append({
+            "nodeid": nodeid,
+            "total": round(sum(phases.values()), 4),
+            "phases": phases,
+            "activity": breakdown.get("activity", {}),
+            "fixtures": breakdown.get("fixtures", []),
+        })
+        for name, totals in breakdown.get("fixture_totals", {}).items():
+            summary = fixtures.setdefault(name, {"name": name, "scope": totals["scope"], "setups": 0,
+                                                 "setup": 0.0, "teardown": 0.0, "max": 0.0})
+            summary["setups"] += totals["setups"]
+            summary["setup"] += totals["setup"]
+            summary["teardown"] += totals["teardown"]
+            summary["max"] = max(summary["max"], totals["max"])
+
+    for summary in fixtures.values():
+        summary["total"] = round(summary["setup"] + summary["teardown"], 4)
+        summary["mean_setup"] = round(summary["setup"] / summary["setups"], 4) if summary["setups"] else 0.0
+        for key in ("setup", "teardown", "max"):
+            summary[key] = round(summary[key], 4)
+    return {
+        "tests": sorted(entries, key=lambda entry: entry["total"], reverse=True),
+        "fixtures": sorted(fixtures.values(), key=lambda summary: summary["total"], reverse=True),
+    }
+
+
+def activity_seconds(entry: Dict[str, Any], activity: str) -> float:
+    """Seconds of one activity ('http' or 'navigation') across all phases of a build_report() test entry."""
+    return sum(activities.get(activity, {}).get("seconds", 0.0) for activities in entry["activity"].values())
+
+
+def _timed_navigation(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with PhaseTimer().measure("navigation"):
+            return method(*args, **kwargs)
+    wrapper._phase_timed = True
+    return wrapper
+
+
+def instrument_playwright():
+    """
+    Wrap the NAVIGATION_METHODS of playwright.sync_api.Page so their time is
+    recorded as navigation. Safe to call more than once.
+    """
+    from playwright.sync_api import Page
+    for name in NAVIGATION_METHODS:
+        method = getattr(Page, name)
+        if not getattr(method, "_phase_timed", False):
+            setattr(Page, name, _timed_navigation(method))
+
+
+def write_report(report: Dict[str, Any], path: str) -> str:
+    """Write a build_report() result as JSON (atomically) and return the path."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(report, f, indent=2)
+    os.replace(f"{path}.tmp", path)
+    return path
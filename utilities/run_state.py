@@ -0,0 +1,160 @@
+# run_state.py
+"""
+Run-wide "do it once" coordination between pytest-xdist workers.
+
+Under -n N, each worker used to run the same setup on its own: the delete
+endpoint check, the orphaned record cleanup, and the seeded pool check and
+top-up. That work was repeated once per worker. The top-up could even run in
+two workers at once and create duplicate pool records.
+
+RunState keeps a JSON state file in a directory shared by every worker in the
+run, plus one filelock.FileLock per key. The first worker to call run_once(key,
+...) takes the key's lock, does the work and publishes the result. Any other
+worker blocks on the same lock, then reads the published result instead of
+repeating the work.
+
+conftest.py points RunState at the run directory from its session-scoped
+_configure_run_state fixture. If RunState was never configured (e.g. a helper
+called outside pytest), run_once simply calls the producer.
+"""
+import json
+import os
+import re
+import threading
+import time
+from filelock import FileLock
+from typing import Any, Callable, Dict, Optional
+from utilities.config import RUN_STATE_LOCK_TIMEOUT
+from utilities.utils import logger
+
+STATE_FILE_NAME = "run_state.json"
+
+
+class RunState:
+    """
+    Singleton wrapper around the run's shared JSON state file.
+
+    Results are also memoised in-process, so repeat calls in the same worker
+    do not touch the filesystem.
+    """
+    _instance: Optional['RunState'] = None
+    _run_dir: Optional[str] = None
+    _worker_id: str = "master"
+    _results: Dict[str, Any] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RunState, cls).__new__(cls)
+        return cls._instance
+
+    def configure(self, run_dir: str, worker_id: str = "master"):
+        """
+        Point the state file at a directory shared by every worker in the run.
+
+        Args:
+            run_dir: Directory shared by all workers of this run.
+            worker_id: xdist worker id ('gw0', ...) or 'master' for serial runs.
+        """
+        os.makedirs(run_dir, exist_ok=True)
+        with self._lock:
+            RunState._run_dir = run_dir
+            RunState._worker_id = worker_id
+            self._results.clear()
+        logger.debug(f"Run state for {worker_id}: {os.path.join(run_dir, STATE_FILE_NAME)}")
+
+    @property
+    def configured(self) -> bool:
+        return self._run_dir is not None
+
+    def run_once(self, key: str, producer: Callable[[], Any]) -> Any:
+        """
+        Run producer once per test run and return its result in every worker.
+
+        The result must be JSON-serialisable. If producer raises, nothing is
+        published and the next worker to ask for the key tries again.
+
+        Args:
+            key: Name of the piece of work (e.g. 'seeded_pool.installations').
+            producer: Does the work and returns the value to publish.
+
+        Returns:
+            Any: The published result, from this worker or the one that ran it.
+
+        Raises:
+            filelock.Timeout: If another worker holds the key for longer than
+                RUN_STATE_LOCK_TIMEOUT seconds.
+        """
+        if key in self._results:
+            return self._results[key]
+        if not self.configured:
+            result = producer()
+            self._results[key] = result
+            return result
+
+        start_time = time.time()
+        with FileLock(self._lock_path(key), timeout=RUN_STATE_LOCK_TIMEOUT):
+            entry = self._read_state().get(key)
+            if entry is not None:
+                logger.info(
+                    f"Reusing '{key}' published by {entry['worker']} "
+                    f"(waited {time.time() - start_time:.2f}s)"
+                )
+                result = entry["value"]
+            else:
+                result = producer()
+                self._publish(key, result)
+                logger.info(f"Published '{key}' for other workers ({time.time() - start_time:.2f}s)")
+
+        self._results[key] = result
+        return result
+
+    def _lock_path(self, key: str) -> str:
+        """Path of the lock file guarding one key."""
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        return os.path.join(self._run_dir, f"{safe_key}.lock")
+
+    def _state_path(self) -> str:
+        return os.path.join(self._run_dir, STATE_FILE_NAME)
+
+    def _read_state(self) -> Dict[str, Any]:
+        """Load the state file, or an empty state if it does not exist yet."""
+        try:
+            with open(self._state_path(), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring unreadable run state file {self._state_path()}: {str(e)}")
+            return {}
+
+    def _publish(self, key: str, value: Any):
+        """Add one key to the state file. Other keys may be published concurrently."""
+        with FileLock(os.path.join(self._run_dir, f"{STATE_FILE_NAME}.lock"), timeout=RUN_STATE_LOCK_TIMEOUT):
+            state = self._read_state()
+            state[key] = {"value": value, "worker": self._worker_id, "published_at": time.time()}
+            temp_path = f"{self._state_path()}.{self._worker_id}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump(state, f, indent=2)
+            # Readers never see a half-written file
+            os.replace(temp_path, self._state_path())
+
+
+def run_once(key: str, producer: Callable[[], Any]) -> Any:
+    """
+    Run producer once per test run, sharing its result across xdist workers.
+
+    This is the main function to use for run-wide setup in fixtures and
+    conftest helpers.
+
+    Args:
+        key: Name of the piece of work.
+        producer: Does the work and returns a JSON-serialisable result.
+
+    Returns:
+        Any: The published result.
+
+    Example:
+        >>> ids = run_once("seeded_pool.devices", lambda: manager.ensure(...))
+    """
+    return RunState().run_once(key, producer)
@@ -9,8 +9,12 @@ rather than content validation, making them robust and maintainable.
 
 import time
 from typing import Callable, Optional
+from utilities.config import SEARCH_SIGNAL_TIMEOUT_MS, SEARCH_SETTLE_MS, UI_POLL_INTERVAL_MS
 from utilities.utils import logger
 
+# Substring of the URL the frontend calls when a search runs (e.g. /api/Installations/search)
+DEFAULT_SEARCH_URL_PATTERN = "/search"
+
 class SimpleSearchMixin:
     """
     Mixin providing robust simple search testing capabilities.
@@ -50,7 +54,8 @@ class SimpleSearchMixin:
             'search_input_getter': Callable,  # Function to get the search input element
             'search_button_getter': Callable,  # Function to get the search button element
             'results_container_getter': Callable,  # Function to get the results container element
-            'results_selector': str  # CSS selector for results in the container
+            'results_selector': str,  # CSS selector for results in the container
+            'search_url_pattern': str  # Optional. URL substring of the search XHR (default '/search')
         }
         
         test_cases format:
@@ -112,8 +117,8 @@ class SimpleSearchMixin:
                 search_config['results_selector'],
                 timeout=10000
             )
-            # Additional stabilization time for any client-side rendering
-            page_object.page.wait_for_timeout(1000)
+            # Let client-side rendering finish adding rows
+            self._wait_for_results_to_settle(page_object, search_config)
             logger.info("Results container is ready with data")
         except Exception as e:
             logger.warning(f"Results container readiness check failed: {str(e)}")
@@ -125,8 +130,7 @@ class SimpleSearchMixin:
         if current_value:
             logger.info(f"Clearing existing search value: '{current_value}'")
             search_input.clear()
-            search_config['search_button_getter']().click()
-            self._wait_for_search_completion(page_object, search_config)
+            self._click_search_and_wait(page_object, search_config)
             
         logger.info("Search baseline established")
         
@@ -152,8 +156,8 @@ class SimpleSearchMixin:
         search_button = search_config['search_button_getter']()
         
         # Clear any existing content and enter the search term
+        # (fill() waits for the input to be editable, so no sleep is needed)
         search_input.clear()
-        page_object.page.wait_for_timeout(500)  # Ensure input is ready
         search_input.fill(search_term)
         
         # Verify the search term was entered correctly
@@ -161,11 +165,8 @@ class SimpleSearchMixin:
         if entered_value != search_term:
             raise Exception(f"Search term entry failed. Expected '{search_term}', got '{entered_value}'")
         
-        # Execute the search
-        search_button.click()
-        
-        # Wait for the search to complete
-        self._wait_for_search_completion(page_object, search_config, baseline_count)
+        # Execute the search and wait for it to complete
+        self._click_search_and_wait(page_object, search_config, baseline_count, search_button)
         
         # Get and return final result count
         final_count = self._get_results_count(search_config)
@@ -173,46 +174,127 @@ class SimpleSearchMixin:
         
         return final_count
 
-    def _wait_for_search_completion(self, page_object, search_config, baseline_count=None):
+    def _click_search_and_wait(self, page_object, search_config, baseline_count=None, search_button=None):
         """
-        Wait for search completion using multi-layered timing strategy.
-        
-        Different web applications implement search differently.
-        - Some make server requests (detected by network activity)
-        - Some filter client-side (determined by DOM changes)
-        - some use debouncing (requires patience)
+        Click the search button and wait for the search to actually finish.
+
+        Two completion signals are raced, and the first one observed wins:
+        1. The search XHR finishing: its response body has been received (or
+           the request failed) for a URL containing search_url_pattern
+        2. The result row count changing from baseline_count (client-side filtering)
+
+        "requestfinished"/"requestfailed" listeners are registered before the
+        click, and a single poll loop checks both signals every
+        UI_POLL_INTERVAL_MS for up to SEARCH_SIGNAL_TIMEOUT_MS. The "response"
+        event is not used because it fires on the headers, before the body has
+        downloaded. When the XHR finishes first and baseline_count is known,
+        the loop keeps polling until the count moves off the baseline, so a
+        table that has not re-rendered yet is not read as the result. The
+        signal, or the timeout, is followed by the settle window.
+
+        Args:
+            page_object: The page object instance.
+            search_config: Search configuration dictionary.
+            baseline_count: Result count before the search, if known.
+            search_button: The search button element, if already located.
         """
-        logger.info("Waiting for search completion")
-        
-        # Layer 1: Network activity (handles server-side searches)
+        if search_button is None:
+            search_button = search_config['search_button_getter']()
+        url_pattern = search_config.get('search_url_pattern', DEFAULT_SEARCH_URL_PATTERN)
+        page = page_object.page
+        start_time = time.time()
+
+        finished_requests = []
+
+        def on_request_done(request):
+            if url_pattern in request.url and request.resource_type in ("xhr", "fetch"):
+                finished_requests.append(request)
+
+        page.on("requestfinished", on_request_done)
+        page.on("requestfailed", on_request_done)
         try:
-            page_object.page.wait_for_load_state("networkidle", timeout=5000)
-        except Exception as e:
-            # Timeout is acceptable - might be client-side search
-            logger.warning(f"Network idle wait failed: {str(e)}")
-            pass
-        
-        # Layer 2: DOM changes (handles client-side filtering)
-        page_object.page.wait_for_timeout(1500) # Generous wait for debounced inputs
-        
-        # Layer 3: Result count change detection (if baseline provided)
-        if baseline_count is not None:
-            try:
-                # Give extra time if results haven't changed yet.
-                current_count = self._get_results_count(search_config)
-                if current_count == baseline_count:
-                    logger.warning("Result count unchanged, waiting loner for search processing")
-                    page_object.page.wait_for_timeout(2000)
-            except Exception as e:
-                logger.warning(f"Result count check failed: {str(e)}")
-                logger.warning("Waiting longer for search processing")
-                page_object.page.wait_for_timeout(2000)
-                
-        # Layer 4: Final stabilization
-        page_object.page.wait_for_timeout(1000)
-        
-        logger.info("Search completion wait finished")
-        
+            search_button.click()
+            signal = self._wait_for_search_signal(page_object, search_config, baseline_count, finished_requests)
+        finally:
+            page.remove_listener("requestfinished", on_request_done)
+            page.remove_listener("requestfailed", on_request_done)
+
+        if signal is None:
+            logger.warning(f"No '{url_pattern}' request finished and no result change within {SEARCH_SIGNAL_TIMEOUT_MS}ms"
+                           " - waiting for the results to settle")
+        self._wait_for_results_to_settle(page_object, search_config)
+        logger.info(f"Search completed on {signal or 'settle'} in {time.time() - start_time:.2f}s")
+
+    def _wait_for_search_signal(self, page_object, search_config, baseline_count, finished_requests):
+        """
+        Poll until the result count differs from baseline_count or a search
+        request has finished, whichever comes first.
+
+        A finished request ends the wait straight away only if baseline_count
+        is None. Otherwise polling continues until the count moves off the
+        baseline or SEARCH_SIGNAL_TIMEOUT_MS has passed, because the body
+        arriving does not mean the table has re-rendered yet.
+
+        Args:
+            page_object: The page object instance.
+            search_config: Search configuration dictionary.
+            baseline_count: Result count before the search, or None to wait for the request only.
+            finished_requests: List the listeners append finished or failed search requests to.
+
+        Returns:
+            str: Description of the signal seen, or None if neither arrived in time.
+        """
+        deadline = time.time() + SEARCH_SIGNAL_TIMEOUT_MS / 1000
+        request_signal = None
+        while True:
+            if request_signal is None and finished_requests:
+                request_signal = self._describe_search_request(finished_requests[0])
+                if baseline_count is None:
+                    return request_signal
+            if baseline_count is not None and self._get_results_count(search_config) != baseline_count:
+                change = f"result count change from {baseline_count}"
+                return f"{request_signal} and {change}" if request_signal else change
+            if time.time() >= deadline:
+                if request_signal:
+                    logger.debug(f"Result count stayed at {baseline_count} after {request_signal}")
+                return request_signal
+            # Waiting through Playwright lets it dispatch the request events meanwhile
+            page_object.page.wait_for_timeout(UI_POLL_INTERVAL_MS)
+
+    def _describe_search_request(self, request):
+        """Describe a finished or failed search request, warning if it did not succeed."""
+        if request.failure:
+            logger.warning(f"Search request failed ({request.failure}): {request.url}")
+            return f"failed request to {request.url}"
+        response = request.response()
+        status = response.status if response is not None else "no response"
+        if response is None or not response.ok:
+            logger.warning(f"Search request returned {status}: {request.url}")
+        return f"response {status} from {request.url}"
+
+    def _wait_for_results_to_settle(self, page_object, search_config):
+        """
+        Poll the result count until it has held steady for SEARCH_SETTLE_MS.
+
+        Gives up after SEARCH_SIGNAL_TIMEOUT_MS and returns the last count seen.
+
+        Returns:
+            int: The settled result count.
+        """
+        deadline = time.time() + SEARCH_SIGNAL_TIMEOUT_MS / 1000
+        last_count = self._get_results_count(search_config)
+        stable_since = time.time()
+        while time.time() < deadline:
+            page_object.page.wait_for_timeout(UI_POLL_INTERVAL_MS)
+            current_count = self._get_results_count(search_config)
+            if current_count != last_count:
+                last_count = current_count
+                stable_since = time.time()
+            elif (time.time() - stable_since) * 1000 >= SEARCH_SETTLE_MS:
+                return current_count
+        logger.warning(f"Result count still changing after {SEARCH_SIGNAL_TIMEOUT_MS}ms (last: {last_count})")
+        return last_count
+
     def _get_results_count(self, search_config):
         """
             Get the current number of search results.
@@ -267,12 +349,9 @@ class SimpleSearchMixin:
         search_input = search_config['search_input_getter']()
         search_input.clear()
         
-        # Execute the clear operations (should show all results)
+        # Execute the clear operations (should show all results) and wait for reset to complete
         search_button = search_config['search_button_getter']()
-        search_button.click()
-        
-        # Wait for reset to complete
-        self._wait_for_search_completion(page_object, search_config)
+        self._click_search_and_wait(page_object, search_config, search_button=search_button)
         
         # Verify the search input is actually empty
         remaining_value = search_input.input_value()
@@ -280,7 +359,6 @@ class SimpleSearchMixin:
             logger.warning(f"Search input still contains '{remaining_value}' after reset")
             # Try one more time
             search_input.clear()
-            page_object.page.wait_for_timeout(500)
-            search_button.click()
+            self._click_search_and_wait(page_object, search_config, search_button=search_button)
             
         logger.info("Search state reset complete")
\ No newline at end of file
@@ -0,0 +1,188 @@
+# seeded_dataset.py
+"""
+Persistent pool of pagination records kept in QA across runs.
+
+Pagination tests only need "more than one page" of rows. Creating and deleting
+PAGE_SIZE + 2 records per test was the largest block of write traffic in a UI
+run, so each entity type instead keeps a stable pool of records named
+
+    AUTOSEED_PAGINATION_000, AUTOSEED_PAGINATION_001, ...
+
+The first time a process asks for a pool, SeededDatasetManager checks it with a
+single search call. It creates only the indexes that are missing (through
+utilities/bulk_seeding.py) and caches the IDs for the rest of the session. Pool
+records are never deleted. The AUTOSEED_ prefix is deliberately different from
+the AUTOTEST_ prefix that cleanup_orphaned_test_records in conftest.py removes.
+"""
+import re
+import threading
+import requests
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from utilities.bulk_seeding import bulk_create_records
+from utilities.config import SEEDED_POOL_SIZE
+from utilities.http_session import get_session
+from utilities.utils import logger
+
+SEEDED_NAME_PREFIX = "AUTOSEED_PAGINATION_"
+SEEDED_NAME_PATTERN = re.compile(rf"^{SEEDED_NAME_PREFIX}(\d{{3}})$")
+
+
+def seeded_record_name(index: int) -> str:
+    """
+    Build the stable name of a pool record.
+
+    Args:
+        index: Position of the record in the pool.
+
+    Returns:
+        str: e.g. 'AUTOSEED_PAGINATION_007'
+    """
+    return f"{SEEDED_NAME_PREFIX}{index:03d}"
+
+
+@dataclass
+class PoolHealth:
+    """
+    What a single search call found for one entity's pool.
+
+    Attributes:
+        entity_name: Human-readable entity name from the configuration.
+        target_size: Number of records the pool should hold.
+        records: Pool index -> record ID for every pool record found.
+        duplicates: Names that were found more than once (extra copies are ignored).
+        error: Description of why the pool could not be read, or None.
+    """
+    entity_name: str
+    target_size: int
+    records: Dict[int, str] = field(default_factory=dict)
+    duplicates: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def missing_indexes(self) -> List[int]:
+        """Pool indexes below target_size with no record in QA."""
+        return [index for index in range(self.target_size) if index not in self.records]
+
+    @property
+    def healthy(self) -> bool:
+        return self.error is None and not self.missing_indexes
+
+
+class SeededDatasetManager:
+    """
+    Singleton that verifies, tops up and caches the seeded pagination pools.
+
+    Pools are cached per entity type for the life of the process (one xdist
+    worker), so the search call and any top-up happen once per session.
+    """
+    _instance: Optional['SeededDatasetManager'] = None
+    _pools: Dict[str, List[str]] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SeededDatasetManager, cls).__new__(cls)
+        return cls._instance
+
+    def inspect(self, config: Dict[str, Any], headers: Dict[str, str],
+                target_size: int = SEEDED_POOL_SIZE) -> PoolHealth:
+        """
+        Read the pool for one entity with a single request.
+
+        Uses the entity's search endpoint with the pool prefix as the name
+        filter when the configuration has one, otherwise its list endpoint.
+
+        Args:
+            config: Entry from TEST_ENTITY_CONFIGURATIONS.
+            headers: Headers for the API call.
+            target_size: Number of records the pool should hold.
+
+        Returns:
+            PoolHealth: The pool records found and any problems.
+        """
+        health = PoolHealth(entity_name=config["entity_name"], target_size=target_size)
+        endpoint = config.get("search_endpoint") or config["list_endpoint"]
+        params = {"pageNumber": 1, "pageSize": 500}
+        if config.get("search_endpoint"):
+            params["name"] = SEEDED_NAME_PREFIX
+
+        try:
+            response = get_session().get(endpoint, params=params, headers=headers)
+            if response.status_code != 200:
+                health.error = f"{endpoint} returned {response.status_code}"
+                return health
+            data = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            health.error = f"Could not read {endpoint}: {str(e)}"
+            return health
+
+        # /search returns a ResponseDto wrapper, most basic lists a plain array
+        records = data.get("results", []) if isinstance(data, dict) else data
+        for record in records or []:
+            if not isinstance(record, dict):
+                continue
+            match = SEEDED_NAME_PATTERN.match(record.get(config["name_field"]) or "")
+            if not match:
+                continue
+            index = int(match.group(1))
+            if index in health.records:
+                health.duplicates.append(match.group(0))
+            else:
+                health.records[index] = record.get(config["id_field"])
+        return health
+
+    def ensure(self, entity_type: str, config: Dict[str, Any], headers: Dict[str, str],
+               payload_builder: Callable[[int], Tuple[str, Dict[str, Any]]],
+               target_size: int = SEEDED_POOL_SIZE) -> List[str]:
+        """
+        Return the pool's record IDs, creating any missing records first.
+
+        Args:
+            entity_type: Key from TEST_ENTITY_CONFIGURATIONS, used as the cache key.
+            config: Entry from TEST_ENTITY_CONFIGURATIONS.
+            headers: Headers for the API calls.
+            payload_builder: Called with a pool index, returns (record_id, payload)
+                for a record named seeded_record_name(index).
+            target_size: Number of records the pool should hold.
+
+        Returns:
+            List[str]: IDs of the pool records that exist, in pool order. Empty
+                if the pool could not be read.
+        """
+        with self._lock:
+            cached = self._pools.get(entity_type)
+            if cached is not None and len(cached) >= target_size:
+                return cached
+
+            health = self.inspect(config, headers, target_size)
+            if health.error:
+                # Topping up without knowing what exists would create duplicates
+                logger.error(f"Seeded {health.entity_name} pool unavailable: {health.error}")
+                return []
+            if health.duplicates:
+                logger.warning(
+                    f"Seeded {health.entity_name} pool has {len(health.duplicates)} duplicate record(s): "
+                    f"{', '.join(sorted(set(health.duplicates)))}"
+                )
+
+            missing = health.missing_indexes
+            logger.info(
+                f"Seeded {health.entity_name} pool: {len(health.records)} record(s) found, "
+                f"{target_size} wanted, {len(missing)} to create"
+            )
+            if missing:
+                records = [payload_builder(index) for index in missing]
+                report = bulk_create_records(config, records, headers)
+                for index, outcome in zip(missing, report.outcomes):
+                    if outcome.ok:
+                        health.records[index] = outcome.record_id
+
+            pool_ids = [health.records[index] for index in sorted(health.records)]
+            self._pools[entity_type] = pool_ids
+            return pool_ids
+
+    def clear(self):
+        """Forget the cached pools so the next ensure() re-checks QA."""
+        with self._lock:
+            self._pools.clear()
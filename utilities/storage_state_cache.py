@@ -0,0 +1,199 @@
+# storage_state_cache.py
+"""
+On-disk cache of logged-in browser storage states, shared across test runs.
+
+auth_states in conftest.py used to log in through the UI once per browser at
+the start of every session, and every xdist worker repeated that login. Now the
+captured context.storage_state() is written to one JSON file per
+(environment URL, username, browser type) under STORAGE_STATE_CACHE_DIR:
+
+    .auth_cache/chromium_3f2a9c1d7e4b.json
+
+On load, the state's expiry is worked out from what it contains: the "exp"
+claim of any JWT in a cookie or in localStorage, and the expiry of every
+persistent cookie. A state that expires within
+STORAGE_STATE_MIN_VALIDITY_SECONDS is treated as stale, and the UI login runs
+again. If no expiry can be found at all, the state is kept for
+STORAGE_STATE_MAX_AGE_SECONDS after it was saved.
+
+Each cache file has its own filelock.FileLock. Concurrent workers therefore
+perform at most one login per key; the others wait and read the new file.
+
+The files hold live session tokens. They are written with owner-only
+permissions, and the cache directory is git-ignored.
+"""
+import hashlib
+import json
+import os
+import time
+from filelock import FileLock
+from typing import Any, Callable, Dict, Iterable, Optional
+from utilities.auth import decode_token_expiry
+from utilities.config import (
+    STORAGE_STATE_CACHE_DIR,
+    STORAGE_STATE_LOCK_TIMEOUT,
+    STORAGE_STATE_MAX_AGE_SECONDS,
+    STORAGE_STATE_MIN_VALIDITY_SECONDS,
+)
+from utilities.utils import logger
+
+
+def cache_path(env_url: str, username: str, browser_type: str,
+               cache_dir: str = STORAGE_STATE_CACHE_DIR) -> str:
+    """
+    Path of the cache file for one environment, user and browser.
+
+    The username is hashed into the file name rather than written out.
+
+    Returns:
+        str: e.g. '<cache_dir>/chromium_3f2a9c1d7e4b.json'
+    """
+    digest = hashlib.sha256(f"{env_url}|{username}".encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{browser_type}_{digest}.json")
+
+
+def _jwt_expiries(value: Any) -> Iterable[float]:
+    """Expiry of every JWT found in a string, or in the string values of a JSON object or list."""
+    if isinstance(value, str):
+        if value.count(".") == 2:
+            expiry = decode_token_expiry(value)
+            if expiry is not None:
+                yield expiry
+                return
+        if value[:1] in ("{", "["):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                return
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, (str, dict, list)):
+                yield from _jwt_expiries(item)
+
+
+def storage_state_expiry(storage_state: Dict[str, Any]) -> Optional[float]:
+    """
+    Earliest expiry found in a Playwright storage state.
+
+    Looks at JWT "exp" claims in cookie and localStorage values, and at the
+    expiry of persistent cookies (session cookies have expires == -1).
+
+    Args:
+        storage_state: Result of BrowserContext.storage_state().
+
+    Returns:
+        Optional[float]: Unix timestamp, or None if nothing in the state expires.
+    """
+    expiries = []
+    for cookie in storage_state.get("cookies", []):
+        if cookie.get("expires", -1) > 0:
+            expiries.append(float(cookie["expires"]))
+        expiries.extend(_jwt_expiries(cookie.get("value")))
+    for origin in storage_state.get("origins", []):
+        for item in origin.get("localStorage", []):
+            expiries.extend(_jwt_expiries(item.get("value")))
+    return min(expiries) if expiries else None
+
+
+def load_storage_state(env_url: str, username: str, browser_type: str,
+                       min_validity: float = STORAGE_STATE_MIN_VALIDITY_SECONDS) -> Optional[Dict[str, Any]]:
+    """
+    Read a cached storage state if it is still valid for at least min_validity seconds.
+
+    Args:
+        env_url: Web portal base URL the state was captured on.
+        username: User the state was captured for.
+        browser_type: 'chromium', 'firefox' or 'webkit'.
+        min_validity: Seconds the state must remain valid for.
+
+    Returns:
+        Optional[Dict[str, Any]]: The storage state, or None if missing or stale.
+    """
+    path = cache_path(env_url, username, browser_type)
+    try:
+        with open(path, "r") as f:
+            entry = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable storage state cache {path}: {str(e)}")
+        return None
+
+    if (entry.get("env_url"), entry.get("username"), entry.get("browser_type")) != (env_url, username, browser_type):
+        logger.info(f"Storage state cache {path} belongs to a different environment or user")
+        return None
+
+    remaining = entry["expires_at"] - time.time()
+    if remaining < min_validity:
+        logger.info(f"Cached {browser_type} storage state expires in {remaining:.0f}s - logging in again")
+        return None
+    logger.info(f"Using cached {browser_type} storage state for {username} (valid for another {remaining:.0f}s)")
+    return entry["storage_state"]
+
+
+def save_storage_state(env_url: str, username: str, browser_type: str, storage_state: Dict[str, Any]):
+    """
+    Write a storage state to the cache with owner-only permissions.
+
+    Args:
+        env_url: Web portal base URL the state was captured on.
+        username: User the state was captured for.
+        browser_type: 'chromium', 'firefox' or 'webkit'.
+        storage_state: Result of BrowserContext.storage_state().
+    """
+    path = cache_path(env_url, username, browser_type)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    saved_at = time.time()
+    expires_at = storage_state_expiry(storage_state) or saved_at + STORAGE_STATE_MAX_AGE_SECONDS
+    entry = {
+        "env_url": env_url,
+        "username": username,
+        "browser_type": browser_type,
+        "saved_at": saved_at,
+        "expires_at": expires_at,
+        "storage_state": storage_state,
+    }
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(entry, f)
+    # Readers never see a half-written file
+    os.replace(temp_path, path)
+    logger.info(f"Cached {browser_type} storage state for {username} until {time.ctime(expires_at)}")
+
+
+def get_storage_state(env_url: str, username: str, browser_type: str,
+                      login: Callable[[], Dict[str, Any]], refresh: bool = False) -> Dict[str, Any]:
+    """
+    Return a valid storage state, logging in through login() only when needed.
+
+    This is the main function to use from fixtures. The whole check-login-save
+    sequence runs under the cache file's lock, so concurrent xdist workers log
+    in at most once per key.
+
+    Args:
+        env_url: Web portal base URL.
+        username: User to log in as.
+        browser_type: 'chromium', 'firefox' or 'webkit'.
+        login: Performs the UI login and returns context.storage_state().
+        refresh: Ignore any cached state and log in again (the new state is cached).
+
+    Returns:
+        Dict[str, Any]: Storage state to pass to browser.new_context(storage_state=...).
+
+    Example:
+        >>> state = get_storage_state(QA_WEB_BASE_URL, username, "chromium",
+        ...                           login=lambda: capture_auth_state(browser))
+    """
+    path = cache_path(env_url, username, browser_type)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with FileLock(f"{path}.lock", timeout=STORAGE_STATE_LOCK_TIMEOUT):
+        if not refresh:
+            storage_state = load_storage_state(env_url, username, browser_type)
+            if storage_state is not None:
+                return storage_state
+        storage_state = login()
+        save_storage_state(env_url, username, browser_type, storage_state)
+        return storage_state
@@ -1,11 +1,81 @@
 #utils.py
 import os
+import re
+import json
+import time
+import atexit
+import itertools
 import logging
+import logging.handlers
+import queue
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from threading import Lock
-from .config import LOG_DIR, LOG_LEVEL_FILE, LOG_LEVEL_CONSOLE, LOG_LEVEL_OVERALL
+from threading import Lock, local
+from typing import Dict, List, Optional
+from .config import (
+    LOG_DIR, LOG_LEVEL_FILE, LOG_LEVEL_CONSOLE, LOG_LEVEL_OVERALL,
+    LOG_CAPTURE_MAX_LINES, LOG_CAPTURE_MAX_BYTES, LOG_CAPTURE_SPILL, LOG_CAPTURE_DIR
+)
 from colorlog import ColoredFormatter
 
+
+@dataclass
+class LogCaptureStats:
+    """
+    Memory used by HTMLReportLogger captures in this process.
+
+    Sizes are message characters (the %-args of a lazily formatted message
+    are not counted), a close estimate of the text a capture will produce.
+
+    Attributes:
+        held_captures: Captures still in memory.
+        held_lines: Lines in those captures.
+        held_bytes: Size of those lines.
+        peak_bytes: Largest held_bytes seen at a capture start or release.
+        dropped_lines: Lines pushed out of a ring buffer by the caps, over all captures.
+        released: Captures freed by release_test_logs().
+        spilled: Released captures written to LOG_CAPTURE_DIR.
+        max_lines: Line cap per capture and logging thread.
+        max_bytes: Size cap per capture and logging thread.
+    """
+    held_captures: int = 0
+    held_lines: int = 0
+    held_bytes: int = 0
+    peak_bytes: int = 0
+    dropped_lines: int = 0
+    released: int = 0
+    spilled: int = 0
+    max_lines: int = 0
+    max_bytes: int = 0
+
+
+class _RingBuffer:
+    """
+    One thread's entries for one capture, keeping the newest lines within the caps.
+
+    Only the owning thread appends. Readers copy the deque, which is atomic
+    under the GIL.
+    """
+    __slots__ = ("entries", "bytes", "dropped", "max_lines", "max_bytes")
+
+    def __init__(self, max_lines: int, max_bytes: int):
+        self.entries = deque()
+        self.bytes = 0
+        self.dropped = 0
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+
+    def append(self, entry: tuple):
+        """Add (sequence, level, message, args, size) and drop the oldest entries over a cap."""
+        entries = self.entries
+        entries.append(entry)
+        self.bytes += entry[4]
+        while len(entries) > self.max_lines or (self.bytes > self.max_bytes and len(entries) > 1):
+            self.bytes -= entries.popleft()[4]
+            self.dropped += 1
+
+
 class HTMLReportLogger:
     """
     A thread-safe logger for capturing test-specific logs for HTML reporting.
@@ -13,22 +83,47 @@ class HTMLReportLogger:
     This class allows for the capture, retrieval, and management of logs
     on a per-test basis, making it suitable for use in concurrent testing
     environments where logs need to be associated with specific tests.
+
+    Each thread appends to its own buffer for the current capture, so logging
+    takes no lock: the lock is only taken when a thread logs for the first
+    time in a capture, to register its buffer. Entries keep the unformatted
+    message and args; they are formatted in get_logs_for_test(), and ordered
+    across threads by a process-wide sequence number.
+
+    The buffers are ring buffers capped at max_lines lines and max_bytes
+    message characters per thread; once full, the oldest lines are dropped.
+    A capture stays in memory until release_test_logs() frees it, optionally
+    writing it to a file in LOG_CAPTURE_DIR first. stats() reports the memory
+    held.
     """
     
-    def __init__(self):
+    def __init__(self, max_lines: int = LOG_CAPTURE_MAX_LINES, max_bytes: int = LOG_CAPTURE_MAX_BYTES):
         """
         Initialize the HTMLReportLogger.
 
         Sets up the necessary data structures for log management and
         ensures thread-safety through the use of a lock:
-        - test_logs: A dictionary to store logs for each test.
+        - test_logs: A dictionary mapping each test to its per-thread ring buffers.
         - current_test: A variable to track the currently running test.
-        - lock: A threading Lock to ensure thread-safety in concurrent environments.
+        - lock: A threading Lock guarding test_logs (not the buffers themselves).
+
+        Args:
+            max_lines (int): Lines kept per test and logging thread.
+            max_bytes (int): Message characters kept per test and logging thread.
         """
-        self.test_logs = {}
+        self.test_logs: Dict[str, List[_RingBuffer]] = {}
         self.current_test = None
         self.lock = Lock()
         self.context = None
+        self.max_lines = max(1, max_lines)
+        self.max_bytes = max(1, max_bytes)
+        # Identifies the current capture, so a thread never appends to a buffer of an earlier one
+        self._capture = None
+        self._thread = local()
+        self._sequence = itertools.count()
+        # Released captures that were written to disk: test name -> file
+        self._spill_files: Dict[str, str] = {}
+        self._stats = LogCaptureStats(max_lines=self.max_lines, max_bytes=self.max_bytes)
         
     def set_context(self, context):
         self.context = context
@@ -44,8 +139,11 @@ class HTMLReportLogger:
             test_name (str): The name of the test for which to start capturing logs.
         """
         with self.lock:
-            self.current_test = test_name
+            self._update_peak()
             self.test_logs[test_name] = []
+            self._spill_files.pop(test_name, None)
+            self._capture = object()
+            self.current_test = test_name
     
     def end_test_capture(self, test_name):
         """
@@ -53,19 +151,23 @@ class HTMLReportLogger:
 
         This method should be called at the end of each test. It resets the
         current test to None, indicating that no test is currently running.
+        The captured lines stay available until release_test_logs().
 
         Args:
             test_name (str): The name of the test for which to end capturing logs.
         """
         with self.lock:
             self.current_test = None
+            self._capture = None
             
     def get_logs_for_test(self, test_name):
         """
         Retrieve the logs for a specific test.
 
         This method returns all captured logs for the specified test as a single string,
-        with each log entry separated by a newline.
+        with each log entry separated by a newline. Lines dropped by the ring
+        buffer caps are noted on the first line. After release_test_logs(), the
+        spill file is read if the capture was spilled.
 
         Args:
             test_name (str): The name of the test for which to retrieve logs.
@@ -75,9 +177,87 @@ class HTMLReportLogger:
                 or an empty string if no logs are found.
         """
         with self.lock:
-            return "\n".join(self.test_logs.get(test_name,[]))
+            buffers = self.test_logs.get(test_name)
+            spill_file = self._spill_files.get(test_name)
+            buffers = list(buffers) if buffers is not None else None
+        if buffers is not None:
+            return self._format(buffers)
+        if spill_file:
+            try:
+                with open(spill_file, "r", encoding="utf-8") as f:
+                    return f.read()
+            except OSError:
+                return ""
+        return ""
+
+    def release_test_logs(self, test_name, spill: bool = LOG_CAPTURE_SPILL) -> Optional[str]:
+        """
+        Free a test's capture once it has been consumed.
+
+        Args:
+            test_name (str): The name of the test whose logs to release.
+            spill (bool): Write the logs to a file in LOG_CAPTURE_DIR first.
+
+        Returns:
+            str: The spill file, or None if nothing was written.
+        """
+        with self.lock:
+            self._update_peak()
+            buffers = self.test_logs.pop(test_name, None)
+            if buffers is None:
+                return None
+            if test_name == self.current_test:
+                self.current_test = None
+                self._capture = None
+            self._stats.released += 1
+            self._stats.dropped_lines += sum(buffer.dropped for buffer in buffers)
+            sequence = next(self._sequence)
+        if not spill or not any(buffer.entries for buffer in buffers):
+            return None
+
+        os.makedirs(LOG_CAPTURE_DIR, exist_ok=True)
+        safe_name = re.sub(r"[^\w.-]+", "_", test_name)[:150]
+        spill_file = os.path.join(LOG_CAPTURE_DIR, f"{safe_name}-{os.getpid()}-{sequence}.log")
+        with open(spill_file, "w", encoding="utf-8") as f:
+            f.write(self._format(buffers))
+        with self.lock:
+            self._spill_files[test_name] = spill_file
+            self._stats.spilled += 1
+        return spill_file
+
+    def stats(self) -> LogCaptureStats:
+        """Memory held by the captures now, and totals since the process started."""
+        with self.lock:
+            buffers = [buffer for test_buffers in self.test_logs.values() for buffer in test_buffers]
+            held_bytes = sum(buffer.bytes for buffer in buffers)
+            self._stats.peak_bytes = max(self._stats.peak_bytes, held_bytes)
+            return LogCaptureStats(
+                held_captures=len(self.test_logs),
+                held_lines=sum(len(buffer.entries) for buffer in buffers),
+                held_bytes=held_bytes,
+                peak_bytes=self._stats.peak_bytes,
+                dropped_lines=self._stats.dropped_lines + sum(buffer.dropped for buffer in buffers),
+                released=self._stats.released,
+                spilled=self._stats.spilled,
+                max_lines=self.max_lines,
+                max_bytes=self.max_bytes,
+            )
+
+    def _update_peak(self):
+        """Record the bytes held now in peak_bytes. Called with the lock held."""
+        held_bytes = sum(buffer.bytes for test_buffers in self.test_logs.values() for buffer in test_buffers)
+        self._stats.peak_bytes = max(self._stats.peak_bytes, held_bytes)
+
+    def _format(self, buffers: List[_RingBuffer]) -> str:
+        entries = sorted(entry for buffer in buffers for entry in buffer.entries.copy())
+        lines = [f"{level}: {_format_message(message, args)}" for _, level, message, args, _ in entries]
+        dropped = sum(buffer.dropped for buffer in buffers)
+        if dropped:
+            lines.insert(0, f"... {dropped} earlier line(s) dropped (capture keeps {self.max_lines} lines / "
+                            f"{self.max_bytes} characters per thread)")
+        return "\n".join(lines)
     
-    def log(self, level, message):
+    def log(self, level, message, args=None):
         """
         Add a log entry for the current test.
 
@@ -86,11 +266,34 @@ class HTMLReportLogger:
 
         Args:
             level (str): The log level (e.g., 'INFO', 'WARNING', 'ERROR').
-            message (str): The log message to be recorded.
+            message (str): The log message to be recorded, or a %-format string.
+            args (tuple, optional): Arguments merged into message when the logs are read.
         """
-        with self.lock:
-            if self.current_test:
-                self.test_logs[self.current_test].append(f"{level}: {message}")
+        capture = self._capture
+        if capture is None:
+            return
+        thread = self._thread
+        if getattr(thread, "capture", None) is not capture:
+            with self.lock:
+                if capture is not self._capture:
+                    return
+                thread.capture = capture
+                thread.buffer = _RingBuffer(self.max_lines, self.max_bytes)
+                self.test_logs[self.current_test].append(thread.buffer)
+        size = len(message) if isinstance(message, str) else 0
+        thread.buffer.append((next(self._sequence), level, message, args, size))
+
+
+def _format_message(message, args) -> str:
+    """Merge args into a log message the way LogRecord.getMessage() does."""
+    message = str(message)
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            message = f"{message} {args}"
+    return message
+
                 
 class CustomLogger(logging.Logger):
     """
@@ -128,32 +331,83 @@ class CustomLogger(logging.Logger):
         super().__init__(name, level)
         self.html_logger = HTMLReportLogger()
         
-    def log(self, level, msg, args, exc_info=None, extra=None, stack_info=False):
+    def handle(self, record):
         """
-        Log a message with the specified level and additional context.
+        Pass a record to the HTML report logger and then to the handlers.
 
-        This method extends the standard logging functionality by also logging
-        the message to the HTML report logger.
+        Every logging call that passes the logger's level (debug(), info(),
+        ..., log()) ends up here. Calls below the level are dropped by the
+        standard isEnabledFor() check before a record is even created. The
+        message is not formatted here: the HTML report logger stores msg and
+        args, and the handlers format the record on the queue listener thread.
 
         Args:
-            level (int): The logging level (e.g., logging.INFO, logging.ERROR).
-            msg (str): The message format string.
-            args (tuple): Arguments to merge into msg.
-            exc_info (tuple, optional): Exception information to be added to the log.
-                Can be an exception tuple or a boolean. Defaults to None.
-            extra (dict, optional): A dictionary of additional attributes to add to the log record.
-                Defaults to None.
-            stack_info (bool, optional): If True, stack information is added to the log.
-                Defaults to False.
-
-        Note:
-            This method first calls the standard logging method and then logs
-            the message to the HTML report logger.
+            record (logging.LogRecord): The record to handle.
         """
-        super().log(level, msg, args, exc_info, extra, stack_info)
-        level_name = logging.getLevelName(level)
-        formatted_msg = msg % args if args else msg
-        self.html_logger.log(level_name, formatted_msg)
+        self.html_logger.log(record.levelname, record.msg, record.args)
+        super().handle(record)
+
+
+class LogContextFilter(logging.Filter):
+    """
+    Stamps each record with the process's current log context (see
+    set_log_context) for the JSON-lines sink: worker, nodeid, browser_type
+    and elapsed_ms since the test started.
+
+    Added to the queue handler, so it runs in the logging thread, while the
+    test the record belongs to is still the current one.
+    """
+
+    def filter(self, record):
+        context = _log_context
+        record.worker = context["worker"]
+        record.nodeid = context["nodeid"]
+        record.browser_type = context["browser_type"]
+        record.elapsed_ms = round((record.created - context["started"]) * 1000, 1)
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats a record stamped by LogContextFilter as one JSON object per line."""
+
+    def format(self, record):
+        entry = {
+            "ts": record.created,
+            "time": f"{self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}.{int(record.msecs):03d}",
+            "level": record.levelname,
+            "worker": getattr(record, "worker", None),
+            "nodeid": getattr(record, "nodeid", None),
+            "browser_type": getattr(record, "browser_type", None),
+            "elapsed_ms": getattr(record, "elapsed_ms", None),
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that puts records on the queue as they are.
+
+    The standard QueueHandler formats every record in the logging thread so
+    it can be pickled. The queue here never leaves the process, so the
+    formatting is left to the handlers on the listener thread. As with any
+    deferred formatting, %-style args are read when the record is written,
+    not when it was logged.
+    """
+
+    def prepare(self, record):
+        return record
+
+# Background writer for the file and console handlers, see setup_logging()
+log_queue = queue.SimpleQueue()
+log_listener = None
+log_queue_handler = None
+# Current test of this process for the JSON-lines sink; replaced as a whole by set_log_context()
+_log_context = {"worker": "master", "nodeid": None, "browser_type": None, "started": time.time()}
 
 # Set Up logging
 def setup_logging():
@@ -167,6 +421,8 @@ def setup_logging():
     4. Sets up both file and console logging handlers.
     5. Configures formatters for log messages, including colored output for console.
     6. Sets the logging level to DEBUG for comprehensive logging.
+    7. Puts the handlers behind a queue: the logger only enqueues records,
+       and a QueueListener thread formats and writes them.
 
     The log messages will have the following format:
     "timestamp - logger_name - log_level - message"
@@ -179,7 +435,11 @@ def setup_logging():
     Note:
         This function uses a global LOG_DIR variable to determine where log files should be stored.
         Ensure this variable is properly set before calling this function.
+
+        Records still on the queue are written by flush_logging(), which
+        conftest.py calls at the end of the session, and at interpreter exit.
     """
+    global log_listener, log_queue_handler
     # Ensure the directory exists
     os.makedirs(LOG_DIR, exist_ok=True)
     
@@ -222,9 +482,12 @@ def setup_logging():
     console_handler.setFormatter(color_formatter)
     file_handler.setFormatter(formatter)
     
-    # Add handlers to Logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Add handlers to the listener thread; the logger itself only enqueues
+    log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    log_queue_handler = DeferredQueueHandler(log_queue)
+    logger.addHandler(log_queue_handler)
     
     logger.info(f"Logging initialized. Log file: {log_file}, Log Levels: Console {logging.getLevelName(LOG_LEVEL_CONSOLE)}, File {logging.getLevelName(LOG_LEVEL_FILE)}")
     
@@ -233,6 +496,56 @@ def setup_logging():
 # Create Global logger instance
 logger = setup_logging()
 
+def flush_logging():
+    """
+    Write every queued record before returning.
+
+    The listener is stopped (which drains the queue) and started again, so
+    logging keeps working afterwards.
+    """
+    if log_listener is not None:
+        log_listener.stop()
+        log_listener.start()
+
+def enable_jsonl_sink(directory, worker_id):
+    """
+    Also write every record to <directory>/<worker_id>.jsonl, one JSON object
+    per line, with the worker ID, test nodeid, browser type and milliseconds
+    since the test started (see LogContextFilter and JsonLinesFormatter).
+
+    Called once per process for --log-jsonl; every xdist worker writes its own
+    file in the run's directory. merge_logs.py merges them into one stream.
+
+    Args:
+        directory (str): The run's JSON-lines directory, shared by all workers.
+        worker_id (str): 'master' or the xdist worker ID ('gw0', ...).
+
+    Returns:
+        str: Path of this process's file.
+    """
+    global _log_context
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{worker_id}.jsonl")
+    handler = logging.FileHandler(path, encoding="utf-8")
+    handler.setLevel(LOG_LEVEL_FILE)
+    handler.setFormatter(JsonLinesFormatter())
+    _log_context = dict(_log_context, worker=worker_id)
+    log_queue_handler.addFilter(LogContextFilter())
+    log_listener.handlers = log_listener.handlers + (handler,)
+    logger.info(f"JSON-lines log sink: {path}")
+    return path
+
+def set_log_context(nodeid=None, browser_type=None):
+    """
+    Set the test that following records belong to, and restart elapsed_ms.
+
+    Args:
+        nodeid (str, optional): The running test's nodeid, or None between tests.
+        browser_type (str, optional): Browser(s) the test runs in, if it uses one.
+    """
+    global _log_context
+    _log_context = dict(_log_context, nodeid=nodeid, browser_type=browser_type, started=time.time())
+
 def start_test_capture(test_name):
     """_summary_
 
@@ -260,6 +573,27 @@ def get_logs_for_test(test_name):
     """
     return logger.html_logger.get_logs_for_test(test_name)
 
+def release_test_logs(test_name):
+    """
+    Free a test's captured logs (see HTMLReportLogger.release_test_logs).
+
+    Args:
+        test_name (str): The capture name passed to start_test_capture.
+
+    Returns:
+        str: The spill file if LOG_CAPTURE_SPILL is on, otherwise None.
+    """
+    return logger.html_logger.release_test_logs(test_name)
+
+def get_log_capture_stats():
+    """
+    Memory used by the per-test log captures in this process.
+
+    Returns:
+        LogCaptureStats: Current and peak usage, dropped, released and spilled counts.
+    """
+    return logger.html_logger.stats()
+
 def get_browser_name(page):
     """Safely get browser name from a Playwright page object."""
     try: